@@ -19,8 +19,9 @@ from gear import setup_aiohttp_session, \
     new_csrf_token, check_csrf_token
 from web_common import setup_aiohttp_jinja2, setup_common_static_routes, base_context
 
-from .constants import BUCKET
+from .constants import BUCKET, GITHUB_CACHE_SIZE
 from .github import Repo, FQBranch, WatchedBranch, UnwatchedBranch
+from .utils import LRUCache
 
 with open(os.environ.get('HAIL_CI_OAUTH_TOKEN', 'oauth-token/oauth-token'), 'r') as f:
     oauth_token = f.read().strip()
@@ -306,16 +307,23 @@ async def batch_callback(request):
     return web.Response(status=200)
 
 
+async def update_watched_branch(app, wb):
+    try:
+        log.info(f'updating {wb.branch.short_str()}')
+        await wb.update(app)
+    except concurrent.futures.CancelledError:
+        raise
+    except Exception:  # pylint: disable=broad-except
+        log.exception(f'{wb.branch.short_str()} update failed due to exception')
+
+
 async def update_loop(app):
     while True:
-        try:
-            for wb in watched_branches:
-                log.info(f'updating {wb.branch.short_str()}')
-                await wb.update(app)
-        except concurrent.futures.CancelledError:
-            raise
-        except Exception:  # pylint: disable=broad-except
-            log.exception(f'{wb.branch.short_str()} update failed due to exception')
+        # GitHub requests are conditional on the ETags of the cached
+        # responses, so unchanged PRs cost little of the rate limit.
+        # Branches of the same repo share a checkout and are updated one
+        # at a time; see WatchedBranch._update
+        await asyncio.gather(*[update_watched_branch(app, wb) for wb in watched_branches])
         await asyncio.sleep(300)
 
 
@@ -324,7 +332,8 @@ async def on_startup(app):
         raise_for_status=True,
         timeout=aiohttp.ClientTimeout(total=60))
     app['client_session'] = session
-    app['github_client'] = gh_aiohttp.GitHubAPI(session, 'ci', oauth_token=oauth_token)
+    app['github_client'] = gh_aiohttp.GitHubAPI(session, 'ci', oauth_token=oauth_token,
+                                                cache=LRUCache(GITHUB_CACHE_SIZE))
     app['batch_client'] = await BatchClient(session=session)
 
     with open('/ci-user-secret/sql-config.json', 'r') as f:
@@ -2,6 +2,13 @@ from hailtop.auth import get_userinfo
 
 GITHUB_CLONE_URL = 'https://github.com/'
 
+# number of GitHub responses kept to make conditional requests
+GITHUB_CACHE_SIZE = 1000
+
+# maximum number of concurrent GitHub, batch or database requests made while
+# updating a watched branch
+UPDATE_PARALLELISM = 16
+
 userinfo = get_userinfo()
 BUCKET = f'gs://{userinfo["bucket_name"]}'
 
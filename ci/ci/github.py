@@ -1,18 +1,25 @@
 import secrets
+import collections
 from shlex import quote as shq
 import json
 import logging
 import asyncio
 import concurrent.futures
+import functools
 import aiohttp
 import gidgethub
-from .constants import GITHUB_CLONE_URL, AUTHORIZED_USERS
+from hailtop.utils import bounded_gather
+from .constants import GITHUB_CLONE_URL, AUTHORIZED_USERS, UPDATE_PARALLELISM
 from .environment import SELF_HOSTNAME
 from .utils import check_shell, check_shell_output
 from .build import BuildConfiguration, Code
 
 repos_lock = asyncio.Lock()
 
+# watched branches of the same repo share its repo_dir, so their updates
+# are serialized
+repo_update_locks = collections.defaultdict(asyncio.Lock)
+
 log = logging.getLogger('ci')
 
 
@@ -141,6 +148,9 @@ class PR(Code):
         self.batch = None
         self.source_sha_failed = None
 
+        # authorized shas are never removed, so a positive check is kept
+        self._authorized_sha = None
+
         # error, success, failure
         self._build_state = None
 
@@ -161,10 +171,16 @@ class PR(Code):
         if self.author in AUTHORIZED_USERS:
             return True
 
+        source_sha = self.source_sha
+        if self._authorized_sha == source_sha:
+            return True
+
         async with dbpool.acquire() as conn:
             async with conn.cursor() as cursor:
-                await cursor.execute('SELECT * from authorized_shas WHERE sha = %s;', self.source_sha)
+                await cursor.execute('SELECT * from authorized_shas WHERE sha = %s;', source_sha)
                 row = await cursor.fetchone()
+                if row is not None:
+                    self._authorized_sha = source_sha
                 return row is not None
 
     def merge_priority(self):
@@ -260,10 +276,12 @@ class PR(Code):
             await gh_client.post(
                 f'/repos/{self.target_branch.branch.repo.short_str()}/statuses/{self.source_sha}',
                 data=data)
+            return True
         except gidgethub.HTTPException as e:
             log.info(f'{self.short_str()}: notify github of build state failed due to exception: {e}')
         except aiohttp.client_exceptions.ClientResponseError as e:
             log.error(f'{self.short_str()}: Unexpected exception in post to github: {e}')
+        return False
 
     async def _update_github_review_state(self, gh):
         latest_state_by_login = {}
@@ -363,14 +381,19 @@ mkdir -p {shq(repo_dir)}
             }
             batches = await batch_client.list_batches(attributes=attrs)
 
-            min_batch = None
-            failed = None
-            for b in batches:
+            async def status(b):
                 try:
-                    s = await b.status()
+                    return await b.status()
                 except Exception as err:
                     log.info(f'failed to get the status for batch {b.id} due to error: {err}')
                     raise
+
+            statuses = await bounded_gather(*[functools.partial(status, b) for b in batches],
+                                            parallelism=UPDATE_PARALLELISM)
+
+            min_batch = None
+            failed = None
+            for b, s in zip(batches, statuses):
                 if s['state'] != 'cancelled':
                     if min_batch is None or b.id > min_batch.id:
                         min_batch = b
@@ -529,21 +552,22 @@ class WatchedBranch(Code):
             batch_client = app['batch_client']
             dbpool = app['dbpool']
 
-            while self.github_changed or self.batch_changed or self.state_changed:
-                if self.github_changed:
-                    self.github_changed = False
-                    await self._update_github(gh)
-                    await self.try_to_merge(gh)
-
-                if self.batch_changed:
-                    self.batch_changed = False
-                    await self._update_batch(batch_client)
-                    await self.try_to_merge(gh)
-
-                if self.state_changed:
-                    self.state_changed = False
-                    await self._heal(batch_client, dbpool)
-            await self.update_statuses(gh)
+            async with repo_update_locks[self.branch.repo]:
+                while self.github_changed or self.batch_changed or self.state_changed:
+                    if self.github_changed:
+                        self.github_changed = False
+                        await self._update_github(gh)
+                        await self.try_to_merge(gh)
+
+                    if self.batch_changed:
+                        self.batch_changed = False
+                        await self._update_batch(batch_client)
+                        await self.try_to_merge(gh)
+
+                    if self.state_changed:
+                        self.state_changed = False
+                        await self._heal(batch_client, dbpool)
+                await self.update_statuses(gh)
         finally:
             log.info(f'update done {self.short_str()}')
             self.updating = False
@@ -560,11 +584,21 @@ class WatchedBranch(Code):
 
     async def update_statuses(self, gh):
         new_statuses = {}
+        to_post = []
         for pr in self.prs.values():
             if pr.source_sha:
                 gh_status = pr.github_status()
-                if pr.source_sha not in self.statuses or self.statuses[pr.source_sha] != gh_status:
-                    await pr.post_github_status(gh, gh_status)
+                if self.statuses.get(pr.source_sha) == gh_status:
+                    new_statuses[pr.source_sha] = gh_status
+                else:
+                    to_post.append((pr, gh_status))
+
+        posted = await bounded_gather(
+            *[functools.partial(pr.post_github_status, gh, gh_status) for pr, gh_status in to_post],
+            parallelism=UPDATE_PARALLELISM)
+        # failed posts are retried on the next update
+        for (pr, gh_status), ok in zip(to_post, posted):
+            if ok:
                 new_statuses[pr.source_sha] = gh_status
         self.statuses = new_statuses
 
@@ -591,8 +625,8 @@ class WatchedBranch(Code):
             new_prs[number] = pr
         self.prs = new_prs
 
-        for pr in new_prs.values():
-            await pr._update_github_review_state(gh)
+        await bounded_gather(*[functools.partial(pr._update_github_review_state, gh) for pr in new_prs.values()],
+                             parallelism=UPDATE_PARALLELISM)
 
     async def _update_deploy(self, batch_client):
         assert self.deployable
@@ -651,8 +685,8 @@ class WatchedBranch(Code):
         if self.deployable:
             await self._update_deploy(batch_client)
 
-        for pr in self.prs.values():
-            await pr._update_batch(batch_client)
+        await bounded_gather(*[functools.partial(pr._update_batch, batch_client) for pr in self.prs.values()],
+                             parallelism=UPDATE_PARALLELISM)
 
     async def _heal(self, batch_client, dbpool):
         log.info(f'heal {self.short_str()}')
@@ -660,18 +694,21 @@ class WatchedBranch(Code):
         if self.deployable:
             await self._heal_deploy(batch_client)
 
+        # merge candidate if up-to-date build passing, or
+        # pending but haven't failed
+        candidates = [pr for pr in self.prs.values()
+                      if (pr.review_state == 'approved' and
+                          (pr.build_state == 'success' or not pr.source_sha_failed))]
+        authorized = await bounded_gather(*[functools.partial(pr.authorized, dbpool) for pr in candidates],
+                                          parallelism=UPDATE_PARALLELISM)
+
         merge_candidate = None
         merge_candidate_pri = None
-        for pr in self.prs.values():
-            # merge candidate if up-to-date build passing, or
-            # pending but haven't failed
-            if (pr.review_state == 'approved' and
-                    (pr.build_state == 'success' or not pr.source_sha_failed)):
-                pri = pr.merge_priority()
-                is_authorized = await pr.authorized(dbpool)
-                if is_authorized and (not merge_candidate or pri > merge_candidate_pri):
-                    merge_candidate = pr
-                    merge_candidate_pri = pri
+        for pr, is_authorized in zip(candidates, authorized):
+            pri = pr.merge_priority()
+            if is_authorized and (not merge_candidate or pri > merge_candidate_pri):
+                merge_candidate = pr
+                merge_candidate_pri = pri
         if merge_candidate:
             log.info(f'merge candidate {merge_candidate.number}')
 
@@ -1,6 +1,8 @@
 import string
 import secrets
 import asyncio
+from collections import OrderedDict
+from collections.abc import MutableMapping
 
 
 class CalledProcessError(Exception):
@@ -40,3 +42,33 @@ def generate_token(size=12):
 
 def flatten(xxs):
     return [x for xs in xxs for x in xs]
+
+
+class LRUCache(MutableMapping):
+    """A mapping holding at most `maxsize` items, evicting the least recently
+    used. Used as the gidgethub response cache, which makes GET requests
+    conditional on the ETag of the cached response."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._d = OrderedDict()
+
+    def __getitem__(self, key):
+        value = self._d[key]
+        self._d.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._d[key] = value
+        self._d.move_to_end(key)
+        while len(self._d) > self.maxsize:
+            self._d.popitem(last=False)
+
+    def __delitem__(self, key):
+        del self._d[key]
+
+    def __iter__(self):
+        return iter(self._d)
+
+    def __len__(self):
+        return len(self._d)
@@ -0,0 +1,105 @@
+import asyncio
+import collections
+import unittest
+
+from ci.github import FQBranch, WatchedBranch
+
+
+def async_to_blocking(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+class FakeGitHubClient:
+    """Answers the requests a watched branch without pull requests makes,
+    recording how many are in flight for each repo."""
+
+    def __init__(self):
+        self.active = collections.Counter()
+        self.max_active = collections.Counter()
+        self.max_total_active = 0
+        self.n_requests = 0
+
+    async def getitem(self, url):
+        # /repos/{owner}/{name}/git/refs/heads/{branch}
+        repo = '/'.join(url.split('/')[2:4])
+        self.n_requests += 1
+        self.active[repo] += 1
+        self.max_active[repo] = max(self.max_active[repo], self.active[repo])
+        self.max_total_active = max(self.max_total_active, sum(self.active.values()))
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.active[repo] -= 1
+        return {'object': {'sha': '0' * 40}}
+
+    async def getiter(self, url):  # pylint: disable=unused-argument
+        return
+        yield  # pylint: disable=unreachable
+
+
+class FakeBatchClient:
+    def __init__(self):
+        self.n_list_batches = 0
+
+    async def list_batches(self, complete=None, attributes=None):  # pylint: disable=unused-argument
+        self.n_list_batches += 1
+        return []
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.gh = FakeGitHubClient()
+        self.batch_client = FakeBatchClient()
+        self.app = {
+            'github_client': self.gh,
+            'batch_client': self.batch_client,
+            'dbpool': None
+        }
+
+    def watched_branches(self, *short_strs):
+        return [WatchedBranch(i, FQBranch.from_short_str(s), False)
+                for i, s in enumerate(short_strs)]
+
+    def test_update_same_repo_serialized(self):
+        wbs = self.watched_branches('hail-is/hail:master', 'hail-is/hail:release')
+
+        async def f():
+            await asyncio.gather(*[wb.update(self.app) for wb in wbs])
+
+        async_to_blocking(f())
+
+        self.assertEqual(self.gh.max_active['hail-is/hail'], 1)
+        self.assertEqual(self.gh.n_requests, 2)
+        for wb in wbs:
+            self.assertEqual(wb.sha, '0' * 40)
+            self.assertEqual(wb.prs, {})
+            self.assertFalse(wb.updating)
+
+    def test_update_different_repos_concurrent(self):
+        wbs = self.watched_branches('hail-is/hail:master', 'hail-is/other:master')
+
+        async def f():
+            await asyncio.gather(*[wb.update(self.app) for wb in wbs])
+
+        async_to_blocking(f())
+
+        self.assertEqual(self.gh.max_active['hail-is/hail'], 1)
+        self.assertEqual(self.gh.max_active['hail-is/other'], 1)
+        self.assertEqual(self.gh.max_total_active, 2)
+
+    def test_notify_during_update_of_same_repo(self):
+        wbs = self.watched_branches('hail-is/hail:master', 'hail-is/hail:release')
+
+        async def f():
+            await asyncio.gather(wbs[0].update(self.app),
+                                 wbs[1].notify_github_changed(self.app),
+                                 wbs[1].notify_batch_changed(self.app))
+
+        async_to_blocking(f())
+
+        self.assertEqual(self.gh.max_active['hail-is/hail'], 1)
+        # the second notification finds the branch already updating and
+        # is folded into the running update
+        self.assertEqual(self.gh.n_requests, 2)
+        self.assertEqual(self.batch_client.n_list_batches, 2)
+        self.assertEqual(wbs[1].sha, '0' * 40)
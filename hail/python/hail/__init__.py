@@ -34,10 +34,9 @@ from . import methods
 from . import expr
 from . import stats
 from . import linalg
-from . import plot
-from . import experimental
 from . import ir
 from . import backend
+from .backend.profile import profile
 from hail.expr import aggregators as agg
 from hail.utils import Struct, Interval, hadoop_copy, hadoop_open, hadoop_ls, \
     hadoop_stat, hadoop_exists, hadoop_is_file, hadoop_is_dir, copy_log
@@ -79,6 +78,7 @@ __all__ = [
     'ir',
     'backend',
     'current_backend',
+    'profile',
     'debug_info',
     'citation',
     'cite_hail',
@@ -94,8 +94,25 @@ import builtins
 __all__.extend([x for x in expr.__all__ if not hasattr(builtins, x)])
 del builtins
 
-ir.register_functions()
-ir.register_aggregators()
+# `plot` and `experimental` pull in bokeh, pandas and scipy, so they are
+# imported on first attribute access rather than with hail itself
+_lazy_submodules = {'plot', 'experimental'}
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        import importlib
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+import sys
+
+if sys.version_info < (3, 7):
+    # module-level __getattr__ (PEP 562) requires Python 3.7
+    from . import plot
+    from . import experimental
+del sys
 
 __version__ = None  # set in hail.init()
 
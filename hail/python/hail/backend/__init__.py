@@ -1,8 +1,15 @@
 from .backend import *
+from .profile import QueryProfile
+from .cache import ResultCache, enable_result_cache, disable_result_cache, result_cache
 
 __all__ = [
     'Backend',
     'LocalBackend',
     'SparkBackend',
-    'ServiceBackend'
+    'ServiceBackend',
+    'QueryProfile',
+    'ResultCache',
+    'enable_result_cache',
+    'disable_result_cache',
+    'result_cache'
 ]
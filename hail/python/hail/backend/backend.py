@@ -10,6 +10,9 @@ from hail.expr.blockmatrix_type import *
 from hail.ir.renderer import CSERenderer, Renderer
 from hail.table import Table
 from hail.matrixtable import MatrixTable
+from hail.utils.temp_files import temp_files
+from .profile import _start_query, _no_query
+from .cache import _cache_lookup, _cache_store
 
 
 class Backend(abc.ABC):
@@ -98,17 +101,33 @@ class SparkBackend(Backend):
             self._fs = HadoopFS()
         return self._fs
 
-    def _to_java_ir(self, ir):
+    def _to_java_ir(self, ir, query=_no_query):
         if not hasattr(ir, '_jir'):
             r = CSERenderer(stop_at_jir=True)
+            with query.phase('render'):
+                code = r(ir)
+            query.rendered(code)
             # FIXME parse should be static
-            ir._jir = ir.parse(r(ir), ir_map=r.jirs)
+            with query.phase('parse'):
+                ir._jir = ir.parse(code, ir_map=r.jirs)
         return ir._jir
 
     def execute(self, ir, timed=False):
-        result = json.loads(Env.hc()._jhc.backend().executeJSON(self._to_java_ir(ir)))
-        value = ir.typ._from_json(result['value'])
+        key, cached = _cache_lookup(ir)
+        if cached is not None:
+            value = ir.typ._from_json(cached)
+            return (value, {}) if timed else value
+
+        query = _start_query(ir)
+        jir = self._to_java_ir(ir, query)
+        with query.phase('backend'):
+            result_json = Env.hc()._jhc.backend().executeJSON(jir)
+        with query.phase('decode'):
+            result = json.loads(result_json)
+            value = ir.typ._from_json(result['value'])
         timings = result['timings']
+        query.finish(result_json, timings)
+        _cache_store(key, result['value'])
 
         return (value, timings) if timed else value
 
@@ -125,29 +144,40 @@ class SparkBackend(Backend):
         return tmatrix._from_java(jir.typ())
 
     def persist_table(self, t, storage_level):
-        return Table._from_java(self._to_java_ir(t._tir).pyPersist(storage_level))
+        return self._inherit(Table._from_java(self._to_java_ir(t._tir).pyPersist(storage_level)), t._tir)
 
     def unpersist_table(self, t):
-        return Table._from_java(self._to_java_ir(t._tir).pyUnpersist())
+        return self._inherit(Table._from_java(self._to_java_ir(t._tir).pyUnpersist()), t._tir)
 
     def persist_matrix_table(self, mt, storage_level):
-        return MatrixTable._from_java(self._to_java_ir(mt._mir).pyPersist(storage_level))
+        return self._inherit(MatrixTable._from_java(self._to_java_ir(mt._mir).pyPersist(storage_level)), mt._mir)
 
     def unpersist_matrix_table(self, mt):
-        return MatrixTable._from_java(self._to_java_ir(mt._mir).pyUnpersist())
+        return self._inherit(MatrixTable._from_java(self._to_java_ir(mt._mir).pyUnpersist()), mt._mir)
+
+    @staticmethod
+    def _inherit(result, ir):
+        # the persisted JVM value may still read temporary files read by ir
+        temp_files().inherit(result._tir if isinstance(result, Table) else result._mir, ir)
+        return result
 
     def blockmatrix_type(self, bmir):
         jir = self._to_java_ir(bmir)
         return tblockmatrix._from_java(jir.typ())
 
     def from_spark(self, df, key):
-        return Table._from_java(Env.hail().table.Table.pyFromDF(df._jdf, key))
+        t = Table._from_java(Env.hail().table.Table.pyFromDF(df._jdf, key))
+        # the data frame may read temporary files, as one from to_spark does
+        temp_files().inherit(t._tir, df)
+        return t
 
     def to_spark(self, t, flatten):
         t = t.expand_types()
         if flatten:
             t = t.flatten()
-        return pyspark.sql.DataFrame(self._to_java_ir(t._tir).pyToDF(), Env.spark_session()._wrapped)
+        df = pyspark.sql.DataFrame(self._to_java_ir(t._tir).pyToDF(), Env.spark_session()._wrapped)
+        temp_files().inherit(df, t._tir)
+        return df
 
     def to_pandas(self, t, flatten):
         return self.to_spark(t, flatten).toPandas()
@@ -195,17 +225,33 @@ class LocalBackend(Backend):
     def __init__(self):
         pass
 
-    def _to_java_ir(self, ir):
+    def _to_java_ir(self, ir, query=_no_query):
         if not hasattr(ir, '_jir'):
             r = CSERenderer(stop_at_jir=True)
+            with query.phase('render'):
+                code = r(ir)
+            query.rendered(code)
             # FIXME parse should be static
-            ir._jir = ir.parse(r(ir), ir_map=r.jirs)
+            with query.phase('parse'):
+                ir._jir = ir.parse(code, ir_map=r.jirs)
         return ir._jir
 
     def execute(self, ir, timed=False):
-        result = json.loads(Env.hail().expr.ir.LocalBackend.executeJSON(self._to_java_ir(ir)))
-        value = ir.typ._from_json(result['value'])
+        key, cached = _cache_lookup(ir)
+        if cached is not None:
+            value = ir.typ._from_json(cached)
+            return (value, {}) if timed else value
+
+        query = _start_query(ir)
+        jir = self._to_java_ir(ir, query)
+        with query.phase('backend'):
+            result_json = Env.hail().expr.ir.LocalBackend.executeJSON(jir)
+        with query.phase('decode'):
+            result = json.loads(result_json)
+            value = ir.typ._from_json(result['value'])
         timings = result['timings']
+        query.finish(result_json, timings)
+        _cache_store(key, result['value'])
         return (value, timings) if timed else value
 
 
@@ -233,18 +279,30 @@ class ServiceBackend(Backend):
         return r(ir)
 
     def execute(self, ir, timed=False):
-        code = self._render(ir)
-        resp = requests.post(f'{self.url}/execute', json=code, headers=self.headers)
+        key, cached = _cache_lookup(ir)
+        if cached is not None:
+            value = ir.typ._from_json(cached)
+            return (value, {}) if timed else value
+
+        query = _start_query(ir)
+        with query.phase('render'):
+            code = self._render(ir)
+        query.rendered(code)
+        with query.phase('backend'):
+            resp = requests.post(f'{self.url}/execute', json=code, headers=self.headers)
         if resp.status_code == 400:
             resp_json = resp.json()
             raise FatalError(resp_json['message'])
         resp.raise_for_status()
 
-        resp_json = resp.json()
-        typ = dtype(resp_json['type'])
-        result = json.loads(resp_json['result'])
-        value = typ._from_json(result['value'])
+        with query.phase('decode'):
+            resp_json = resp.json()
+            typ = dtype(resp_json['type'])
+            result = json.loads(resp_json['result'])
+            value = typ._from_json(result['value'])
         timings = result['timings']
+        query.finish(resp_json['result'], timings)
+        _cache_store(key, result['value'])
 
         return (value, timings) if timed else value
 
@@ -0,0 +1,277 @@
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+
+import hail as hl
+from hail.typecheck import typecheck, nullable
+from hail.utils.java import Env, warn
+
+_uid_re = re.compile(r'__uid_[A-Za-z_]*\d+')
+
+# the name of a result file, '<sha256 of the query>.json'
+_result_file_re = re.compile(r'(^|/)[0-9a-f]{64}\.json$')
+
+
+def _canonical_uids(code):
+    # uids differ between otherwise identical queries built at different
+    # times, so they are renumbered in order of appearance
+    uids = {}
+    return _uid_re.sub(lambda m: uids.setdefault(m.group(0), f'__uid_{len(uids)}'), code)
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _input_paths(ir):
+    # every reader, and every node that reads files itself, must name the
+    # files it reads; anything else is not cacheable
+    paths = set()
+    stack = [ir]
+    while stack:
+        x = stack.pop()
+        if type(x).__name__.startswith('Java'):
+            # data computed on the JVM, such as a persisted table, has no
+            # stable fingerprint
+            raise _Uncacheable()
+        if type(x).__name__ == 'ApplySeeded':
+            raise _Uncacheable()
+        config = getattr(x, 'config', None)
+        if isinstance(config, dict) and 'config' in config:
+            # runs an external tool, such as VEP, configured by a file
+            raise _Uncacheable()
+        reader = getattr(x, 'reader', None)
+        source = reader if reader is not None else x
+        input_paths = getattr(source, 'input_paths', None)
+        if input_paths is not None:
+            node_paths = input_paths()
+            if node_paths is None:
+                raise _Uncacheable()
+            paths.update(node_paths)
+        elif reader is not None:
+            raise _Uncacheable()
+        stack.extend(x.children)
+    return sorted(paths)
+
+
+def _input_metadata(path):
+    fs = Env.fs()
+    stat = fs.stat(path)
+    metadata = [path, stat['size_bytes'], stat['modification_time']]
+    if stat['is_dir']:
+        # a Hail table, matrix table or block matrix is rewritten with its
+        # metadata file, whose modification time is reliable on object stores
+        for name in ('metadata.json.gz', 'metadata.json', '_SUCCESS'):
+            if fs.is_file(f'{path}/{name}'):
+                metadata.append(fs.stat(f'{path}/{name}')['modification_time'])
+                break
+    return metadata
+
+
+class ResultCache(object):
+    """A cache of the results of queries on unchanging inputs.
+
+    A query is identified by its rendered IR, with generated identifiers
+    renumbered, and the path, size and modification time of every file it
+    reads. Results of queries whose inputs have changed are therefore never
+    returned. Queries that use random functions, that read data computed on
+    the JVM such as persisted tables, that read files through a reader which
+    does not name them, or that return no value, such as writes, are not
+    cached.
+
+    Results are kept as JSON in memory, least recently used first, up to
+    `memory_bytes`, and in `directory`, if set, where they outlive the
+    session.
+
+    Parameters
+    ----------
+    memory_bytes : :obj:`int`
+        Size of the in-memory tier.
+    directory : :obj:`str`, optional
+        Directory of the on-disk tier.
+    """
+
+    def __init__(self, memory_bytes=100_000_000, directory=None):
+        self.memory_bytes = memory_bytes
+        self.directory = directory.rstrip('/') if directory is not None else None
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._size = 0
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'uncacheable': 0}
+
+    def key(self, ir):
+        """The cache key of `ir`, or ``None`` if its result is not cacheable."""
+        if ir.typ == hl.tvoid:
+            self._count('uncacheable')
+            return None
+        try:
+            paths = _input_paths(ir)
+            inputs = [_input_metadata(path) for path in paths]
+        except _Uncacheable:
+            self._count('uncacheable')
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # e.g. a glob, or a path that no longer exists
+            self._count('uncacheable')
+            return None
+        from hail.ir.renderer import CSERenderer
+        code = _canonical_uids(CSERenderer()(ir))
+        h = hashlib.sha256()
+        h.update(json.dumps([hl.__version__, inputs]).encode())
+        h.update(code.encode())
+        return h.hexdigest()
+
+    def get(self, key):
+        """The JSON result stored under `key`, or ``None``."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return value
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                fs = Env.fs()
+                if fs.exists(path):
+                    with fs.open(path) as f:
+                        value = f.read()
+            except Exception as e:  # pylint: disable=broad-except
+                warn(f'could not read cached result {path}: {e}')
+            if value is not None:
+                self._store_in_memory(key, value)
+                self._count('disk_hits')
+                return value
+        self._count('misses')
+        return None
+
+    def put(self, key, value):
+        """Store the JSON result `value` under `key`."""
+        self._store_in_memory(key, value)
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with Env.fs().open(path, 'w') as f:
+                    f.write(value)
+            except Exception as e:  # pylint: disable=broad-except
+                warn(f'could not write cached result {path}: {e}')
+
+    def stats(self):
+        """Hit and miss counts of the cache.
+
+        Returns
+        -------
+        :obj:`dict`
+            ``memory_hits``, ``disk_hits``, ``misses``, ``uncacheable`` (queries
+            not looked up), ``hit_rate`` (hits over lookups), and ``n_entries``
+            and ``memory_bytes`` of the in-memory tier.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['n_entries'] = len(self._memory)
+            stats['memory_bytes'] = self._size
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else None
+        return stats
+
+    def clear(self):
+        """Remove every cached result, including those on disk. Other files in
+        `directory` are left alone."""
+        with self._lock:
+            self._memory.clear()
+            self._size = 0
+        if self.directory is not None:
+            fs = Env.fs()
+            if fs.exists(self.directory):
+                fs.rm_many([entry['path'] for entry in fs.ls(self.directory)
+                            if _result_file_re.search(entry['path'])])
+
+    def _path(self, key):
+        return f'{self.directory}/{key}.json'
+
+    def _count(self, stat):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _store_in_memory(self, key, value):
+        if len(value) > self.memory_bytes:
+            return
+        with self._lock:
+            if key in self._memory:
+                self._size -= len(self._memory.pop(key))
+            self._memory[key] = value
+            self._size += len(value)
+            while self._size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._size -= len(evicted)
+
+
+_cache = None
+
+
+@typecheck(memory_bytes=int, directory=nullable(str))
+def enable_result_cache(memory_bytes=100_000_000, directory=None):
+    """Cache the results of queries on unchanging inputs for the rest of the
+    session.
+
+    Examples
+    --------
+
+    >>> hl.backend.enable_result_cache(directory='/tmp/hail-results')  # doctest: +SKIP
+    >>> mt = hl.read_matrix_table('data/example.mt')  # doctest: +SKIP
+    >>> mt.count()  # doctest: +SKIP
+    >>> mt.count()  # answered from the cache  # doctest: +SKIP
+    >>> hl.backend.result_cache().stats()['hit_rate']  # doctest: +SKIP
+    0.5
+
+    Notes
+    -----
+    See :class:`.ResultCache` for which queries are cached. Results are
+    looked up by fingerprinting the query, which renders its IR and reads the
+    metadata of each input file, so caching is worthwhile for queries that
+    read data, not for cheap evaluations.
+
+    Parameters
+    ----------
+    memory_bytes : :obj:`int`
+        Size of the in-memory tier.
+    directory : :obj:`str`, optional
+        Directory of the on-disk tier. Results stored there by earlier sessions
+        are used.
+
+    Returns
+    -------
+    :class:`.ResultCache`
+    """
+    global _cache
+    _cache = ResultCache(memory_bytes, directory)
+    return _cache
+
+
+def disable_result_cache():
+    """Stop caching query results."""
+    global _cache
+    _cache = None
+
+
+def result_cache():
+    """The :class:`.ResultCache` of the session, or ``None`` if caching is not
+    enabled."""
+    return _cache
+
+
+def _cache_lookup(ir):
+    """The cache key of `ir` and its cached JSON result, if any."""
+    if _cache is None:
+        return None, None
+    key = _cache.key(ir)
+    if key is None:
+        return None, None
+    return key, _cache.get(key)
+
+
+def _cache_store(key, value):
+    if key is not None and _cache is not None:
+        _cache.put(key, value)
@@ -0,0 +1,242 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from hail.typecheck import typecheck, nullable, numeric
+
+_actions = {
+    'TableCount': 'count',
+    'TableCollect': 'collect',
+    'TableGetGlobals': 'collect',
+    'TableAggregate': 'aggregate',
+    'MatrixAggregate': 'aggregate',
+    'TableWrite': 'write',
+    'MatrixWrite': 'write',
+    'MatrixMultiWrite': 'write',
+    'BlockMatrixWrite': 'write',
+    'BlockMatrixMultiWrite': 'write',
+    'TableToValueApply': 'apply',
+    'MatrixToValueApply': 'apply',
+    'BlockMatrixToValueApply': 'apply',
+}
+
+
+def _jvm_seconds(timings, *stages):
+    # timings map 'context -- stage' to {'nano': ..., 'readable': ...}
+    nanos = 0
+    for name, timing in timings.items():
+        stage = name.rsplit(' -- ', 1)[-1].lower()
+        if not stages or any(s in stage for s in stages):
+            nanos += timing.get('nano', 0)
+    return nanos / 1e9
+
+
+class _Phase(object):
+    __slots__ = ['query', 'name', 't0']
+
+    def __init__(self, query, name):
+        self.query = query
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.query.record[self.name] += time.perf_counter() - self.t0
+
+
+class _NoPhase(object):
+    __slots__ = []
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+class _NoQuery(object):
+    """Stands in for a query when nothing is profiling."""
+    _phase = _NoPhase()
+
+    def phase(self, name):
+        return self._phase
+
+    def rendered(self, code):
+        pass
+
+    def finish(self, result, timings):
+        pass
+
+
+_no_query = _NoQuery()
+
+
+class _Query(object):
+    def __init__(self, ir, profiles):
+        self.ir = ir
+        self.profiles = profiles
+        self.t0 = time.perf_counter()
+        name = type(ir).__name__
+        self.record = {
+            'action': _actions.get(name, 'eval'),
+            'ir_class': name,
+            'start_time': time.time(),
+            'ir_chars': None,
+            'render_seconds': 0.0,
+            'parse_seconds': 0.0,
+            'backend_seconds': 0.0,
+            'decode_seconds': 0.0,
+        }
+
+    def phase(self, name):
+        return _Phase(self, f'{name}_seconds')
+
+    def rendered(self, code):
+        self.record['ir_chars'] = len(code)
+
+    def finish(self, result, timings):
+        r = self.record
+        r['total_seconds'] = time.perf_counter() - self.t0
+        r['result_bytes'] = len(result)
+        r['jvm_seconds'] = _jvm_seconds(timings)
+        r['jvm_optimize_seconds'] = _jvm_seconds(timings, 'optimize')
+        r['jvm_compile_seconds'] = _jvm_seconds(timings, 'compile')
+        r['jvm_execute_seconds'] = _jvm_seconds(timings, 'runtime', 'interpret')
+        # time in the backend call not accounted for by the backend: Py4J or
+        # HTTP transfer, and parsing on the JVM
+        r['transfer_seconds'] = max(r['backend_seconds'] - r['jvm_seconds'], 0.0)
+        r['timings'] = timings
+        r['ir_path'] = None
+        for p in self.profiles:
+            p._add(self)
+
+
+class QueryProfile(object):
+    """Timings of the queries run in a :func:`.profile` block.
+
+    Each query is a :obj:`dict` with fields:
+
+    - `action` (:obj:`str`) -- ``'collect'``, ``'count'``, ``'aggregate'``,
+      ``'write'``, ``'apply'``, or ``'eval'`` for other value queries.
+    - `ir_class` (:obj:`str`) -- Class of the executed IR.
+    - `start_time` (:obj:`float`) -- Seconds since the epoch.
+    - `ir_chars` (:obj:`int`) -- Length of the rendered IR, or ``None`` if the
+      IR had already been sent to the backend.
+    - `render_seconds`, `parse_seconds` -- Time rendering the IR in Python
+      and parsing it on the JVM.
+    - `backend_seconds` -- Wall time of the backend call.
+    - `jvm_seconds` -- Time accounted for by the backend's own timings, of
+      which `jvm_optimize_seconds`, `jvm_compile_seconds` and
+      `jvm_execute_seconds`.
+    - `transfer_seconds` -- `backend_seconds` not accounted for by the
+      backend.
+    - `result_bytes` (:obj:`int`) -- Size of the JSON result.
+    - `decode_seconds` -- Time decoding the result in Python.
+    - `total_seconds` -- Wall time of the query.
+    - `timings` (:obj:`dict`) -- The backend's timings, by stage.
+    - `ir_path` (:obj:`str`) -- File the IR of a slow query was written to.
+    """
+
+    def __init__(self, slow_query_seconds=None, slow_query_dir=None):
+        self.queries = []
+        self.slow_query_seconds = slow_query_seconds
+        self.slow_query_dir = slow_query_dir
+        self._lock = threading.Lock()
+
+    def _add(self, query):
+        record = dict(query.record)
+        if (self.slow_query_dir is not None
+                and self.slow_query_seconds is not None
+                and record['total_seconds'] >= self.slow_query_seconds):
+            record['ir_path'] = self._dump(query.ir)
+        with self._lock:
+            self.queries.append(record)
+
+    def _dump(self, ir):
+        from hail.ir.renderer import CSERenderer
+        os.makedirs(self.slow_query_dir, exist_ok=True)
+        with self._lock:
+            path = os.path.join(self.slow_query_dir, f'query-{len(self.queries)}.ir')
+        with open(path, 'w') as f:
+            f.write(CSERenderer()(ir))
+        return path
+
+    def to_pandas(self):
+        """The queries as a :class:`pandas.DataFrame`, one row per query.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+        """
+        import pandas
+        with self._lock:
+            queries = list(self.queries)
+        return pandas.DataFrame(queries, columns=None if queries else ['action', 'total_seconds'])
+
+    def __len__(self):
+        return len(self.queries)
+
+
+_profiles = []
+_profiles_lock = threading.Lock()
+
+
+def _start_query(ir):
+    """The query record for executing `ir`, a no-op if nothing is profiling."""
+    if not _profiles:
+        return _no_query
+    with _profiles_lock:
+        profiles = list(_profiles)
+    return _Query(ir, profiles)
+
+
+@contextmanager
+@typecheck(slow_query_seconds=nullable(numeric), slow_query_dir=nullable(str))
+def profile(slow_query_seconds=None, slow_query_dir=None):
+    """Record the timings of every query run in this block.
+
+    Examples
+    --------
+
+    >>> with hl.profile() as p:  # doctest: +SKIP
+    ...     n = mt.count_rows()
+    ...     af = mt.aggregate_rows(hl.agg.mean(mt.info.AF[0]))
+    >>> p.to_pandas()[['action', 'ir_chars', 'jvm_execute_seconds', 'total_seconds']]  # doctest: +SKIP
+
+    Notes
+    -----
+    A query is recorded for each :meth:`.Table.collect`,
+    :meth:`.Table.aggregate`, :meth:`.Table.write`, :meth:`.Table.count` or
+    other action and for each :func:`.eval` sent to the backend, with the
+    time spent rendering the IR and decoding the result in Python, and the
+    compile and execute timings reported by the backend. See
+    :class:`.QueryProfile` for the recorded fields. Expressions evaluated in
+    Python without the backend are not recorded.
+
+    If `slow_query_dir` and `slow_query_seconds` are set, the IR of each query
+    taking at least `slow_query_seconds` is written to a file in the local
+    directory `slow_query_dir`, to reproduce it or share it in a bug report.
+
+    Profiles may be nested; each records every query run while it is open.
+
+    Parameters
+    ----------
+    slow_query_seconds : :obj:`float`, optional
+        Time above which a query is slow.
+    slow_query_dir : :obj:`str`, optional
+        Local directory to write the IR of slow queries to.
+
+    Returns
+    -------
+    :class:`.QueryProfile`
+    """
+    p = QueryProfile(slow_query_seconds, slow_query_dir)
+    with _profiles_lock:
+        _profiles.append(p)
+    try:
+        yield p
+    finally:
+        with _profiles_lock:
+            _profiles.remove(p)
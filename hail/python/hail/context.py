@@ -6,6 +6,7 @@ import hail
 from hail.genetics.reference_genome import ReferenceGenome
 from hail.typecheck import nullable, typecheck, typecheck_method, enumeration
 from hail.utils import get_env_or_default
+from hail.utils.temp_files import _stop_temp_files
 from hail.utils.java import Env, joption, FatalError, connect_logger, install_exception_handler, uninstall_exception_handler
 from hail.backend import Backend, ServiceBackend, SparkBackend
 
@@ -154,6 +155,7 @@ class HailContext(object):
         return self._default_ref
 
     def stop(self):
+        _stop_temp_files()
         Env.hail().HailContext.clear()
         self.sc.stop()
         self.sc = None
@@ -7,7 +7,7 @@ from .plots import hail_metadata, plot_roc_curve
 from .phase_by_transmission import *
 from .datasets import load_dataset
 from .import_gtf import import_gtf, get_gene_intervals
-from .write_multiple import write_matrix_tables, block_matrices_tofiles, export_block_matrices
+from .write_multiple import write_matrix_tables, block_matrices_tofiles, export_block_matrices, export_multiple
 from .export_entries_by_col import export_entries_by_col
 from .densify import densify
 from .sparse_split_multi import sparse_split_multi
@@ -36,6 +36,7 @@ __all__ = ['ld_score',
            'write_matrix_tables',
            'block_matrices_tofiles',
            'export_block_matrices',
+           'export_multiple',
            'export_entries_by_col',
            'densify',
            'sparse_split_multi',
@@ -1,60 +1,139 @@
 from ..matrixtable import MatrixTable
-import requests
+from ..utils.java import Env
+import os
 import json
 import hail as hl
 
 class DB:
-    
+
+    _manifest_url = "https://www.googleapis.com/storage/v1/b/hail-common/o/annotationdb%2f1%2fannotation_db.json?alt=media"
+
     _annotation_dataset_urls = None
-    
+
+    @staticmethod
+    def _manifest_cache_file():
+        return os.environ.get('HAIL_ANNOTATION_DB_MANIFEST', os.path.expanduser('~/.hail/annotation_db.json'))
+
+    @staticmethod
+    def _load_manifest():
+        cache_file = DB._manifest_cache_file()
+        if os.path.exists(cache_file):
+            with open(cache_file) as f:
+                return json.load(f)
+
+        import requests
+        r = requests.get(DB._manifest_url)
+        r.raise_for_status()
+        j = r.json()
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump(j, f)
+        except OSError:
+            pass
+        return j
+
     @staticmethod
     def annotation_dataset_urls():
+        """Dataset paths and gene-keyed flags from the annotation database manifest.
+
+        The manifest is downloaded on first use and cached in
+        ``~/.hail/annotation_db.json``, or the file named by the
+        ``HAIL_ANNOTATION_DB_MANIFEST`` environment variable. Delete the cached
+        file to pick up a newer manifest.
+        """
         if DB._annotation_dataset_urls is None:
-            r = requests.get("https://www.googleapis.com/storage/v1/b/hail-common/o/annotationdb%2f1%2fannotation_db.json?alt=media")
-            j = r.json()
-            
+            j = DB._load_manifest()
+
             DB._annotation_dataset_urls = {(x["name"], x.get("reference_genome")): x["path"] for x in j}
             DB._geneDict_dataset_urls = { x["name"]: (x["gene_key"]) for x in j}
-        
+
         return DB._annotation_dataset_urls, DB._geneDict_dataset_urls
-    
+
+    @staticmethod
+    def _zip_join(tables):
+        """Join `tables`, a list of (name, table) pairs with the same key type,
+        into one table with a struct field per name holding that table's row
+        value."""
+        if len(tables) == 1:
+            name, t = tables[0]
+            return t.select(**{name: t.row_value}).select_globals()
+
+        value_types = {name: t.row_value.dtype for name, t in tables}
+        key = list(tables[0][1].key)
+        data = Env.get_uid()
+        padded = []
+        for name, t in tables:
+            # multi_way_zip_join needs identical row types, so every table gets
+            # the same key names and every field, missing except its own
+            t = t.rename({k: new_k for k, new_k in zip(t.key, key) if k != new_k})
+            padded.append(t.select(**{data: hl.struct(**{
+                n: t.row_value if n == name else hl.null(typ) for n, typ in value_types.items()})})
+                .select_globals())
+        joined = hl.Table.multi_way_zip_join(padded, data, Env.get_uid())
+        return joined.select(**{name: joined[data][i][data][name]
+                                for i, (name, _) in enumerate(tables)}).select_globals()
+
     def annotate_rows_db(self,mt,*names):
         """
             Examples
             --------
             Annotates rows based on keyword implementation of annotation name.
             The user can type in multiple annotation names when attaching to their datasets.
-            
+
             >>> db = hl.experimental.DB()
             >>> mt = db.annotate_rows_db(mt, 'gnomad_lof_metrics')
             ...
-            
+
+            Notes
+            -----
+            Datasets with the same key type (locus, locus and alleles, or
+            gene) are zip joined into a single table, so the result has one
+            join per key type rather than one per dataset. The gene of each
+            locus is looked up once for all gene-keyed datasets. Interval-keyed
+            datasets are joined one by one, to the intervals containing each
+            locus.
+
             Parameters
             ----------
             names: Keyword argument of the annotation.
             Can include multiple annotations at one time.
-            
+
             Returns
             -------
             :class:`.MatrixTable`
             """
         d, geneDict = DB.annotation_dataset_urls()
         reference_genome = mt.row_key.locus.dtype.reference_genome.name
-        for name in names:
+        by_gene, by_interval, by_key = [], [], {}
+        for name in dict.fromkeys(names):
             gene_key = geneDict[(name)]
             if gene_key is True:
-                gene_url = d[('gencode', reference_genome)]
-                t  = hl.read_table(gene_url)
-                mt = mt.annotate_rows(gene_name=t[mt.locus].gene_name)
-                url = d[(name, None)]
-                t2 = hl.read_table(url)
-                mt = mt.annotate_rows(**{name:t2[mt.gene_name]})
-                mt = mt.drop('gene_name')
+                by_gene.append((name, hl.read_table(d[(name, None)])))
             else:
-                url = d[(name,reference_genome)]
-                t = hl.read_table(url)
-                if len(t.key) > 1:
-                    mt = mt.annotate_rows(**{name:t[mt.row_key]})
+                t = hl.read_table(d[(name,reference_genome)])
+                key_types = tuple(t.key.dtype.types)
+                if len(key_types) == 1 and isinstance(key_types[0], hl.tinterval):
+                    by_interval.append((name, t))
                 else:
-                    mt = mt.annotate_rows(**{name:t[mt.locus]})
+                    by_key.setdefault(key_types, []).append((name, t))
+
+        annotations = {}
+        if by_gene:
+            gene_name = Env.get_uid()
+            gencode = hl.read_table(d[('gencode', reference_genome)])
+            mt = mt.annotate_rows(**{gene_name: gencode[mt.locus].gene_name})
+            row = DB._zip_join(by_gene)[mt[gene_name]]
+            annotations.update({name: row[name] for name, _ in by_gene})
+        for key_types, tables in by_key.items():
+            row = DB._zip_join(tables)[mt.locus if len(key_types) == 1 else mt.row_key]
+            annotations.update({name: row[name] for name, _ in tables})
+        # a locus is joined to the intervals containing it, which a zip join
+        # of the interval keys cannot do
+        for name, t in by_interval:
+            annotations[name] = t[mt.locus]
+
+        mt = mt.annotate_rows(**{name: annotations[name] for name in dict.fromkeys(names)})
+        if by_gene:
+            mt = mt.drop(gene_name)
         return mt
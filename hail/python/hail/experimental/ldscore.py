@@ -154,23 +154,16 @@ def ld_score(entry_expr,
 
     if not annotation_exprs:
         cols = ['univariate']
-        col_idxs = {0: 'univariate'}
         l2 = r2_adj_sparse.sum(axis=1)
     else:
         ht = mt.select_rows(*wrap_to_list(annotation_exprs)).rows()
         ht = ht.annotate(univariate=hl.literal(1.0))
-        names = [name for name in ht.row if name not in ht.key]
+        cols = sorted(name for name in ht.row if name not in ht.key)
 
-        ht_union = hl.Table.union(
-            *[(ht.annotate(name=hl.str(x),
-                           value=hl.float(ht[x]))
-                 .select('name', 'value')) for x in names])
-        mt_annotations = ht_union.to_matrix_table(
-            row_key=list(ht_union.key),
-            col_key=['name'])
-
-        cols = mt_annotations.key_cols_by()['name'].collect()
-        col_idxs = {i: cols[i] for i in range(len(cols))}
+        # rows are already in variant order, so pivot each row's annotations
+        # into entries rather than unioning and re-keying a long table
+        ht = ht.select(**{x: hl.float(ht[x]) for x in cols})
+        mt_annotations = ht.to_matrix_table_row_major(cols, 'value', 'name')
 
         a_tmp = new_temp_file()
         BlockMatrix.write_from_entry_expr(mt_annotations.value, a_tmp)
@@ -178,22 +171,15 @@ def ld_score(entry_expr,
         a = BlockMatrix.read(a_tmp)
         l2 = r2_adj_sparse @ a
 
-    l2_bm_tmp = new_temp_file()
-    l2_tsv_tmp = new_temp_file()
-    l2.write(l2_bm_tmp, force_row_major=True)
-    BlockMatrix.export(l2_bm_tmp, l2_tsv_tmp)
-
-    ht_scores = hl.import_table(l2_tsv_tmp, no_header=True, impute=True)
-    ht_scores = ht_scores.add_index()
-    ht_scores = ht_scores.key_by('idx')
-    ht_scores = ht_scores.rename({'f{:}'.format(i): col_idxs[i]
-                                  for i in range(len(cols))})
+    ht_scores = l2.to_table_row_major()
+    ht_scores = ht_scores.select(**{cols[i]: ht_scores.entries[i]
+                                    for i in range(len(cols))})
 
     ht = mt.select_rows(__locus=locus_expr).rows()
     ht = ht.add_index()
     ht = ht.annotate(**ht_scores[ht.idx])
     ht = ht.key_by('__locus')
-    ht = ht.select(*[x for x in ht_scores.row if x not in ht_scores.key])
+    ht = ht.select(*cols)
     ht = ht.rename({'__locus': 'locus'})
 
     return ht
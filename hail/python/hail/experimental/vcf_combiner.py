@@ -1,11 +1,15 @@
 """A work in progress pipeline to combine (g)VCFs into an alternate format"""
 
+import json
+from typing import List, Optional
+
 import hail as hl
 from hail import MatrixTable, Table
 from hail.expr import StructExpression
 from hail.expr.expressions import expr_call, expr_array, expr_int32
 from hail.ir import Apply, TableKeyBy, TableMapRows, TopLevelReference
-from hail.typecheck import typecheck
+from hail.typecheck import typecheck, sequenceof, nullable
+from hail.utils import Interval, info
 
 _transform_rows_function_map = {}
 _merge_function_map = {}
@@ -158,6 +162,162 @@ def combine_gvcfs(mts):
     combined = combine(ts)
     return unlocalize(combined)
 
+# info fields read by transform_one that not every caller emits
+_optional_gvcf_info_fields = {
+    'ClippingRankSum': hl.tfloat64,
+    'BaseQRankSum': hl.tfloat64,
+    'MQ': hl.tfloat64,
+    'MQRankSum': hl.tfloat64,
+    'MQ_DP': hl.tint32,
+    'QUALapprox': hl.tint32,
+    'RAW_MQ': hl.tfloat64,
+    'ReadPosRankSum': hl.tfloat64,
+    'VarDP': hl.tint32,
+}
+
+_manifest_version = 1
+
+
+def _plan(n_inputs, branch_factor, has_existing=False):
+    """Plan a merge tree over `n_inputs` GVCFs.
+
+    Returns a list of levels. Each level is a list of merges, and each merge is
+    a list of the indices of its inputs: GVCFs for the first level, merges of
+    the previous level otherwise. The last level is a single merge. If
+    `has_existing`, that merge also takes the existing dataset as its first
+    input.
+    """
+    levels = []
+    n = n_inputs
+    n_extra = 1 if has_existing else 0
+    while True:
+        if n + n_extra <= branch_factor:
+            levels.append([list(range(n))])
+            return levels
+        levels.append([list(range(i, min(i + branch_factor, n))) for i in range(0, n, branch_factor)])
+        n = len(levels[-1])
+
+
+def _import_gvcfs(paths, intervals, reference_genome):
+    mts = hl.import_vcfs(paths, intervals, reference_genome=reference_genome,
+                         array_elements_required=False)
+    result = []
+    for mt in mts:
+        missing = {f: hl.null(t) for f, t in _optional_gvcf_info_fields.items() if f not in mt.info}
+        if missing:
+            mt = mt.annotate_rows(info=mt.info.annotate(**missing))
+        result.append(transform_one(mt))
+    return result
+
+
+class _Manifest(object):
+    def __init__(self, path, config):
+        self.path = path
+        self.config = config
+        self.completed = set()
+
+    @staticmethod
+    def load(path, config):
+        manifest = _Manifest(path, config)
+        if hl.hadoop_exists(path):
+            with hl.hadoop_open(path) as f:
+                j = json.load(f)
+            if j.get('version') != _manifest_version or j['config'] != config:
+                raise ValueError(f'run_combiner: the manifest {path} was written for a different run; '
+                                 f'use a new tmp_path or delete the manifest')
+            manifest.completed = set(j['completed'])
+            info(f'run_combiner: resuming with {len(manifest.completed)} completed merges from {path}')
+        return manifest
+
+    def complete(self, output):
+        self.completed.add(output)
+        with hl.hadoop_open(self.path, 'w') as f:
+            json.dump({'version': _manifest_version,
+                       'config': self.config,
+                       'completed': sorted(self.completed)}, f)
+
+
+@typecheck(sample_paths=sequenceof(str),
+           out_file=str,
+           tmp_path=str,
+           intervals=sequenceof(Interval),
+           branch_factor=int,
+           existing=nullable(str),
+           reference_genome=str,
+           overwrite=bool)
+def run_combiner(sample_paths: List[str],
+                 out_file: str,
+                 tmp_path: str,
+                 intervals: List[Interval],
+                 branch_factor: int = 100,
+                 existing: Optional[str] = None,
+                 reference_genome: str = 'GRCh38',
+                 overwrite: bool = False):
+    """Combine GVCFs into a sparse matrix table with a merge tree.
+
+    Inputs are merged `branch_factor` at a time with :func:`.combine_gvcfs`,
+    and each merge is written under `tmp_path` before the next level reads it,
+    so no single join has more than `branch_factor` inputs. The last merge is
+    written to `out_file`.
+
+    Completed merges are recorded in ``combiner_manifest.json`` in `tmp_path`.
+    If a run fails, calling :func:`.run_combiner` again with the same
+    arguments skips the merges that were already written.
+
+    Parameters
+    ----------
+    sample_paths : :obj:`list` of :obj:`str`
+        Paths to tabix-indexed, single-sample GVCFs.
+    out_file : :obj:`str`
+        Path to write the combined matrix table.
+    tmp_path : :obj:`str`
+        Directory for intermediate matrix tables and the manifest.
+    intervals : :obj:`list` of :class:`.Interval`
+        Partition intervals of type ``interval<struct{locus: locus<RG>}>``,
+        as for :func:`.import_vcfs`. Every merge uses the same partitioning.
+    branch_factor : :obj:`int`
+        Maximum number of inputs to a single merge.
+    existing : :obj:`str`, optional
+        Path to a matrix table written by a previous :func:`.run_combiner`,
+        with the same `intervals`. `sample_paths` are merged into it, and the
+        result has its columns first.
+    reference_genome : :obj:`str`
+        Reference genome of the GVCFs.
+    overwrite : :obj:`bool`
+        Overwrite `out_file` if it exists.
+    """
+    if branch_factor < 2:
+        raise ValueError(f'run_combiner: branch_factor must be at least 2, found {branch_factor}')
+    if not sample_paths:
+        raise ValueError('run_combiner: no GVCFs to combine')
+
+    tmp_path = tmp_path.rstrip('/')
+    config = {'sample_paths': list(sample_paths),
+              'out_file': out_file,
+              'branch_factor': branch_factor,
+              'existing': existing}
+    manifest = _Manifest.load(f'{tmp_path}/combiner_manifest.json', config)
+    levels = _plan(len(sample_paths), branch_factor, existing is not None)
+
+    previous = None
+    for level, merges in enumerate(levels):
+        last = level == len(levels) - 1
+        outputs = [out_file if last else f'{tmp_path}/level{level}/merge{i}.mt' for i in range(len(merges))]
+        for inputs, output in zip(merges, outputs):
+            if output in manifest.completed:
+                continue
+            if previous is None:
+                mts = _import_gvcfs([sample_paths[i] for i in inputs], intervals, reference_genome)
+            else:
+                mts = [hl.read_matrix_table(previous[i], _intervals=intervals) for i in inputs]
+            if last and existing is not None:
+                mts = [hl.read_matrix_table(existing, _intervals=intervals)] + mts
+            info(f'run_combiner: level {level + 1} of {len(levels)}: merging {len(mts)} inputs into {output}')
+            combine_gvcfs(mts).write(output, overwrite=overwrite or not last)
+            manifest.complete(output)
+        previous = outputs
+
+
 @typecheck(lgt=expr_call, la=expr_array(expr_int32))
 def lgt_to_gt(lgt, la):
     """A method for transforming Local GT and Local Alleles into the true GT"""
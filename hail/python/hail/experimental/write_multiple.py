@@ -1,10 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
-from hail import MatrixTable
+import hail as hl
+from hail import MatrixTable, Table
 from hail.linalg import BlockMatrix
 from hail.ir import MatrixMultiWrite, MatrixNativeMultiWriter, BlockMatrixMultiWrite, BlockMatrixBinaryMultiWriter, BlockMatrixTextMultiWriter
-from hail.typecheck import nullable, sequenceof, typecheck, enumeration
-from hail.utils.java import Env
+from hail.typecheck import nullable, sequenceof, typecheck, enumeration, oneof, anyfunc, anytype
+from hail.utils import new_temp_file
+from hail.utils.java import Env, info
+from hail.utils.temp_files import temp_files
 
 @typecheck(mts=sequenceof(MatrixTable),
            prefix=str,
@@ -34,3 +38,88 @@ def export_block_matrices(bms: List[BlockMatrix], prefix: str, overwrite: bool =
                           compression: Optional[str] = None):
     writer = BlockMatrixTextMultiWriter(prefix, overwrite, delimiter, header, add_index, compression)
     Env.backend().execute(BlockMatrixMultiWrite([bm._bmir for bm in bms], writer))
+
+
+@typecheck(dataset=oneof(Table, MatrixTable),
+           by=anyfunc,
+           exports=sequenceof(anyfunc),
+           values=nullable(sequenceof(anytype)),
+           parallelism=int,
+           checkpoint=bool)
+def export_multiple(dataset, by, exports, values=None, parallelism=4, checkpoint=True):
+    """Export a dataset to many outputs, split by the value of a row expression,
+    computing the dataset only once.
+
+    Examples
+    --------
+    Export a VCF and a PLINK fileset per contig:
+
+    >>> hl.experimental.export_multiple(  # doctest: +SKIP
+    ...     dataset,
+    ...     by=lambda mt: mt.locus.contig,
+    ...     exports=[lambda mt, contig: hl.export_vcf(mt, f'output/chr{contig}.vcf.bgz'),
+    ...              lambda mt, contig: hl.export_plink(mt, f'output/chr{contig}')])
+
+    Notes
+    -----
+    `dataset` is written once to a temporary file, and each export reads the
+    rows of one value of `by` from it, so the pipeline producing `dataset` is
+    not recomputed for every output. When `by` is a function of the row key,
+    such as the contig of a locus key, each export reads only the partitions
+    containing its rows.
+
+    Exports run concurrently, `parallelism` at a time, each as a separate
+    backend query. The temporary file is deleted when all exports are done.
+
+    Parameters
+    ----------
+    dataset : :class:`.Table` or :class:`.MatrixTable`
+        Dataset to export.
+    by : function ( :class:`.Table` or :class:`.MatrixTable` ) -> :class:`.Expression`
+        Function returning the row expression whose value routes each row to
+        its outputs.
+    exports : :obj:`list` of function ( :class:`.Table` or :class:`.MatrixTable`, value )
+        Functions exporting the rows with one value of `by`, such as
+        ``lambda t, v: t.export(f'out/{v}.tsv')``. Each is called with the
+        filtered dataset and the value.
+    values : :obj:`list`, optional
+        Values of `by` to export. By default, every non-missing value that
+        occurs.
+    parallelism : :obj:`int`
+        Maximum number of exports running at once.
+    checkpoint : :obj:`bool`
+        If ``False``, do not write `dataset` to a temporary file, for datasets
+        that are cheap to recompute, such as those read from disk.
+    """
+    if parallelism < 1:
+        raise ValueError(f"'export_multiple': 'parallelism' must be positive, found {parallelism}")
+
+    with temp_files().scope():
+        if checkpoint:
+            path = new_temp_file(suffix='mt' if isinstance(dataset, MatrixTable) else 'ht')
+            dataset = dataset.checkpoint(path)
+
+        if values is None:
+            if isinstance(dataset, MatrixTable):
+                values = dataset.aggregate_rows(hl.agg.collect_as_set(by(dataset)))
+            else:
+                values = dataset.aggregate(hl.agg.collect_as_set(by(dataset)))
+            # rows where `by` is missing are not exported
+            values = [v for v in values if v is not None]
+            try:
+                values = sorted(values)
+            except TypeError:
+                pass
+
+        def run(export, value):
+            if isinstance(dataset, MatrixTable):
+                subset = dataset.filter_rows(by(dataset) == value)
+            else:
+                subset = dataset.filter(by(dataset) == value)
+            export(subset, value)
+
+        info(f'export_multiple: running {len(exports) * len(values)} exports')
+        with ThreadPoolExecutor(max_workers=parallelism) as pool:
+            futures = [pool.submit(run, export, value) for value in values for export in exports]
+            for f in futures:
+                f.result()
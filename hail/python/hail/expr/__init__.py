@@ -2,7 +2,7 @@ from .types import *
 from .table_type import *
 from .matrix_type import *
 from .blockmatrix_type import *
-from .expressions import eval, eval_typed
+from .expressions import eval, eval_typed, eval_many, EvalBatch
 from .functions import *
 from .functions import _sort_by, _compare, _values_similar, _ndarray, _locus_windows_per_contig
 from .generic_summary import generic_summary
@@ -35,6 +35,8 @@ __all__ = ['HailType',
            'eval',
            'eval_typed',
            'eval_timed',
+           'eval_many',
+           'EvalBatch',
            'literal',
            'chi_squared_test',
            'cond',
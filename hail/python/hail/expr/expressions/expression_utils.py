@@ -139,12 +139,20 @@ def eval_timed(expression):
     expression : :class:`.Expression`
         Any expression, or a Python value that can be implicitly interpreted as an expression.
 
+    Notes
+    -----
+    Small expressions that do not refer to a :class:`.Table` or
+    :class:`.MatrixTable` and use only primitive, array, struct and tuple
+    operations are evaluated in Python without a backend query, in which case
+    the dictionary of timings is empty.
+
     Returns
     -------
     (Any, dict)
         Result of evaluating `expression` and a dictionary of the timings
     """
     from hail.utils.java import Env
+    from hail.ir.interpret import interpret, CannotInterpret
 
     analyze('eval_timed', expression, Indices(expression._indices.source))
 
@@ -153,7 +161,10 @@ def eval_timed(expression):
         expression_type = expression.dtype
         if ir_type != expression.dtype:
             raise ExpressionException(f'Expression type and IR type differed: \n{ir_type}\n vs \n{expression_type}')
-        return Env.backend().execute(expression._ir, True)
+        try:
+            return interpret(expression._ir), {}
+        except CannotInterpret:
+            return Env.backend().execute(expression._ir, True)
     else:
         uid = Env.get_uid()
         ir = expression._indices.source.select_globals(**{uid: expression}).index_globals()[uid]._ir
@@ -222,6 +233,149 @@ def eval_typed(expression):
     return eval(expression), expression.dtype
 
 
+@typecheck(expressions=expr_any)
+def eval_many(*expressions):
+    """Evaluate several Hail expressions in a single query, returning a list of
+    the results.
+
+    Examples
+    --------
+
+    >>> hl.eval_many(hl.len('Hail'), hl.cond(True, 'Even', 'Odd'))
+    [4, 'Even']
+
+    Notes
+    -----
+    Each call to :func:`.eval` executes a separate query. This method instead
+    fuses all `expressions`, including expressions referring to the globals of
+    one or more :class:`.Table` or :class:`.MatrixTable` objects, into one
+    tuple that is evaluated once. Expressions that are identical are evaluated
+    only once.
+
+    Like :func:`.eval`, the expressions must have no indices, but can refer to
+    the globals of a :class:`.Table` or :class:`.MatrixTable`.
+
+    Parameters
+    ----------
+    expressions : varargs of :class:`.Expression`
+        Any expressions, or Python values that can be implicitly interpreted as
+        expressions.
+
+    Returns
+    -------
+    :obj:`list`
+    """
+    from hail.utils.java import Env
+    import hail as hl
+
+    if len(expressions) == 0:
+        return []
+
+    for expression in expressions:
+        analyze('eval_many', expression, Indices(expression._indices.source))
+
+    sources = {}
+    # maps each expression to the position of its distinct representative:
+    # (None, i) for the i-th source-free expression, or (source_idx, uid) for
+    # a global expression of a Table or MatrixTable
+    positions = []
+    distinct = {}
+    free_exprs = []
+    source_globals = []
+    for expression in expressions:
+        source = expression._indices.source
+        key = (id(source), str(expression._ir))
+        if key not in distinct:
+            if source is None:
+                distinct[key] = (None, len(free_exprs))
+                free_exprs.append(expression)
+            else:
+                if id(source) not in sources:
+                    sources[id(source)] = len(source_globals)
+                    source_globals.append((source, {}))
+                source_idx = sources[id(source)]
+                uid = Env.get_uid()
+                source_globals[source_idx][1][uid] = expression
+                distinct[key] = (source_idx, uid)
+        positions.append(distinct[key])
+
+    indexed_globals = [source.select_globals(**fields).index_globals()
+                       for source, fields in source_globals]
+    free_results, globals_results = Env.backend().execute(
+        hl.tuple([hl.tuple(free_exprs), hl.tuple(indexed_globals)])._ir)
+
+    return [free_results[i] if source_idx is None else globals_results[source_idx][i]
+            for source_idx, i in positions]
+
+
+class EvalBatch(object):
+    """Deferred evaluation of expressions, all of which are computed by a single
+    query the first time any of their values is needed.
+
+    Examples
+    --------
+
+    >>> batch = hl.EvalBatch()
+    >>> n = batch.eval(hl.len('Hail'))
+    >>> parity = batch.eval(hl.cond(6 % 2 == 0, 'Even', 'Odd'))
+    >>> n.value, parity.value
+    (4, 'Even')
+
+    Notes
+    -----
+    Expressions added after a batch has been evaluated are evaluated together
+    the next time one of their values is requested. See :func:`.eval_many`.
+    """
+
+    class Deferred(object):
+        __slots__ = ('_batch', '_idx')
+
+        def __init__(self, batch, idx):
+            self._batch = batch
+            self._idx = idx
+
+        @property
+        def value(self):
+            """The value of the deferred expression, evaluating all of the
+            batch's pending expressions if necessary."""
+            return self._batch._value(self._idx)
+
+    def __init__(self):
+        self._pending = []
+        self._results = []
+
+    @typecheck_method(expression=expr_any)
+    def eval(self, expression) -> 'EvalBatch.Deferred':
+        """Add `expression` to the batch.
+
+        Parameters
+        ----------
+        expression : :class:`.Expression`
+            Any expression, or a Python value that can be implicitly interpreted
+            as an expression.
+
+        Returns
+        -------
+        :class:`.EvalBatch.Deferred`
+            Handle whose `value` is the result of evaluating `expression`.
+        """
+        analyze('EvalBatch.eval', expression, Indices(expression._indices.source))
+        self._pending.append(expression)
+        return EvalBatch.Deferred(self, len(self._results) + len(self._pending) - 1)
+
+    def evaluate(self):
+        """Evaluate all pending expressions in a single query."""
+        if self._pending:
+            results = eval_many(*self._pending)
+            self._results.extend(results)
+            self._pending = []
+
+    def _value(self, idx):
+        if idx >= len(self._results):
+            self.evaluate()
+        return self._results[idx]
+
+
 def _get_refs(expr: Expression, builder: Dict[str, Indices]) -> None:
     from hail.ir import GetField, TopLevelReference
 
@@ -1,5 +1,11 @@
+import math
+import random
+
 import hail as hl
 
+# normal quantile of the two-sided 95% intervals reported for sampled summaries
+_z = 1.96
+
 
 def pct(x):
     return f'{x*100:.2f}%'
@@ -35,7 +41,58 @@ def map_int(x):
         return int(x)
 
 
-def generic_summary(x, prefix='', skip_top=False):
+def sampled_partitions(n_partitions, partitions=None, seed=None, progressive=False):
+    """The partitions to summarize in each round, and the factor scaling
+    totals over them to estimates for all partitions.
+
+    Returns a list of ``(parts, scale)`` pairs. `parts` is ``None`` to read
+    every partition. If `progressive`, each round reads twice as many randomly
+    chosen partitions as the last, up to `partitions`.
+    """
+    if partitions is None or partitions >= n_partitions:
+        return [(None, None)]
+    if partitions < 1:
+        raise ValueError(f"'summarize': 'partitions' must be positive, found {partitions}")
+    chosen = random.Random(seed).sample(range(n_partitions), partitions)
+    sizes = [partitions]
+    if progressive:
+        while sizes[0] > 1:
+            sizes.insert(0, sizes[0] // 2)
+    return [(sorted(chosen[:k]), n_partitions / k) for k in sizes]
+
+
+def sampled_header(n_sampled, n_partitions):
+    """The line printed above a summary estimated from sampled partitions."""
+    return (f'Estimated from {n_sampled} of {n_partitions} partitions; ± gives 95% intervals '
+            f'that treat the sampled records as a simple random sample (SRS)')
+
+
+def _scale_counts(counts, scale):
+    return {k: int(round(v * scale)) for k, v in counts.items()}
+
+
+def _proportion_ci(x, n):
+    if n == 0:
+        return float('nan')
+    p = x / n
+    return _z * math.sqrt(p * (1 - p) / n)
+
+
+def _mean_ci(stats):
+    if not stats['n'] or stats['stdev'] is None:
+        return float('nan')
+    return _z * stats['stdev'] / math.sqrt(stats['n'])
+
+
+def generic_summary(x, prefix='', skip_top=False, scale=None):
+    """Aggregations summarizing `x`, and printers formatting their results.
+
+    If `scale` is set, the aggregations run over a sample of the records, and
+    counts and sums are printed as estimates for the whole dataset, scaled by
+    `scale`, with 95% confidence intervals for proportions and means. The
+    intervals treat the sampled records as a simple random sample and are
+    labeled SRS.
+    """
     computations = Computations()
     to_print = []
 
@@ -43,14 +100,30 @@ def generic_summary(x, prefix='', skip_top=False):
         return computations.append(agg)
 
     count = append_agg(hl.agg.count())
-    to_print.append(('(Summary)', {'Number of records': lambda results: format(results[count])}))
+    if scale is None:
+        to_print.append(('(Summary)', {'Number of records': lambda results: format(results[count])}))
+    else:
+        to_print.append(('(Summary)', {
+            'Number of records': lambda results: f'~{int(round(results[count] * scale))} '
+                                                 f'(estimated from {results[count]} sampled)'}))
+
+    def scaled_counts(i):
+        if scale is None:
+            return lambda results: format(results[i])
+        return lambda results: format(_scale_counts(results[i], scale))
 
     def recur_expr(expr, path):
         d = {}
         missingness = append_agg(hl.agg.count_where(hl.is_missing(expr)))
         d['type'] = lambda _: str(expr.dtype)
-        d['missing'] = lambda \
-                results: f'{results[missingness]} values ({pct(results[missingness] / results[count])})'
+        if scale is None:
+            d['missing'] = lambda \
+                    results: f'{results[missingness]} values ({pct(results[missingness] / results[count])})'
+        else:
+            d['missing'] = lambda results: (
+                f'~{int(round(results[missingness] * scale))} values '
+                f'({pct(results[missingness] / results[count])} '
+                f'± {pct(_proportion_ci(results[missingness], results[count]))} SRS)')
 
         t = expr.dtype
 
@@ -66,9 +139,13 @@ def generic_summary(x, prefix='', skip_top=False):
                 d['sum'] = lambda results: format(results[stats]['sum'])
             d['mean'] = lambda results: format(results[stats]['mean'])
             d['stdev'] = lambda results: format(results[stats]['stdev'])
+            if scale is not None:
+                to_sum = map_int if t in (hl.tint32, hl.tint64) else float
+                d['sum'] = lambda results: f"~{format(to_sum(results[stats]['sum'] * scale))}"
+                d['mean'] = lambda results: f"{format(results[stats]['mean'])} ± {format(_mean_ci(results[stats]))} SRS"
         elif t == hl.tbool:
             counter = append_agg(hl.agg.filter(hl.is_defined(expr), hl.agg.counter(expr)))
-            d['counts'] = lambda results: format(results[counter])
+            d['counts'] = scaled_counts(counter)
         elif t == hl.tstr:
             size = append_agg(hl.agg.stats(hl.len(expr)))
             take = append_agg(hl.agg.filter(hl.is_defined(expr), hl.agg.take(expr, 5)))
@@ -82,14 +159,19 @@ def generic_summary(x, prefix='', skip_top=False):
             n_hom_ref = append_agg(hl.agg.count_where(expr.is_hom_ref()))
             n_hom_var = append_agg(hl.agg.count_where(expr.is_hom_var()))
             n_het = append_agg(hl.agg.count_where(expr.is_het()))
-            d['homozygous reference'] = lambda results: format(results[n_hom_ref])
-            d['heterozygous'] = lambda results: format(results[n_het])
-            d['homozygous variant'] = lambda results: format(results[n_hom_var])
-            d['ploidy'] = lambda results: format(results[ploidy_counts])
-            d['phased'] = lambda results: format(results[phased_counts])
+            if scale is None:
+                d['homozygous reference'] = lambda results: format(results[n_hom_ref])
+                d['heterozygous'] = lambda results: format(results[n_het])
+                d['homozygous variant'] = lambda results: format(results[n_hom_var])
+            else:
+                d['homozygous reference'] = lambda results: f'~{int(round(results[n_hom_ref] * scale))}'
+                d['heterozygous'] = lambda results: f'~{int(round(results[n_het] * scale))}'
+                d['homozygous variant'] = lambda results: f'~{int(round(results[n_hom_var] * scale))}'
+            d['ploidy'] = scaled_counts(ploidy_counts)
+            d['phased'] = scaled_counts(phased_counts)
         elif isinstance(t, hl.tlocus):
             contig_counts = append_agg(hl.agg.filter(hl.is_defined(expr), hl.agg.counter(expr.contig)))
-            d['contig counts'] = lambda results: format(results[contig_counts])
+            d['contig counts'] = scaled_counts(contig_counts)
         elif isinstance(t, (hl.tset, hl.tdict, hl.tarray)):
             size = append_agg(hl.agg.stats(hl.len(expr)))
             d['minimum size'] = lambda results: format(map_int(results[size]['min']))
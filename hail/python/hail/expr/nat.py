@@ -19,6 +19,12 @@ class NatLiteral(NatBase):
     def __init__(self, n):
         self.n = n
 
+    def __eq__(self, other):
+        return isinstance(other, NatLiteral) and other.n == self.n
+
+    def __hash__(self):
+        return hash(self.n)
+
     def clear(self):
         pass
 
@@ -153,3 +153,81 @@ class TypeConstructor(NodeVisitor):
 
 
 type_node_visitor = TypeConstructor()
+
+
+# the parsable representation of types used by the backend and in the
+# metadata of native datasets, e.g. Struct{locus:Locus(GRCh37),GT:+Call}
+parsable_type_grammar = Grammar(
+    r"""
+    type = _ "+"? _ (array / ndarray / set / dict / struct / union / tuple / interval / int64 / int32 / float32 / float64 / bool / str / call / locus / void) _
+    void = "Void"
+    int64 = "Int64"
+    int32 = "Int32" / "Int"
+    float32 = "Float32"
+    float64 = "Float64"
+    bool = "Boolean"
+    call = "Call"
+    str = "String"
+    locus = "Locus" _ "(" identifier ")"
+    array = "Array" _ "[" type "]"
+    ndarray = "NDArray" _ "[" type "," nat "]"
+    set = "Set" _ "[" type "]"
+    dict = "Dict" _ "[" type "," type "]"
+    struct = "Struct" _ "{" (fields / _) "}"
+    union = "Union" _ "{" (fields / _) "}"
+    tuple = "Tuple" _ "[" ((type ("," type)*) / _) "]"
+    fields = field ("," field)*
+    field = identifier ":" type
+    interval = "Interval" _ "[" type "]"
+    table_type = _ "Table" _ "{" _ "global" _ ":" type "," _ "key" _ ":" (keys / _) "," _ "row" _ ":" type "}" _
+    matrix_type = _ "Matrix" _ "{" _ "global" _ ":" type "," _ "col_key" _ ":" keys "," _ "col" _ ":" type "," _ "row_key" _ ":" _ "[" keys ("," identifiers)? "]" _ "," _ "row" _ ":" type "," _ "entry" _ ":" type "}" _
+    keys = _ "[" (identifiers / _) "]" _
+    identifiers = identifier ("," identifier)*
+    identifier = _ (simple_identifier / escaped_identifier) _
+    simple_identifier = ~"\w+"
+    escaped_identifier = ~"`([^`\\\\]|\\\\.)*`"
+    nat = _ nat_literal _
+    nat_literal = ~"[0-9]+"
+    _ = ~"\s*"
+    """)
+
+
+class ParsableTypeConstructor(TypeConstructor):
+    def visit_type(self, node, visited_children):
+        _, required, _, [t], _ = visited_children
+        return t
+
+    def visit_table_type(self, node, visited_children):
+        (_, table, _, brace,
+         _, glob, _, colon, global_type, comma,
+         _, key, _, colon, [row_key], comma,
+         _, row, _, colon, row_type, brace, _) = visited_children
+        return hl.ttable(global_type, row_type, row_key)
+
+    def visit_matrix_type(self, node, visited_children):
+        (_, matrix, _, brace,
+         _, glob, _, colon, global_type, comma,
+         _, col_key_, _, colon, col_key, comma,
+         _, col, _, colon, col_type, comma,
+         _, row_key_, _, colon, _, bracket, row_key, maybe_rest_key, bracket, _, comma,
+         _, row, _, colon, row_type, comma,
+         _, entry, _, colon, entry_type, brace, _) = visited_children
+        if maybe_rest_key:
+            [(comma, rest_key)] = maybe_rest_key
+            row_key = row_key + rest_key
+        return hl.tmatrix(global_type, col_type, col_key, row_type, row_key, entry_type)
+
+    def visit_nat(self, node, visited_children):
+        _, nat, _ = visited_children
+        return nat
+
+    def visit_keys(self, node, visited_children):
+        _, bracket, [names], bracket, _ = visited_children
+        return names
+
+    def visit_identifiers(self, node, visited_children):
+        first, rest = visited_children
+        return [first] + [name for comma, name in rest]
+
+
+parsable_type_node_visitor = ParsableTypeConstructor()
@@ -1,6 +1,9 @@
 import abc
+import functools
 import json
 import math
+import threading
+import weakref
 from collections.abc import Mapping, Sequence
 
 import numpy as np
@@ -141,12 +144,72 @@ class HailTypeContext(object):
 
 _empty_context = HailTypeContext()
 
+# hash-consed types by their class and parameters
+_hash_consed = weakref.WeakValueDictionary()
+_hash_consed_lock = threading.Lock()
 
-class HailType(object):
+
+class _HashConsed(type):
+    """Metaclass of :class:`.HailType`.
+
+    A type whose parameters are all concrete is hash-consed: constructing it
+    returns the live instance equal to it, if there is one. Concrete types are
+    therefore equal exactly when they are identical, and their hash, string
+    forms and context are computed once. Types with type or dimension
+    variables are mutable while unifying and are never hash-consed.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        return _hash_cons(super().__call__(*args, **kwargs))
+
+
+class _HashConsedMapping(_HashConsed, abc.ABCMeta):
+    pass
+
+
+def _hash_cons(t):
+    key = t._hash_cons_key()
+    if key is None:
+        return t
+    with _hash_consed_lock:
+        consed = _hash_consed.get(key)
+        if consed is None:
+            t._concrete = True
+            t._hash = hash(key)
+            _hash_consed[key] = t
+            consed = t
+    return consed
+
+
+def _hash_consed_type(cls, *params):
+    return cls._from_hash_cons_params(*params)
+
+
+def _cached_if_concrete(f):
+    name = f'_cached{f.__name__}'
+
+    @functools.wraps(f)
+    def cached(self):
+        if self._hash is None:
+            return f(self)
+        s = self.__dict__.get(name)
+        if s is None:
+            s = f(self)
+            self.__dict__[name] = s
+        return s
+    return cached
+
+
+class HailType(object, metaclass=_HashConsed):
     """
     Hail type superclass.
     """
 
+    # True for the singleton primitive types and hash-consed types
+    _concrete = False
+    # the precomputed hash of hash-consed types
+    _hash = None
+
     def __init__(self):
         super(HailType, self).__init__()
         self._context = None
@@ -160,16 +223,64 @@ class HailType(object):
         return
 
     def __eq__(self, other):
-        return isinstance(other, HailType) and self._eq(other)
+        if self is other:
+            return True
+        if not isinstance(other, HailType):
+            return False
+        if self._hash is not None and other._hash is not None:
+            # distinct hash-consed types are never equal
+            return False
+        return self._eq(other)
 
     @abc.abstractmethod
     def __str__(self):
         return
 
     def __hash__(self):
-        # FIXME this is a bit weird
+        if self._hash is not None:
+            return self._hash
         return 43 + hash(str(self))
 
+    def _hash_cons_params(self):
+        """The parameters of a type that may be hash-consed, or ``None``."""
+        return None
+
+    @classmethod
+    def _from_hash_cons_params(cls, *params):
+        return cls(*params)
+
+    def _hash_cons_key(self):
+        params = self._hash_cons_params()
+        if params is None:
+            return None
+        key = [type(self)]
+        for p in params:
+            if isinstance(p, HailType):
+                if not p._concrete:
+                    return None
+                # concrete types are equal exactly when identical, and the
+                # hash-consed type keeps its parameters alive
+                key.append(id(p))
+            else:
+                key.append(p)
+        return tuple(key)
+
+    def __reduce_ex__(self, protocol):
+        params = self._hash_cons_params()
+        if params is not None:
+            # hash-consed again when unpickled
+            return _hash_consed_type, (type(self),) + params
+        if self._concrete:
+            # a primitive type, unpickled as its module-level singleton
+            return _primitive_names[type(self)]
+        return super().__reduce_ex__(protocol)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def pretty(self, indent=0, increment=4):
         """Returns a prettily formatted string representation of the type.
 
@@ -279,6 +390,8 @@ hail_type = oneof(HailType, transformed((str, dtype)))
 
 
 class _tvoid(HailType):
+    _concrete = True
+
     def __init__(self):
         super(_tvoid, self).__init__()
 
@@ -309,6 +422,8 @@ class _tint32(HailType):
     In Python, these are represented as :obj:`int`.
     """
 
+    _concrete = True
+
     def __init__(self):
         super(_tint32, self).__init__()
 
@@ -358,6 +473,8 @@ class _tint64(HailType):
     In Python, these are represented as :obj:`int`.
     """
 
+    _concrete = True
+
     def __init__(self):
         super(_tint64, self).__init__()
 
@@ -405,6 +522,8 @@ class _tfloat32(HailType):
     In Python, these are represented as :obj:`float`.
     """
 
+    _concrete = True
+
     def __init__(self):
         super(_tfloat32, self).__init__()
 
@@ -449,6 +568,8 @@ class _tfloat64(HailType):
     In Python, these are represented as :obj:`float`.
     """
 
+    _concrete = True
+
     def __init__(self):
         super(_tfloat64, self).__init__()
 
@@ -492,6 +613,8 @@ class _tstr(HailType):
     In Python, these are represented as strings.
     """
 
+    _concrete = True
+
     def __init__(self):
         super(_tstr, self).__init__()
 
@@ -524,6 +647,8 @@ class _tbool(HailType):
     In Python, these are represented as :obj:`bool`.
     """
 
+    _concrete = True
+
     def __init__(self):
         super(_tbool, self).__init__()
 
@@ -584,6 +709,11 @@ class tndarray(HailType):
         self._ndim = NatLiteral(ndim) if isinstance(ndim, int) else ndim
         super(tndarray, self).__init__()
 
+    def _hash_cons_params(self):
+        if not isinstance(self._ndim, NatLiteral):
+            return None
+        return self._element_type, self._ndim.n
+
     @property
     def element_type(self):
         """NDArray element type.
@@ -615,11 +745,12 @@ class tndarray(HailType):
     def _typecheck_one_level(self, annotation):
         raise NotImplementedError
 
+    @_cached_if_concrete
     def __str__(self):
         return "ndarray<{}, {}>".format(self.element_type, self.ndim)
 
     def _eq(self, other):
-        return isinstance(other, tndarray) and self.element_type == other.element_type
+        return isinstance(other, tndarray) and self.element_type == other.element_type and self._ndim == other._ndim
 
     def _pretty(self, l, indent, increment):
         l.append('ndarray<')
@@ -628,6 +759,7 @@ class tndarray(HailType):
         l.append(str(self.ndim))
         l.append('>')
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return f'NDArray[{self._element_type._parsable_string()},{self.ndim}]'
 
@@ -680,6 +812,9 @@ class tarray(HailType):
         self._element_type = element_type
         super(tarray, self).__init__()
 
+    def _hash_cons_params(self):
+        return self._element_type,
+
     @property
     def element_type(self):
         """Array element type.
@@ -701,6 +836,7 @@ class tarray(HailType):
             if not isinstance(annotation, Sequence):
                 raise TypeError("type 'array' expected Python 'list', but found type '%s'" % type(annotation))
 
+    @_cached_if_concrete
     def __str__(self):
         return "array<{}>".format(self.element_type)
 
@@ -712,6 +848,7 @@ class tarray(HailType):
         self.element_type._pretty(l, indent, increment)
         l.append('>')
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return "Array[" + self.element_type._parsable_string() + "]"
 
@@ -763,6 +900,9 @@ class tset(HailType):
         self._element_type = element_type
         super(tset, self).__init__()
 
+    def _hash_cons_params(self):
+        return self._element_type,
+
     @property
     def element_type(self):
         """Set element type.
@@ -784,6 +924,7 @@ class tset(HailType):
             if not isinstance(annotation, set):
                 raise TypeError("type 'set' expected Python 'set', but found type '%s'" % type(annotation))
 
+    @_cached_if_concrete
     def __str__(self):
         return "set<{}>".format(self.element_type)
 
@@ -795,6 +936,7 @@ class tset(HailType):
         self.element_type._pretty(l, indent, increment)
         l.append('>')
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return "Set[" + self.element_type._parsable_string() + "]"
 
@@ -848,6 +990,9 @@ class tdict(HailType):
         self._value_type = value_type
         super(tdict, self).__init__()
 
+    def _hash_cons_params(self):
+        return self._key_type, self._value_type
+
     @property
     def key_type(self):
         """Dict key type.
@@ -885,6 +1030,7 @@ class tdict(HailType):
             if not isinstance(annotation, dict):
                 raise TypeError("type 'dict' expected Python 'dict', but found type '%s'" % type(annotation))
 
+    @_cached_if_concrete
     def __str__(self):
         return "dict<{}, {}>".format(self.key_type, self.value_type)
 
@@ -898,6 +1044,7 @@ class tdict(HailType):
         self.value_type._pretty(l, indent, increment)
         l.append('>')
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return "Dict[{},{}]".format(self.key_type._parsable_string(), self.value_type._parsable_string())
 
@@ -929,7 +1076,7 @@ class tdict(HailType):
         return HailTypeContext.union(self.key_type, self.value_type)
 
 
-class tstruct(HailType, Mapping):
+class tstruct(HailType, Mapping, metaclass=_HashConsedMapping):
     """Hail type for structured groups of heterogeneous fields.
 
     In Python, these are represented as :class:`.Struct`.
@@ -950,6 +1097,29 @@ class tstruct(HailType, Mapping):
         self._fields = tuple(field_types)
         super(tstruct, self).__init__()
 
+    def _hash_cons_params(self):
+        return tuple(self._field_types.items())
+
+    def _hash_cons_key(self):
+        types = tuple(self._field_types.values())
+        if not all(t._concrete for t in types):
+            return None
+        return (tstruct, self._fields, tuple(map(id, types)))
+
+    @classmethod
+    def _from_hash_cons_params(cls, *fields):
+        return cls(**dict(fields))
+
+    @staticmethod
+    def _from_field_types(field_types):
+        # builds a struct from the fields of other structs without checking
+        # their types again
+        t = object.__new__(tstruct)
+        t._field_types = field_types
+        t._fields = tuple(field_types)
+        HailType.__init__(t)
+        return _hash_cons(t)
+
     @property
     def fields(self):
         """Struct field names.
@@ -991,6 +1161,16 @@ class tstruct(HailType, Mapping):
     def __len__(self):
         return len(self._fields)
 
+    def __contains__(self, item):
+        return item in self._field_types
+
+    def items(self):
+        return self._field_types.items()
+
+    def values(self):
+        return self._field_types.values()
+
+    @_cached_if_concrete
     def __str__(self):
         return "struct{{{}}}".format(
             ', '.join('{}: {}'.format(escape_parsable(f), str(t)) for f, t in self.items()))
@@ -1019,6 +1199,7 @@ class tstruct(HailType, Mapping):
         l.append(' ' * pre_indent)
         l.append('}')
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return "Struct{{{}}}".format(
             ','.join('{}:{}'.format(escape_parsable(f), t._parsable_string()) for f, t in self.items()))
@@ -1036,10 +1217,12 @@ class tstruct(HailType, Mapping):
                 all(x == y for x, y in zip(self._field_types.values(), other._field_types.values())))
 
     def _concat(self, other):
+        if not other._fields:
+            return self
         new_field_types = {}
         new_field_types.update(self._field_types)
         new_field_types.update(other._field_types)
-        return tstruct(**new_field_types)
+        return tstruct._from_field_types(new_field_types)
 
     def _insert(self, path, t):
         if not path:
@@ -1055,16 +1238,22 @@ class tstruct(HailType, Mapping):
         return self._insert_fields(**{field: typ})
 
     def _insert_fields(self, **new_fields):
+        if all(self._field_types.get(f) is t for f, t in new_fields.items()):
+            return self
         new_field_types = {}
         new_field_types.update(self._field_types)
         new_field_types.update(new_fields)
-        return tstruct(**new_field_types)
+        return tstruct._from_field_types(new_field_types)
 
     def _drop_fields(self, fields):
-        return tstruct(**{f: t for f, t in self.items() if f not in fields})
+        if not any(f in self._field_types for f in fields):
+            return self
+        return tstruct._from_field_types({f: t for f, t in self.items() if f not in fields})
 
     def _select_fields(self, fields):
-        return tstruct(**{f: self[f] for f in fields})
+        if tuple(fields) == self._fields:
+            return self
+        return tstruct._from_field_types({f: self._field_types[f] for f in fields})
 
     def _index_path(self, path):
         t = self
@@ -1086,7 +1275,7 @@ class tstruct(HailType, Mapping):
                 seen[f] = f0
                 new_field_types[f] = t
 
-        return tstruct(**new_field_types)
+        return tstruct._from_field_types(new_field_types)
 
     def unify(self, t):
         if not (isinstance(t, tstruct) and len(self) == len(t)):
@@ -1106,7 +1295,7 @@ class tstruct(HailType, Mapping):
     def _get_context(self):
         return HailTypeContext.union(*self.values())
 
-class tunion(HailType, Mapping):
+class tunion(HailType, Mapping, metaclass=_HashConsedMapping):
     @typecheck_method(case_types=hail_type)
     def __init__(self, **case_types):
         """Tagged union type.  Values of type union represent one of several
@@ -1123,6 +1312,19 @@ class tunion(HailType, Mapping):
         self._case_types = case_types
         self._cases = tuple(case_types)
 
+    def _hash_cons_params(self):
+        return tuple(self._case_types.items())
+
+    def _hash_cons_key(self):
+        types = tuple(self._case_types.values())
+        if not all(t._concrete for t in types):
+            return None
+        return (tunion, self._cases, tuple(map(id, types)))
+
+    @classmethod
+    def _from_hash_cons_params(cls, *cases):
+        return cls(**dict(cases))
+
     @property
     def cases(self):
 
@@ -1147,6 +1349,7 @@ class tunion(HailType, Mapping):
     def __len__(self):
         return len(self._cases)
 
+    @_cached_if_concrete
     def __str__(self):
         return "union{{{}}}".format(
             ', '.join('{}: {}'.format(escape_parsable(f), str(t)) for f, t in self.items()))
@@ -1175,6 +1378,7 @@ class tunion(HailType, Mapping):
         l.append(' ' * pre_indent)
         l.append('}')
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return "Union{{{}}}".format(
             ','.join('{}:{}'.format(escape_parsable(f), t._parsable_string()) for f, t in self.items()))
@@ -1218,6 +1422,9 @@ class ttuple(HailType):
         self._types = types
         super(ttuple, self).__init__()
 
+    def _hash_cons_params(self):
+        return self._types
+
     @property
     def types(self):
         """Tuple element types.
@@ -1245,6 +1452,7 @@ class ttuple(HailType):
     def __len__(self):
         return len(self._types)
 
+    @_cached_if_concrete
     def __str__(self):
         return "tuple({})".format(", ".join([str(t) for t in self.types]))
 
@@ -1267,6 +1475,7 @@ class ttuple(HailType):
         l.append(' ' * pre_indent)
         l.append(')')
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return "Tuple[{}]".format(",".join([t._parsable_string() for t in self.types]))
 
@@ -1301,6 +1510,8 @@ class _tcall(HailType):
     In Python, these are represented by :class:`.Call`.
     """
 
+    _concrete = True
+
     def __init__(self):
         super(_tcall, self).__init__()
 
@@ -1319,7 +1530,7 @@ class _tcall(HailType):
         return "Call"
 
     def _convert_from_json(self, x):
-        return hl.Call._from_java(hl.Call._call_jobject().parse(x))
+        return hl.Call._from_str(x)
 
     def _convert_to_json(self, x):
         return str(x)
@@ -1355,6 +1566,9 @@ class tlocus(HailType):
         self._rg = reference_genome
         super(tlocus, self).__init__()
 
+    def _hash_cons_params(self):
+        return self._rg,
+
     def _typecheck_one_level(self, annotation):
         if annotation is not None:
             if not isinstance(annotation, genetics.Locus):
@@ -1364,9 +1578,11 @@ class tlocus(HailType):
                 raise TypeError("type '{}' encountered Locus with reference genome {}"
                                 .format(self, repr(annotation.reference_genome)))
 
+    @_cached_if_concrete
     def __str__(self):
         return "locus<{}>".format(escape_parsable(str(self.reference_genome)))
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return "Locus({})".format(escape_parsable(str(self.reference_genome)))
 
@@ -1429,6 +1645,9 @@ class tinterval(HailType):
         self._point_type = point_type
         super(tinterval, self).__init__()
 
+    def _hash_cons_params(self):
+        return self._point_type,
+
     @property
     def point_type(self):
         """Interval point type.
@@ -1455,6 +1674,7 @@ class tinterval(HailType):
                 raise TypeError("type '{}' encountered Interval with point type {}"
                                 .format(self, repr(annotation.point_type)))
 
+    @_cached_if_concrete
     def __str__(self):
         return "interval<{}>".format(str(self.point_type))
 
@@ -1466,6 +1686,7 @@ class tinterval(HailType):
         self.point_type._pretty(l, indent, increment)
         l.append('>')
 
+    @_cached_if_concrete
     def _parsable_string(self):
         return "Interval[{}]".format(self.point_type._parsable_string())
 
@@ -1612,6 +1833,9 @@ See Also
 
 hts_entry_schema = tstruct(GT=tcall, AD=tarray(tint32), DP=tint32, GQ=tint32, PL=tarray(tint32))
 
+_primitive_names = {_tvoid: 'tvoid', _tint32: 'tint32', _tint64: 'tint64', _tfloat32: 'tfloat32',
+                    _tfloat64: 'tfloat64', _tstr: 'tstr', _tbool: 'tbool', _tcall: 'tcall'}
+
 _numeric_types = {_tbool, _tint32, _tint64, _tfloat32, _tfloat64}
 _primitive_types = _numeric_types.union({_tstr})
 _interned_types = _primitive_types.union({_tcall})
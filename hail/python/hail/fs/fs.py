@@ -1,7 +1,10 @@
 import abc
+import fnmatch
 import sys
 import os
-from typing import Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Tuple
 
 from hail.utils.java import Env, info
 from hail.utils import local_path_uri
@@ -36,6 +39,81 @@ class FS(abc.ABC):
     def ls(self, path: str) -> List[Dict]:
         pass
 
+    @abc.abstractmethod
+    def remove(self, path: str):
+        pass
+
+    @abc.abstractmethod
+    def rmtree(self, path: str):
+        pass
+
+    def copy_many(self, pairs: Iterable[Tuple[str, str]], parallelism: int = 16, retries: int = 3):
+        """Copy each ``(src, dest)`` of `pairs`, `parallelism` at a time."""
+        self._map('copied', lambda pair: self.copy(*pair), pairs, parallelism, retries)
+
+    def stat_many(self, paths: Iterable[str], parallelism: int = 16, retries: int = 3) -> List[Dict]:
+        """The :meth:`stat` of each of `paths`, in order."""
+        return self._map('statted', self.stat, paths, parallelism, retries)
+
+    def rm_many(self, paths: Iterable[str], parallelism: int = 16, retries: int = 3):
+        """Remove each of the files `paths`."""
+        self._map('removed', self.remove, paths, parallelism, retries)
+
+    def ls_recursive(self, path: str, pattern: str = None, parallelism: int = 16, retries: int = 3) -> List[Dict]:
+        """The files under the directory `path`, at any depth, whose names
+        match the glob `pattern`, if given. The directories of each level are
+        listed in parallel."""
+        files = []
+        dirs = [path]
+        while dirs:
+            listings = self._map('listed', self.ls, dirs, parallelism, retries)
+            dirs = []
+            for listing in listings:
+                for entry in listing:
+                    if entry['is_dir']:
+                        dirs.append(entry['path'])
+                    elif pattern is None or fnmatch.fnmatchcase(os.path.basename(entry['path']), pattern):
+                        files.append(entry)
+        return files
+
+    @staticmethod
+    def _map(action: str, f: Callable, items: Iterable, parallelism: int, retries: int) -> List:
+        # runs f on each item on a thread pool, retrying failures other than
+        # missing files with exponential backoff, and logs progress of large
+        # batches every tenth of the way
+        items = list(items)
+        n = len(items)
+        if n == 0:
+            return []
+
+        def run(item):
+            delay = 0.1
+            for attempt in range(retries + 1):
+                try:
+                    return f(item)
+                except FileNotFoundError:
+                    raise
+                except Exception:  # pylint: disable=broad-except
+                    if attempt == retries:
+                        raise
+                    time.sleep(delay)
+                    delay = min(delay * 2, 2.0)
+
+        results = [None] * n
+        with ThreadPoolExecutor(max_workers=min(parallelism, n)) as pool:
+            futures = {pool.submit(run, item): i for i, item in enumerate(items)}
+            step = max(n // 10, 1) if n >= 1000 else n
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    if done % step == 0 and done < n:
+                        info(f'{action} {done} of {n} files')
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+
     def copy_log(self, path: str) -> None:
         log = Env.hc()._log
         try:
@@ -3,7 +3,7 @@ from stat import S_ISREG, S_ISDIR
 from typing import Dict, List
 import gcsfs
 from hurry.filesize import size
-from shutil import copy2
+from shutil import copy2, rmtree
 
 from .fs import FS
 
@@ -119,6 +119,19 @@ class GoogleCloudStorageFS(FS):
         is_local = self._is_local(path)
 
         if is_local:
-            return [self._format_stat_local_file(os.stat(file), file) for file in os.listdir(path)]
+            return [self._format_stat_local_file(os.stat(os.path.join(path, file)), os.path.join(path, file))
+                    for file in os.listdir(path)]
 
         return [self._format_stat_gs_file(file) for file in self.client.ls(path, detail=True)]
+
+    def remove(self, path: str):
+        if self._is_local(path):
+            os.remove(path)
+        else:
+            self.client.rm(path)
+
+    def rmtree(self, path: str):
+        if self._is_local(path):
+            rmtree(path)
+        else:
+            self.client.rm(path, recursive=True)
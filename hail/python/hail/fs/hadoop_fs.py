@@ -1,5 +1,7 @@
 import io
 import json
+import queue
+import threading
 from typing import Dict, List
 
 from .fs import FS
@@ -39,22 +41,94 @@ class HadoopFS(FS):
         r = Env.jutils().ls(path, Env.hc()._jhc)
         return json.loads(r)
 
+    def remove(self, path: str):
+        Env.hc()._jhc.sFS().delete(path, False)
+
+    def rmtree(self, path: str):
+        Env.hc()._jhc.sFS().delete(path, True)
+
+
+# HadoopReader reads chunks of MIN_CHUNK_SIZE bytes (or the requested buffer
+# size, if larger), doubling up to MAX_CHUNK_SIZE as a file is read, and keeps
+# up to PREFETCH_CHUNKS chunks ahead of the reader
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+PREFETCH_CHUNKS = 4
+
+# HadoopWriter sends writes to the JVM in chunks of WRITE_CHUNK_SIZE bytes,
+# with up to WRITE_BEHIND_CHUNKS chunks waiting to be written
+WRITE_CHUNK_SIZE = 1024 * 1024
+WRITE_BEHIND_CHUNKS = 4
+
 
 class HadoopReader(io.RawIOBase):
     def __init__(self, path, buffer_size):
-        self._jfile = Env.jutils().readFile(path, Env.hc()._jhc, buffer_size)
+        self._chunk_size = min(max(buffer_size, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+        self._jfile = Env.jutils().readFile(path, Env.hc()._jhc, MAX_CHUNK_SIZE)
         super(HadoopReader, self).__init__()
+        self._chunks = queue.Queue(maxsize=PREFETCH_CHUNKS)
+        self._stopped = threading.Event()
+        self._thread = None
+        self._chunk = memoryview(b'')
+        self._pos = 0
+        self._eof = False
+        self._error = None
+
+    def _prefetch(self):
+        chunk_size = self._chunk_size
+        try:
+            while True:
+                chunk = self._jfile.read(chunk_size)
+                if not self._put(chunk) or len(chunk) == 0:
+                    return
+                chunk_size = min(2 * chunk_size, MAX_CHUNK_SIZE)
+        except Exception as e:  # pylint: disable=broad-except
+            # raised by readinto
+            self._put(e)
+
+    def _put(self, x):
+        while not self._stopped.is_set():
+            try:
+                self._chunks.put(x, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
 
     def close(self):
+        if self.closed:
+            return
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
         self._jfile.close()
+        super(HadoopReader, self).close()
 
     def readable(self):
         return True
 
     def readinto(self, b):
-        b_from_java = self._jfile.read(len(b))
-        n_read = len(b_from_java)
-        b[:n_read] = b_from_java
+        if self._pos == len(self._chunk):
+            if self._error is not None:
+                raise self._error
+            if self._eof:
+                return 0
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._prefetch, daemon=True)
+                self._thread.start()
+            chunk = self._chunks.get()
+            if isinstance(chunk, Exception):
+                # the prefetch thread has stopped, so keep raising
+                self._error = chunk
+                raise chunk
+            if len(chunk) == 0:
+                self._eof = True
+                return 0
+            self._chunk = memoryview(chunk)
+            self._pos = 0
+        n_read = min(len(b), len(self._chunk) - self._pos)
+        b[:n_read] = self._chunk[self._pos:self._pos + n_read]
+        self._pos += n_read
         return n_read
 
 
@@ -62,16 +136,60 @@ class HadoopWriter(io.RawIOBase):
     def __init__(self, path, exclusive=False):
         self._jfile = Env.jutils().writeFile(path, Env.hc()._jhc, exclusive)
         super(HadoopWriter, self).__init__()
+        self._buffer = bytearray()
+        self._chunks = queue.Queue(maxsize=WRITE_BEHIND_CHUNKS)
+        self._error = None
+        self._thread = threading.Thread(target=self._write_behind, daemon=True)
+        self._thread.start()
+
+    def _write_behind(self):
+        while True:
+            chunk = self._chunks.get()
+            try:
+                if chunk is None:
+                    return
+                if self._error is None:
+                    self._jfile.write(chunk)
+            except Exception as e:  # pylint: disable=broad-except
+                # raised by every later write, flush and close; later
+                # chunks are dropped
+                self._error = e
+            finally:
+                self._chunks.task_done()
+
+    def _check_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _send(self):
+        if self._buffer:
+            chunk, self._buffer = self._buffer, bytearray()
+            self._chunks.put(chunk)
 
     def writable(self):
         return True
 
     def close(self):
-        self._jfile.close()
+        if self.closed:
+            return
+        try:
+            # flushes
+            super(HadoopWriter, self).close()
+        finally:
+            self._chunks.put(None)
+            self._thread.join()
+            self._jfile.close()
+        self._check_error()
 
     def flush(self):
+        self._send()
+        self._chunks.join()
+        self._check_error()
         self._jfile.flush()
 
     def write(self, b):
-        self._jfile.write(bytearray(b))
+        self._check_error()
+        self._buffer += b
+        if len(self._buffer) >= WRITE_CHUNK_SIZE:
+            self._send()
         return len(b)
@@ -1,7 +1,63 @@
+import math
+
+import numpy as np
+
 from hail.typecheck import *
 from hail.utils.java import *
 
 
+def _diploid_gt_index(j, k):
+    return k * (k + 1) // 2 + j
+
+
+def _allele_pair(i):
+    # inverse of _diploid_gt_index, as in Genotype.allelePairSqrt
+    k = int(math.sqrt(8 * i + 1) / 2 - 0.5)
+    while k * (k + 1) // 2 > i:
+        k -= 1
+    while (k + 1) * (k + 2) // 2 <= i:
+        k += 1
+    return i - k * (k + 1) // 2, k
+
+
+def _pack(alleles, phased):
+    """The packed int representation of a call used by the backend: bit 0 is
+    phased, bits 1-2 the ploidy, and the remaining bits the allele
+    representation."""
+    ploidy = len(alleles)
+    if any(a < 0 for a in alleles):
+        raise ValueError(f'allele indices must be >= 0, found {alleles}')
+    if ploidy == 0:
+        ar = 0
+    elif ploidy == 1:
+        ar = alleles[0]
+    elif phased:
+        ar = _diploid_gt_index(alleles[0], alleles[0] + alleles[1])
+    else:
+        ar = _diploid_gt_index(min(alleles), max(alleles))
+    if ar >> 29 != 0:
+        raise ValueError(f'invalid allele representation: {ar}. Max value is 2^29 - 1')
+    return int(phased) | (ploidy << 1) | (ar << 3)
+
+
+def _parse(s):
+    # the call grammar of Parser.parseCall
+    if s == '-':
+        return [], False
+    if s == '|-':
+        return [], True
+    if s.startswith('|'):
+        return [int(s[1:])], True
+    if '/' in s:
+        return [int(a) for a in s.split('/')], False
+    if '|' in s:
+        return [int(a) for a in s.split('|')], True
+    return [int(s)], False
+
+
+_parse_cache = {}
+_max_parse_cache_size = 1 << 16
+
 class Call(object):
     """
     An object that represents an individual's call at a genomic locus.
@@ -26,36 +82,45 @@ class Call(object):
      - :func:`.parse_call`
     """
 
-    _cached_jobject = None
-
-    @staticmethod
-    def _call_jobject():
-        if not Call._cached_jobject:
-            Call._cached_jobject = scala_object(Env.hail().variant, 'Call')
-        return Call._cached_jobject
+    __slots__ = ['_call']
 
     @typecheck_method(alleles=sequenceof(int),
                       phased=bool)
     def __init__(self, alleles, phased=False):
         if len(alleles) > 2:
             raise NotImplementedError("Calls with greater than 2 alleles are not supported.")
-        self._phased = phased
-        self._alleles = alleles
-        self._ploidy = len(alleles)
-        self._call = scala_object(Env.hail().variant, 'CallN').apply(alleles, phased)
+        self._call = _pack(alleles, phased)
 
     @classmethod
-    def _from_java(cls, jc):
-        c = Call.__new__(cls)
-        c._call = jc
-        c._alleles = None
-        c._phased = None
-        c._ploidy = None
-        super(Call, c).__init__()
-        return c
+    def _from_int(cls, c):
+        call = Call.__new__(cls)
+        call._call = c
+        return call
+
+    @classmethod
+    def _from_str(cls, s):
+        """Parse the string representation of a call. Calls are immutable, so
+        equal strings share one :class:`.Call`."""
+        call = _parse_cache.get(s)
+        if call is None:
+            alleles, phased = _parse(s)
+            if len(alleles) > 2:
+                raise NotImplementedError("Calls with greater than 2 alleles are not supported.")
+            call = cls._from_int(_pack(alleles, phased))
+            if len(_parse_cache) < _max_parse_cache_size:
+                _parse_cache[s] = call
+        return call
 
     def __str__(self):
-        return Call._call_jobject().toString(self._call)
+        sep = '|' if self.phased else '/'
+        ploidy = self.ploidy
+        if ploidy == 0:
+            return '|-' if self.phased else '-'
+        if ploidy == 1:
+            a = self._call >> 3
+            return f'|{a}' if self.phased else f'{a}'
+        j, k = self.alleles
+        return f'{j}{sep}{k}'
 
     def __repr__(self):
         return 'Call(alleles=%s, phased=%s)' % (self.alleles, self.phased)
@@ -76,6 +141,12 @@ class Call(object):
         """
         return self.alleles[item]
 
+    def _allele_pair(self):
+        j, k = _allele_pair(self._call >> 3)
+        if self.phased:
+            return j, k - j
+        return j, k
+
     @property
     def alleles(self):
         """Get the alleles of this call.
@@ -84,10 +155,12 @@ class Call(object):
         -------
         :obj:`list` of :obj:`int`
         """
-
-        if self._alleles is None:
-            self._alleles = jarray_to_list(Call._call_jobject().alleles(self._call))
-        return self._alleles
+        ploidy = self.ploidy
+        if ploidy == 0:
+            return []
+        if ploidy == 1:
+            return [self._call >> 3]
+        return list(self._allele_pair())
 
     @property
     def ploidy(self):
@@ -97,10 +170,7 @@ class Call(object):
         -------
         :obj:`int`
         """
-
-        if not self._ploidy:
-            self._ploidy = Call._call_jobject().ploidy(self._call)
-        return self._ploidy
+        return (self._call >> 1) & 0x3
 
     @property
     def phased(self):
@@ -110,82 +180,85 @@ class Call(object):
         -------
         :obj:`bool`
         """
-
-        if not self._phased:
-            self._phased = Call._call_jobject().isPhased(self._call)
-        return self._phased
+        return (self._call & 0x1) == 1
 
     def is_haploid(self):
         """True if the ploidy == 1.
 
         :rtype: bool
         """
-
-        return Call._call_jobject().isHaploid(self._call)
+        return self.ploidy == 1
 
     def is_diploid(self):
         """True if the ploidy == 2.
 
         :rtype: bool
         """
-
-        return Call._call_jobject().isDiploid(self._call)
+        return self.ploidy == 2
 
     def is_hom_ref(self):
         """True if the call has no alternate alleles.
 
         :rtype: bool
         """
-
-        return Call._call_jobject().isHomRef(self._call)
+        return self.ploidy > 0 and self._call >> 3 == 0
 
     def is_het(self):
         """True if the call contains two different alleles.
 
         :rtype: bool
         """
-
-        return Call._call_jobject().isHet(self._call)
+        if self.ploidy != 2 or self._call >> 3 == 0:
+            return False
+        j, k = self._allele_pair()
+        return j != k
 
     def is_hom_var(self):
         """True if the call contains two identical alternate alleles.
 
         :rtype: bool
         """
-
-        return Call._call_jobject().isHomVar(self._call)
+        ploidy = self.ploidy
+        if ploidy == 0 or self._call >> 3 == 0:
+            return False
+        if ploidy == 1:
+            return True
+        j, k = self._allele_pair()
+        return j == k
 
     def is_non_ref(self):
         """True if the call contains any non-reference alleles.
 
         :rtype: bool
         """
-
-        return Call._call_jobject().isNonRef(self._call)
+        return self.ploidy > 0 and self._call >> 3 > 0
 
     def is_het_non_ref(self):
         """True if the call contains two different alternate alleles.
 
         :rtype: bool
         """
-
-        return Call._call_jobject().isHetNonRef(self._call)
+        if self.ploidy != 2 or self._call >> 3 == 0:
+            return False
+        j, k = self._allele_pair()
+        return j > 0 and k > 0 and j != k
 
     def is_het_ref(self):
         """True if the call contains one reference and one alternate allele.
 
         :rtype: bool
         """
-
-        return Call._call_jobject().isHetRef(self._call)
+        if self.ploidy != 2 or self._call >> 3 == 0:
+            return False
+        j, k = self._allele_pair()
+        return (j == 0 and k > 0) or (k == 0 and j > 0)
 
     def n_alt_alleles(self):
         """Returns the count of non-reference alleles.
 
         :rtype: int
         """
-
-        return Call._call_jobject().nNonRefAlleles(self._call)
+        return sum(1 for a in self.alleles if a != 0)
 
     @typecheck_method(n_alleles=int)
     def one_hot_alleles(self, n_alleles):
@@ -222,7 +295,11 @@ class Call(object):
         -------
         :obj:`list` of :obj:`int`
         """
-        return jiterable_to_list(Call._call_jobject().oneHotAlleles(self._call, n_alleles))
+        result = [0] * n_alleles
+        for a in self.alleles:
+            if a < n_alleles:
+                result[a] += 1
+        return result
 
     def unphased_diploid_gt_index(self):
         """Return the genotype index for unphased, diploid calls.
@@ -235,4 +312,76 @@ class Call(object):
         if self.ploidy != 2 or self.phased:
             raise FatalError(
                 "'unphased_diploid_gt_index' is only valid for unphased, diploid calls. Found {}.".format(repr(self)))
-        return Call._call_jobject().unphasedDiploidGtIndex(self._call)
+        return self._call >> 3
+
+
+def pack_calls(calls):
+    """Pack calls into a NumPy array of the backend's int representation.
+
+    Parameters
+    ----------
+    calls : :obj:`list` of :class:`.Call`
+        Calls, with ``None`` for missing calls.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        ``int32`` array of the calls' packed ints, as signed ints as on the
+        JVM, with -1 for missing calls. -1 has ploidy bits 3, so no call
+        packs to it.
+    """
+    return np.fromiter((-1 if c is None else _signed_int32(c._call) for c in calls),
+                       dtype=np.int32, count=len(calls))
+
+
+def _signed_int32(c):
+    # packed calls use all 32 bits once the allele representation is >= 2^28
+    return c - (1 << 32) if c >= 1 << 31 else c
+
+
+def unpack_calls(packed):
+    """Decode an array from :func:`pack_calls` with NumPy.
+
+    Examples
+    --------
+
+    >>> from hail.genetics.call import pack_calls, unpack_calls
+    >>> ploidy, phased, alleles = unpack_calls(pack_calls([hl.Call([0, 1]), None, hl.Call([2], phased=True)]))
+    >>> alleles.tolist()
+    [[0, 1], [-1, -1], [2, -1]]
+    >>> (alleles > 0).sum(axis=1).tolist()
+    [1, 0, 1]
+
+    Parameters
+    ----------
+    packed : :class:`numpy.ndarray`
+        Packed calls.
+
+    Returns
+    -------
+    (:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        The ploidy of each call, -1 if missing, whether each call is phased,
+        and an array with two columns of alleles, -1 where a call has fewer
+        alleles or is missing.
+    """
+    packed = np.asarray(packed, dtype=np.int64)
+    missing = packed == -1
+    c = np.where(missing, 0, packed & 0xFFFFFFFF)
+    phased = (c & 0x1) == 1
+    ploidy = (c >> 1) & 0x3
+    ar = c >> 3
+
+    # inverse of the diploid genotype index, as in _allele_pair
+    k = np.floor(np.sqrt(8 * ar + 1) / 2 - 0.5).astype(np.int64)
+    k -= k * (k + 1) // 2 > ar
+    k += (k + 1) * (k + 2) // 2 <= ar
+    j = ar - k * (k + 1) // 2
+    k = np.where(phased, k - j, k)
+
+    alleles = np.full((len(c), 2), -1, dtype=np.int32)
+    haploid = ploidy == 1
+    diploid = ploidy == 2
+    alleles[haploid, 0] = ar[haploid]
+    alleles[diploid, 0] = j[diploid]
+    alleles[diploid, 1] = k[diploid]
+    return np.where(missing, -1, ploidy), phased & ~missing, alleles
@@ -3,6 +3,7 @@ import json
 
 from ..typecheck import *
 from ..utils.misc import escape_str
+from ..utils.temp_files import temp_files
 
 
 class BlockMatrixReader(object):
@@ -14,11 +15,20 @@ class BlockMatrixReader(object):
     def __eq__(self, other):
         pass
 
+    def input_paths(self):
+        """The paths of the files this reader reads, or ``None`` if they are
+        not known."""
+        return None
+
 
 class BlockMatrixNativeReader(BlockMatrixReader):
     @typecheck_method(path=str)
     def __init__(self, path):
         self.path = path
+        temp_files().attach(path, self)
+
+    def input_paths(self):
+        return [self.path]
 
     def render(self):
         reader = {'name': 'BlockMatrixNativeReader',
@@ -34,9 +44,13 @@ class BlockMatrixBinaryReader(BlockMatrixReader):
     @typecheck_method(path=str, shape=sequenceof(int), block_size=int)
     def __init__(self, path, shape, block_size):
         self.path = path
+        temp_files().attach(path, self)
         self.shape = shape
         self.block_size = block_size
 
+    def input_paths(self):
+        return [self.path]
+
     def render(self):
         reader = {'name': 'BlockMatrixBinaryReader',
                   'path': self.path,
@@ -0,0 +1,364 @@
+import math
+import operator
+
+from hail.expr.types import tint32, tint64, tfloat64, tbool, tstr, tarray, tset, tdict, tstruct, ttuple
+from hail.utils.struct import Struct
+from . import ir
+
+
+class CannotInterpret(Exception):
+    """Raised when an IR is outside the subset of value IR (or the budget)
+    that :func:`interpret` evaluates in Python."""
+    pass
+
+
+def _wrap(x, bits):
+    half = 1 << (bits - 1)
+    return ((x + half) % (1 << bits)) - half
+
+
+def _floor_divide(l, r):
+    if isinstance(l, float):
+        # the backend computes floor(l / r), which can differ from Python's
+        # float floor division
+        q = l / r
+        return float(math.floor(q)) if math.isfinite(q) else q
+    return l // r
+
+
+_arithmetic_ops = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '//': _floor_divide,
+}
+
+_comparison_ops = {
+    'EQ': operator.eq, '==': operator.eq,
+    'NEQ': operator.ne, '!=': operator.ne,
+    'LT': operator.lt, '<': operator.lt,
+    'LTEQ': operator.le, '<=': operator.le,
+    'GT': operator.gt, '>': operator.gt,
+    'GTEQ': operator.ge, '>=': operator.ge,
+}
+
+_primitive_types = {tint32, tint64, tfloat64, tbool, tstr}
+
+
+def _is_ascii(s):
+    try:
+        s.encode('ascii')
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+def _is_supported_type(t):
+    if t in _primitive_types:
+        return True
+    if isinstance(t, (tarray, tset)):
+        return _is_supported_type(t.element_type)
+    if isinstance(t, tdict):
+        return _is_supported_type(t.key_type) and _is_supported_type(t.value_type)
+    if isinstance(t, tstruct):
+        return all(_is_supported_type(ft) for ft in t.values())
+    if isinstance(t, ttuple):
+        return all(_is_supported_type(et) for et in t.types)
+    return False
+
+
+class _Interpreter(object):
+    def __init__(self, max_steps):
+        self.steps = max_steps
+
+    def step(self, n=1):
+        self.steps -= n
+        if self.steps < 0:
+            raise CannotInterpret('evaluation budget exceeded')
+
+    def __call__(self, x, env):
+        self.step()
+        f = _dispatch.get(type(x))
+        if f is None:
+            raise CannotInterpret(type(x).__name__)
+        return f(self, x, env)
+
+    def typ(self, x):
+        if x._type is None:
+            raise CannotInterpret('untyped IR')
+        return x._type
+
+    def constant(self, x, env):
+        return x.x
+
+    def f64(self, x, env):
+        return float(x.x)
+
+    def true(self, x, env):
+        return True
+
+    def false(self, x, env):
+        return False
+
+    def na(self, x, env):
+        return None
+
+    def literal(self, x, env):
+        if not _is_supported_type(x._typ):
+            raise CannotInterpret(str(x._typ))
+        json = x._typ._convert_to_json_na(x.value)
+        self.step(len(json) if isinstance(json, list) else 1)
+        # round trip through JSON so the value has the same representation
+        # as one decoded from the backend
+        return x._typ._convert_from_json_na(json)
+
+    def cast(self, x, env):
+        from_t = self.typ(x.v)
+        to_t = x.typ
+        v = self(x.v, env)
+        if from_t == to_t:
+            return v
+        if v is None:
+            return None
+        if from_t == tint32 and to_t == tint64:
+            return v
+        if from_t in (tint32, tint64) and to_t == tfloat64:
+            return float(v)
+        raise CannotInterpret(f'cast from {from_t} to {to_t}')
+
+    def is_na(self, x, env):
+        return self(x.value, env) is None
+
+    def if_(self, x, env):
+        cond = self(x.cond, env)
+        if cond is None:
+            return None
+        return self(x.cnsq, env) if cond else self(x.altr, env)
+
+    def coalesce(self, x, env):
+        for v in x.values:
+            v = self(v, env)
+            if v is not None:
+                return v
+        return None
+
+    def let(self, x, env):
+        value = self(x.value, env)
+        return self(x.body, {**env, x.name: value})
+
+    def ref(self, x, env):
+        if x.name not in env:
+            raise CannotInterpret(f'free variable {x.name}')
+        return env[x.name]
+
+    def binary_op(self, x, env):
+        t = self.typ(x)
+        # '/' on integers produces float32, which is not supported
+        if x.op not in _arithmetic_ops or t not in (tint32, tint64, tfloat64):
+            raise CannotInterpret(f'{x.op} on {t}')
+        l = self(x.l, env)
+        r = self(x.r, env)
+        if l is None or r is None:
+            return None
+        if x.op in ('/', '//') and r == 0:
+            # let the backend produce its own error or non-finite result
+            raise CannotInterpret('division by zero')
+        result = _arithmetic_ops[x.op](l, r)
+        if t == tint32:
+            return _wrap(result, 32)
+        if t == tint64:
+            return _wrap(result, 64)
+        return float(result)
+
+    def unary_op(self, x, env):
+        t = self.typ(x)
+        v = self(x.x, env)
+        if x.op == '!' and t == tbool:
+            return None if v is None else not v
+        if x.op == '-' and t in (tint32, tint64, tfloat64):
+            if v is None:
+                return None
+            if t == tfloat64:
+                return -v
+            return _wrap(-v, 32 if t == tint32 else 64)
+        raise CannotInterpret(f'{x.op} on {t}')
+
+    def comparison_op(self, x, env):
+        lt = self.typ(x.l)
+        if x.op not in _comparison_ops or lt not in _primitive_types or self.typ(x.r) != lt:
+            raise CannotInterpret(f'{x.op} on {lt}')
+        l = self(x.l, env)
+        r = self(x.r, env)
+        if l is None or r is None:
+            return None
+        if lt == tstr and x.op not in ('EQ', '==', 'NEQ', '!=') and not (_is_ascii(l) and _is_ascii(r)):
+            # the JVM orders strings by UTF-16 code unit
+            raise CannotInterpret('non-ASCII string ordering')
+        return _comparison_ops[x.op](l, r)
+
+    def apply(self, x, env):
+        f = _functions.get(x.function)
+        if f is None:
+            raise CannotInterpret(f'function {x.function}')
+        return f(self, x, env)
+
+    def to_int64(self, x, env):
+        if self.typ(x.args[0]) not in (tint32, tint64):
+            raise CannotInterpret(f'toInt64 on {self.typ(x.args[0])}')
+        return self(x.args[0], env)
+
+    def to_float64(self, x, env):
+        if self.typ(x.args[0]) not in (tint32, tint64, tfloat64):
+            raise CannotInterpret(f'toFloat64 on {self.typ(x.args[0])}')
+        v = self(x.args[0], env)
+        return None if v is None else float(v)
+
+    def index_array(self, x, env):
+        return self.index(self(x.args[0], env), self(x.args[1], env))
+
+    def index(self, a, i):
+        if a is None or i is None:
+            return None
+        if not 0 <= i < len(a):
+            # the backend owns the error message
+            raise CannotInterpret('index out of bounds')
+        return a[i]
+
+    def make_array(self, x, env):
+        return [self(a, env) for a in x.args]
+
+    def array_ref(self, x, env):
+        return self.index(self(x.a, env), self(x.i, env))
+
+    def array_len(self, x, env):
+        a = self(x.a, env)
+        return None if a is None else len(a)
+
+    def array_range(self, x, env):
+        start = self(x.start, env)
+        stop = self(x.stop, env)
+        step = self(x.step, env)
+        if start is None or stop is None or step is None:
+            return None
+        if step == 0:
+            raise CannotInterpret('step size 0')
+        r = range(start, stop, step)
+        self.step(len(r))
+        return list(r)
+
+    def array_map(self, x, env):
+        a = self(x.a, env)
+        if a is None:
+            return None
+        return [self(x.body, {**env, x.name: elt}) for elt in a]
+
+    def array_filter(self, x, env):
+        a = self(x.a, env)
+        if a is None:
+            return None
+        return [elt for elt in a if self(x.body, {**env, x.name: elt})]
+
+    def make_struct(self, x, env):
+        return Struct(**{f: self(v, env) for f, v in x.fields})
+
+    def select_fields(self, x, env):
+        old = self(x.old, env)
+        if old is None:
+            return None
+        return Struct(**{f: old[f] for f in x.fields})
+
+    def insert_fields(self, x, env):
+        old = self(x.old, env)
+        if old is None:
+            raise CannotInterpret('InsertFields into missing struct')
+        fields = {f: old[f] for f in self.typ(x.old)}
+        fields.update({f: self(v, env) for f, v in x.fields})
+        if x.field_order:
+            fields = {f: fields[f] for f in x.field_order}
+        return Struct(**fields)
+
+    def get_field(self, x, env):
+        o = self(x.o, env)
+        return None if o is None else o[x.name]
+
+    def make_tuple(self, x, env):
+        return tuple(self(e, env) for e in x.elements)
+
+    def get_tuple_element(self, x, env):
+        o = self(x.o, env)
+        return None if o is None else o[x.idx]
+
+
+_dispatch = {
+    ir.I32: _Interpreter.constant,
+    ir.I64: _Interpreter.constant,
+    ir.F64: _Interpreter.f64,
+    ir.Str: _Interpreter.constant,
+    ir.TrueIR: _Interpreter.true,
+    ir.FalseIR: _Interpreter.false,
+    ir.NA: _Interpreter.na,
+    ir.Literal: _Interpreter.literal,
+    ir.Cast: _Interpreter.cast,
+    ir.IsNA: _Interpreter.is_na,
+    ir.If: _Interpreter.if_,
+    ir.Coalesce: _Interpreter.coalesce,
+    ir.Let: _Interpreter.let,
+    ir.Ref: _Interpreter.ref,
+    ir.ApplyBinaryPrimOp: _Interpreter.binary_op,
+    ir.ApplyUnaryPrimOp: _Interpreter.unary_op,
+    ir.ApplyComparisonOp: _Interpreter.comparison_op,
+    ir.Apply: _Interpreter.apply,
+    ir.MakeArray: _Interpreter.make_array,
+    ir.ArrayRef: _Interpreter.array_ref,
+    ir.ArrayLen: _Interpreter.array_len,
+    ir.ArrayRange: _Interpreter.array_range,
+    ir.ArrayMap: _Interpreter.array_map,
+    ir.ArrayFilter: _Interpreter.array_filter,
+    ir.MakeStruct: _Interpreter.make_struct,
+    ir.SelectFields: _Interpreter.select_fields,
+    ir.InsertFields: _Interpreter.insert_fields,
+    ir.GetField: _Interpreter.get_field,
+    ir.MakeTuple: _Interpreter.make_tuple,
+    ir.GetTupleElement: _Interpreter.get_tuple_element,
+}
+
+_functions = {
+    'toInt64': _Interpreter.to_int64,
+    'toFloat64': _Interpreter.to_float64,
+    'indexArray': _Interpreter.index_array,
+}
+
+
+def _count_nodes(x, max_nodes):
+    n = 0
+    stack = [x]
+    while stack:
+        node = stack.pop()
+        if type(node) not in _dispatch:
+            raise CannotInterpret(type(node).__name__)
+        n += 1
+        if n > max_nodes:
+            raise CannotInterpret('too many IR nodes')
+        stack.extend(node.children)
+    return n
+
+
+def interpret(x: 'ir.IR', max_nodes=256, max_steps=10_000):
+    """Evaluate a small, source-free value IR in Python.
+
+    Only the primitive, array, struct and tuple nodes in ``_dispatch`` and
+    the functions in ``_functions`` are supported, and evaluation of
+    arithmetic, missingness and integer overflow follows the backend. Anything else, an IR with more than `max_nodes`
+    nodes, or an evaluation that needs more than `max_steps` node evaluations
+    and collection elements raises :class:`.CannotInterpret`, in which case
+    the caller should evaluate `x` with the backend.
+
+    Returns
+    -------
+    The value of `x`, in the representation returned by the backend.
+    """
+    _count_nodes(x, max_nodes)
+    if not _is_supported_type(x.typ):
+        raise CannotInterpret(str(x.typ))
+    return _Interpreter(max_steps)(x, {})
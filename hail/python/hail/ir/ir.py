@@ -349,6 +349,10 @@ class AggLet(IR):
 
 
 class Ref(IR):
+    # the type of a reference depends on where it is bound, so references are
+    # never interned and their parents are interned by their identity
+    _internable = False
+
     @typecheck_method(name=str)
     def __init__(self, name):
         super().__init__()
@@ -1307,6 +1311,17 @@ def _register(registry, name, f):
     registry[name].append(f)
 
 _aggregator_registry = defaultdict(list)
+_aggregators_registered = False
+
+
+def _ensure_aggregators_registered():
+    # the built-in aggregator signatures are parsed on first lookup rather
+    # than when hail is imported
+    global _aggregators_registered
+    if not _aggregators_registered:
+        _aggregators_registered = True
+        from .register_aggregators import register_aggregators
+        register_aggregators()
 
 
 def register_aggregator(name, ctor_params, init_params, seq_params, ret_type):
@@ -1314,6 +1329,7 @@ def register_aggregator(name, ctor_params, init_params, seq_params, ret_type):
 
 
 def lookup_aggregator_return_type(name, ctor_args, init_args, seq_args):
+    _ensure_aggregators_registered()
     if name in _aggregator_registry:
         fns = _aggregator_registry[name]
         for f in fns:
@@ -1708,6 +1724,17 @@ _function_registry = defaultdict(list)
 _seeded_function_registry = defaultdict(list)
 _session_functions = set()
 _udf_registry = dict()
+_functions_registered = False
+
+
+def _ensure_functions_registered():
+    # the built-in function signatures are parsed on first use of the
+    # registry rather than when hail is imported
+    global _functions_registered
+    if not _functions_registered:
+        _functions_registered = True
+        from .register_functions import register_functions
+        register_functions()
 
 
 def clear_session_functions():
@@ -1723,6 +1750,7 @@ def clear_session_functions():
 
 
 def remove_function(name, param_types, ret_type):
+    _ensure_functions_registered()
     f = (param_types, ret_type)
     bindings = _function_registry[name]
     bindings = [b for b in bindings if b != f]
@@ -2157,18 +2185,43 @@ class BlockMatrixToValueApply(IR):
 
 
 class Literal(IR):
+    # Literals whose encoded value is at least this many characters long are
+    # parsed by the JVM once and then referenced by handle when rendered for a
+    # JVM backend, rather than being re-encoded and re-parsed by every query.
+    broadcast_threshold = 1 << 16
+
     @typecheck_method(typ=hail_type,
                       value=anytype)
     def __init__(self, typ, value):
         super(Literal, self).__init__()
         self._typ: 'hail.HailType' = typ
         self.value = value
+        self._encoded_value = None
 
     def copy(self):
-        return Literal(self._typ, self.value)
+        new_instance = Literal(self._typ, self.value)
+        new_instance._encoded_value = self._encoded_value
+        if hasattr(self, '_jir'):
+            new_instance._jir = self._jir
+        return new_instance
+
+    def encoded_value(self):
+        if self._encoded_value is None:
+            self._encoded_value = dump_json(self._typ._convert_to_json_na(self.value))
+        return self._encoded_value
 
     def head_str(self):
-        return f'{self._typ._parsable_string()} {dump_json(self._typ._convert_to_json_na(self.value))}'
+        return f'{self._typ._parsable_string()} {self.encoded_value()}'
+
+    def broadcast_if_large(self):
+        """Parse this literal on the JVM once if its encoded value exceeds
+        :attr:`broadcast_threshold`, so that renderers which stop at Java IR
+        refer to the parsed value by handle.
+
+        The handle is released when this node is garbage collected.
+        """
+        if not hasattr(self, '_jir') and len(self.encoded_value()) >= Literal.broadcast_threshold:
+            self._jir = self.parse(str(self))
 
     def _eq(self, other):
         return other._typ == self._typ and \
@@ -2180,6 +2233,7 @@ class Literal(IR):
 
 class Join(IR):
     _idx = 0
+    _internable = False
 
     @typecheck_method(virtual_ir=IR,
                       temp_vars=sequenceof(str),
@@ -2226,6 +2280,8 @@ class Join(IR):
 
 
 class JavaIR(IR):
+    _internable = False
+
     def __init__(self, jir):
         super(JavaIR, self).__init__()
         self._jir = jir
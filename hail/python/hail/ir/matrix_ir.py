@@ -1,5 +1,6 @@
 import hail as hl
 from hail.ir.base_ir import *
+from hail.ir.native_schema import native_type
 from hail.utils.misc import escape_str, parsable_strings, dump_json, escape_id
 
 
@@ -53,7 +54,10 @@ class MatrixRead(MatrixIR):
         return self.reader == other.reader and self.drop_cols == other.drop_cols and self.drop_rows == other.drop_rows
 
     def _compute_type(self):
-        self._type = Env.backend().matrix_type(self)
+        if isinstance(self.reader, hl.ir.MatrixNativeReader):
+            self._type = native_type(self.reader.path, 'matrix', lambda: Env.backend().matrix_type(self))
+        else:
+            self._type = Env.backend().matrix_type(self)
 
 
 class MatrixFilterRows(MatrixIR):
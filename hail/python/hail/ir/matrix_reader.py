@@ -9,6 +9,7 @@ from ..genetics.reference_genome import reference_genome_type
 from ..typecheck import *
 from ..utils import wrap_to_list
 from ..utils.misc import escape_str
+from ..utils.temp_files import temp_files
 
 
 class MatrixReader(object):
@@ -20,6 +21,11 @@ class MatrixReader(object):
     def __eq__(self, other):
         pass
 
+    def input_paths(self):
+        """The paths of the files this reader reads, or ``None`` if they are
+        not known."""
+        return None
+
 
 class MatrixNativeReader(MatrixReader):
     @typecheck_method(path=str,
@@ -37,6 +43,7 @@ class MatrixNativeReader(MatrixReader):
                 self._interval_type = hl.tarray(hl.tinterval(hl.tstruct(__point=pt)))
 
         self.path = path
+        temp_files().attach(path, self)
         self.filter_intervals = filter_intervals
         if intervals is not None and t != self._interval_type:
             self.intervals = [hl.Interval(hl.Struct(__point=i.start),
@@ -46,6 +53,9 @@ class MatrixNativeReader(MatrixReader):
         else:
             self.intervals = intervals
 
+    def input_paths(self):
+        return [self.path]
+
     def render(self, r):
         reader = {'name': 'MatrixNativeReader',
                   'path': self.path}
@@ -75,6 +85,9 @@ class MatrixRangeReader(MatrixReader):
         self.n_cols = n_cols
         self.n_partitions = n_partitions
 
+    def input_paths(self):
+        return []
+
     def render(self, r):
         reader = {'name': 'MatrixRangeReader',
                   'nRows': self.n_rows,
@@ -134,6 +147,9 @@ class MatrixVCFReader(MatrixReader):
         self.find_replace = find_replace
         self._partitions_json = _partitions_json
 
+    def input_paths(self):
+        return self.path + ([self.header_file] if self.header_file else [])
+
     def render(self, r):
         reader = {'name': 'MatrixVCFReader',
                   'files': self.path,
@@ -188,6 +204,12 @@ class MatrixBGENReader(MatrixReader):
             assert (isinstance(included_variants, Table))
         self.included_variants = included_variants
 
+    def input_paths(self):
+        if self.included_variants is not None:
+            # the variants are a query of their own, not a child of this one
+            return None
+        return self.path + ([self.sample_file] if self.sample_file else []) + list(self.index_file_map.values())
+
     def render(self, r):
         reader = {'name': 'MatrixBGENReader',
                   'files': self.path,
@@ -239,6 +261,9 @@ class TextMatrixReader(MatrixReader):
         self.gzip_as_bgzip = gzip_as_bgzip
         self.add_row_id = add_row_id
 
+    def input_paths(self):
+        return list(self.paths)
+
     def render(self, r):
         reader = {'name': 'TextMatrixReader',
                   'paths': self.paths,
@@ -285,6 +310,9 @@ class MatrixPLINKReader(MatrixReader):
         self.contig_recoding = contig_recoding
         self.skip_invalid_loci = skip_invalid_loci
 
+    def input_paths(self):
+        return [self.bed, self.bim, self.fam]
+
     def render(self, r):
         reader = {'name': 'MatrixPLINKReader',
                   'bed': self.bed,
@@ -333,6 +361,9 @@ class MatrixGENReader(MatrixReader):
             'skipInvalidLoci': skip_invalid_loci
         }
 
+    def input_paths(self):
+        return list(self.config['files']) + [self.config['sampleFile']]
+
     def render(self, r):
         return escape_str(json.dumps(self.config))
 
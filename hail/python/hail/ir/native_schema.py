@@ -0,0 +1,65 @@
+import gzip
+import hashlib
+import json
+import threading
+
+from hail.expr.type_parsing import parsable_type_grammar, parsable_type_node_visitor
+from hail.utils.java import Env
+
+_lock = threading.Lock()
+# (kind, sha256 of the dataset's metadata file) -> type
+_types = {}
+
+
+def _read_metadata(metadata_path):
+    with Env.fs().open(metadata_path, 'rb') as f:
+        data = f.read()
+    # HadoopFS decompresses by extension, other file systems do not
+    if data[:2] == b'\x1f\x8b':
+        data = gzip.decompress(data)
+    return data
+
+
+def _parse_metadata(data, kind):
+    spec = json.loads(data)
+    rule = f'{kind}_type'
+    return parsable_type_node_visitor.visit(parsable_type_grammar[rule].parse(spec[rule]))
+
+
+def native_type(path, kind, compute):
+    """The :class:`.ttable` or :class:`.tmatrix` (`kind` ``'table'`` or
+    ``'matrix'``) of the native dataset at `path`.
+
+    The type is parsed from the dataset's metadata file rather than requested
+    from the backend, and cached for the life of the process by the contents
+    of the metadata file, so a rewritten dataset is parsed again however
+    quickly it was rewritten. If the metadata cannot be parsed, for instance
+    because it uses a reference genome Python does not know of, the type is
+    computed by calling `compute`, and cached all the same.
+    """
+    metadata_path = path.rstrip('/') + '/metadata.json.gz'
+    try:
+        data = _read_metadata(metadata_path)
+    except Exception:  # pylint: disable=broad-except
+        # let the backend report a missing or unreadable dataset
+        return compute()
+
+    key = (kind, hashlib.sha256(data).digest())
+    with _lock:
+        typ = _types.get(key)
+    if typ is not None:
+        return typ
+
+    try:
+        typ = _parse_metadata(data, kind)
+    except Exception:  # pylint: disable=broad-except
+        typ = compute()
+    with _lock:
+        _types[key] = typ
+    return typ
+
+
+def clear_native_types():
+    """Forget the cached types of native datasets."""
+    with _lock:
+        _types.clear()
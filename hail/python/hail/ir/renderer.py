@@ -90,10 +90,19 @@ class RQStack(object):
 
 
 class Renderer:
+    stop_at_jir = False
+
     @abc.abstractmethod
     def add_jir(self, jir):
         pass
 
+    def is_jir(self, x: 'Renderable') -> bool:
+        if not self.stop_at_jir:
+            return False
+        if isinstance(x, ir.Literal):
+            x.broadcast_if_large()
+        return hasattr(x, '_jir')
+
 
 class PlainRenderer(Renderer):
     def __init__(self, stop_at_jir=False):
@@ -114,7 +123,7 @@ class PlainRenderer(Renderer):
         while x is not None or stack.non_empty():
             if x is not None:
                 # TODO: it would be nice to put the JavaIR logic in BaseIR somewhere but this isn't trivial
-                if self.stop_at_jir and hasattr(x, '_jir'):
+                if self.is_jir(x):
                     jir_id = self.add_jir(x._jir)
                     if isinstance(x, ir.MatrixIR):
                         builder.append(f'(JavaMatrix {jir_id})')
@@ -246,7 +255,7 @@ class CSEAnalysisPass:
 
             child = node.children[child_idx]
 
-            if self.renderer.stop_at_jir and hasattr(child, '_jir'):
+            if self.renderer.is_jir(child):
                 self.renderer._add_jir(child)
                 continue
 
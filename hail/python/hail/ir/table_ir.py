@@ -3,6 +3,7 @@ import json
 import hail as hl
 from hail.expr.types import dtype
 from hail.ir.base_ir import *
+from hail.ir.native_schema import native_type
 from hail.utils.java import Env
 from hail.utils.misc import escape_str, parsable_strings, dump_json, escape_id
 
@@ -207,7 +208,10 @@ class TableRead(TableIR):
         return self.reader == other.reader and self.drop_rows == other.drop_rows
 
     def _compute_type(self):
-        self._type = Env.backend().table_type(self)
+        if isinstance(self.reader, hl.ir.TableNativeReader):
+            self._type = native_type(self.reader.path, 'table', lambda: Env.backend().table_type(self))
+        else:
+            self._type = Env.backend().table_type(self)
 
 
 class TableImport(TableIR):
@@ -217,6 +221,9 @@ class TableImport(TableIR):
         self._typ = typ
         self.reader_options = reader_options
 
+    def input_paths(self):
+        return list(self.paths)
+
     def head_str(self):
         return '(({}) {} {}'.format(
             ' '.join([escape_str(path) for path in self.paths]),
@@ -6,6 +6,7 @@ import hail as hl
 from hail.ir.utils import make_filter_and_replace
 from hail.typecheck import *
 from hail.utils.misc import escape_str
+from hail.utils.temp_files import temp_files
 
 
 class TableReader(object):
@@ -17,6 +18,11 @@ class TableReader(object):
     def __eq__(self, other):
         pass
 
+    def input_paths(self):
+        """The paths of the files this reader reads, or ``None`` if they are
+        not known."""
+        return None
+
 
 class TableNativeReader(TableReader):
     @typecheck_method(path=str,
@@ -34,6 +40,7 @@ class TableNativeReader(TableReader):
                 self._interval_type = hl.tarray(hl.tinterval(hl.tstruct(__point=pt)))
 
         self.path = path
+        temp_files().attach(path, self)
         self.filter_intervals = filter_intervals
         if intervals is not None and t != self._interval_type:
             self.intervals = [hl.Interval(hl.Struct(__point=i.start),
@@ -43,6 +50,9 @@ class TableNativeReader(TableReader):
         else:
             self.intervals = intervals
 
+    def input_paths(self):
+        return [self.path]
+
     def render(self):
         reader = {'name': 'TableNativeReader',
                   'path': self.path}
@@ -83,6 +93,9 @@ class TextTableReader(TableReader):
             'forceGZ': force_gz
         }
 
+    def input_paths(self):
+        return list(self.config['files'])
+
     def render(self):
         reader = {'name': 'TextTableReader',
                   'options': self.config}
@@ -97,8 +110,12 @@ class TableFromBlockMatrixNativeReader(TableReader):
     @typecheck_method(path=str, n_partitions=nullable(int))
     def __init__(self, path, n_partitions):
         self.path = path
+        temp_files().attach(path, self)
         self.n_partitions = n_partitions
 
+    def input_paths(self):
+        return [self.path]
+
     def render(self):
         reader = {'name': 'TableFromBlockMatrixNativeReader',
                   'path': self.path,
@@ -3,7 +3,6 @@ import os
 import itertools
 import numpy as np
 import re
-import scipy.linalg as spla
 
 import hail as hl
 import hail.expr.aggregators as agg
@@ -18,7 +17,7 @@ from hail.ir.blockmatrix_reader import BlockMatrixNativeReader, BlockMatrixBinar
 from hail.ir.blockmatrix_writer import BlockMatrixBinaryWriter, BlockMatrixNativeWriter, BlockMatrixRectanglesWriter
 from hail.table import Table
 from hail.typecheck import *
-from hail.utils import new_temp_file, new_local_temp_file, local_path_uri, storage_level
+from hail.utils import new_temp_file, new_local_temp_file, new_local_temp_dir, local_path_uri, storage_level, temp_files
 from hail.utils.java import Env, jarray, joption
 
 block_matrix_type = lazy()
@@ -215,6 +214,12 @@ class BlockMatrix(object):
     def _from_java(jbm):
         return BlockMatrix(JavaBlockMatrix(jbm))
 
+    def _derive_from_java(self, jbm):
+        # the JVM block matrix may still read this one's temporary files
+        bm = BlockMatrix._from_java(jbm)
+        temp_files().inherit(bm._bmir, self._bmir)
+        return bm
+
     def __init__(self, bmir):
         self._bmir = bmir
         self._cached_jbm = None
@@ -346,7 +351,7 @@ class BlockMatrix(object):
         nd = _ndarray_as_float64(nd)
         n_rows, n_cols = nd.shape
 
-        path = new_local_temp_file()
+        path = temp_files().manage(new_local_temp_file())
         uri = local_path_uri(path)
         nd.tofile(path)
         return cls.fromfile(uri, n_rows, n_cols, block_size)
@@ -408,7 +413,7 @@ class BlockMatrix(object):
         block_size: :obj:`int`, optional
             Block size. Default given by :meth:`.BlockMatrix.default_block_size`.
         """
-        path = new_temp_file()
+        path = temp_files().manage(new_temp_file())
         cls.write_from_entry_expr(entry_expr, path, overwrite=False, mean_impute=mean_impute,
                                   center=center, normalize=normalize, axis=axis, block_size=block_size)
         return cls.read(path)
@@ -930,7 +935,7 @@ class BlockMatrix(object):
         if lower > upper:
             raise ValueError(f'sparsify_band: lower={lower} is greater than upper={upper}')
 
-        return BlockMatrix._from_java(self._jbm.filterBand(lower, upper, blocks_only))
+        return self._derive_from_java(self._jbm.filterBand(lower, upper, blocks_only))
 
     @typecheck_method(lower=bool, blocks_only=bool)
     def sparsify_triangle(self, lower=False, blocks_only=False):
@@ -1086,7 +1091,7 @@ class BlockMatrix(object):
         if any([starts[i] > stops[i] for i in range(0, n_rows)]):
             raise ValueError('every start value must be less than or equal to the corresponding stop value')
 
-        return BlockMatrix._from_java(self._jbm.filterRowIntervals(
+        return self._derive_from_java(self._jbm.filterRowIntervals(
             jarray(Env.jvm().long, starts),
             jarray(Env.jvm().long, stops),
             blocks_only))
@@ -1156,15 +1161,16 @@ class BlockMatrix(object):
         :class:`numpy.ndarray`
         """
 
-        if self.n_rows * self.n_cols > 1 << 31 or _force_blocking:
-            path = new_temp_file()
-            self.export_blocks(path, binary=True)
-            return BlockMatrix.rectangles_to_numpy(path, binary=True)
+        with temp_files().scope():
+            if self.n_rows * self.n_cols > 1 << 31 or _force_blocking:
+                path = new_temp_file()
+                self.export_blocks(path, binary=True)
+                return BlockMatrix.rectangles_to_numpy(path, binary=True)
 
-        path = new_local_temp_file()
-        uri = local_path_uri(path)
-        self.tofile(uri)
-        return np.fromfile(path).reshape((self.n_rows, self.n_cols))
+            path = new_local_temp_file()
+            uri = local_path_uri(path)
+            self.tofile(uri)
+            return np.fromfile(path).reshape((self.n_rows, self.n_cols))
 
     @property
     def is_sparse(self):
@@ -1208,7 +1214,7 @@ class BlockMatrix(object):
         -------
         :class:`.BlockMatrix`
         """
-        return BlockMatrix._from_java(self._jbm.densify())
+        return self._derive_from_java(self._jbm.densify())
 
     def cache(self):
         """Persist this block matrix in memory.
@@ -1254,7 +1260,7 @@ class BlockMatrix(object):
         :class:`.BlockMatrix`
             Persisted block matrix.
         """
-        return BlockMatrix._from_java(self._jbm.persist(storage_level))
+        return self._derive_from_java(self._jbm.persist(storage_level))
 
     def unpersist(self):
         """Unpersists this block matrix from memory/disk.
@@ -1269,7 +1275,7 @@ class BlockMatrix(object):
         :class:`.BlockMatrix`
             Unpersisted block matrix.
         """
-        return BlockMatrix._from_java(self._jbm.unpersist())
+        return self._derive_from_java(self._jbm.unpersist())
 
     def __pos__(self):
         return self
@@ -1610,7 +1616,7 @@ class BlockMatrix(object):
         :class:`.Table`
             Table where each row corresponds to a row in the block matrix.
         """
-        path = new_temp_file()
+        path = temp_files().manage(new_temp_file())
 
         self.write(path, overwrite=True, force_row_major=True)
         reader = TableFromBlockMatrixNativeReader(path, n_partitions)
@@ -1637,7 +1643,7 @@ class BlockMatrix(object):
         """
         t = self.to_table_row_major(n_partitions)
         t = t.transmute(entries=t.entries.map(lambda i: hl.struct(element=i)))
-        t = t.annotate_globals(cols=hl.array([hl.struct(col_idx=hl.int64(i)) for i in range(self.n_cols)]))
+        t = t.annotate_globals(cols=hl.range(0, self.n_cols).map(lambda i: hl.struct(col_idx=hl.int64(i))))
         return t._unlocalize_entries('entries', 'cols', ['col_idx'])
 
     @staticmethod
@@ -1878,7 +1884,7 @@ class BlockMatrix(object):
                                  f'0 <= r[0] <= r[1] <= n_rows and 0 <= r[2] <= r[3] <= n_cols')
 
         flattened_rectangles = jarray(Env.jvm().long, list(itertools.chain(*rectangles)))
-        return BlockMatrix._from_java(self._jbm.filterRectangles(flattened_rectangles))
+        return self._derive_from_java(self._jbm.filterRectangles(flattened_rectangles))
 
     @typecheck_method(path_out=str,
                       rectangles=sequenceof(sequenceof(int)),
@@ -2138,15 +2144,16 @@ class BlockMatrix(object):
         n_cols = max(rects, key=lambda r: r[4])[4]
 
         nd = np.zeros(shape=(n_rows, n_cols))
-        f = new_local_temp_file()
-        uri = local_path_uri(f)
-        for rect, file_path in zip(rects, rect_files):
-            hl.utils.hadoop_copy(file_path, uri)
-            if binary:
-                rect_data = np.reshape(np.fromfile(f), (rect[2]-rect[1], rect[4]-rect[3]))
-            else:
-                rect_data = np.loadtxt(f, ndmin=2)
-            nd[rect[1]:rect[2], rect[3]:rect[4]] = rect_data
+        with temp_files().scope():
+            d = new_local_temp_dir()
+            local_files = [os.path.join(d, f'rect-{i}') for i in range(len(rect_files))]
+            Env.fs().copy_many([(file_path, local_path_uri(f)) for file_path, f in zip(rect_files, local_files)])
+            for rect, f in zip(rects, local_files):
+                if binary:
+                    rect_data = np.reshape(np.fromfile(f), (rect[2]-rect[1], rect[4]-rect[3]))
+                else:
+                    rect_data = np.loadtxt(f, ndmin=2)
+                nd[rect[1]:rect[2], rect[3]:rect[4]] = rect_data
 
         return nd
 
@@ -2449,6 +2456,7 @@ def _svd(a, full_matrices=True, compute_uv=True, overwrite_a=False, check_finite
     GR: https://software.intel.com/en-us/mkl-developer-reference-fortran-gesvd
     DC (gesdd) is faster but uses O(elements) memory; lwork may overflow int32
     """
+    import scipy.linalg as spla
     try:
         return spla.svd(a, full_matrices=full_matrices, compute_uv=compute_uv, overwrite_a=overwrite_a,
                         check_finite=check_finite, lapack_driver='gesdd')
@@ -2468,4 +2476,7 @@ def _eigh(a):
     SciPy uses RRR: https://software.intel.com/en-us/mkl-developer-reference-fortran-syevr
     DC (syevd) is faster but uses O(elements) memory; lwork overflows int32 for dim_a > 32766
     """
-    return np.linalg.eigh(a) if a.shape[0] <= 32766 else spla.eigh(a)
+    if a.shape[0] <= 32766:
+        return np.linalg.eigh(a)
+    import scipy.linalg as spla
+    return spla.eigh(a)
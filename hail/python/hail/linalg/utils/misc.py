@@ -2,7 +2,7 @@ import numpy as np
 
 import hail as hl
 from hail.typecheck import *
-from hail.expr.expressions import expr_locus, expr_float64, check_row_indexed
+from hail.expr.expressions import expr_locus, expr_float64, check_row_indexed, ExpressionException
 from hail.utils.java import Env
 
 
@@ -62,18 +62,8 @@ def array_windows(a, radius):
     if a[-1] + radius < a[-1]:
         raise ValueError('array_windows: overflow for a[-1] + radius')
 
-    starts, stops = np.zeros(size, dtype=np.int64),  np.zeros(size, dtype=np.int64)
-    j, k = 0, 0
-    for i in range(size):
-        min_val = a[i] - radius
-        while j < size and a[j] < min_val:
-            j += 1
-        starts[i] = j
-
-        max_val = a[i] + radius
-        while k < size and a[k] <= max_val:
-            k += 1
-        stops[i] = k
+    starts = np.searchsorted(a, a - radius, side='left').astype(np.int64)
+    stops = np.searchsorted(a, a + radius, side='right').astype(np.int64)
 
     return starts, stops
 
@@ -169,56 +159,84 @@ def locus_windows(locus_expr, radius, coord_expr=None, _localize=True):
     check_row_indexed('locus_windows', locus_expr)
     if coord_expr is not None:
         check_row_indexed('locus_windows', coord_expr)
+        if coord_expr._indices.source is not locus_expr._indices.source:
+            raise ExpressionException("locus_windows: 'locus_expr' and 'coord_expr' come from "
+                                      "different source objects")
 
-    src = locus_expr._indices.source
-    if locus_expr not in src._fields_inverse:
-        locus = Env.get_uid()
-        annotate_fields = {locus: locus_expr}
-
-        if coord_expr is not None:
-            if coord_expr not in src._fields_inverse:
-                coords = Env.get_uid()
-                annotate_fields[coords] = coord_expr
-            else:
-                coords = src._fields_inverse[coord_expr]
-
-        if isinstance(src, hl.MatrixTable):
-            new_src = src.annotate_rows(**annotate_fields)
-        else:
-            new_src = src.annotate(**annotate_fields)
-
-        locus_expr = new_src[locus]
-        if coord_expr is not None:
-            coord_expr = new_src[coords]
+    windows = _locus_windows_table(locus_expr, radius, coord_expr)
+    windows = windows.aggregate(
+        hl.case()
+          .when(hl.agg.count() > 0, hl.sorted(hl.agg.collect(hl.tuple([windows.idx, windows.start, windows.stop]))))
+          .or_error("locus_windows: 'locus_expr' has length 0"),
+        _localize=False)
 
-    if coord_expr is None:
-        coord_expr = locus_expr.position
+    if not _localize:
+        return hl.bind(lambda w: hl.tuple([w.map(lambda x: hl.int32(x[1])),
+                                           w.map(lambda x: hl.int32(x[2]))]),
+                       windows)
 
-    rg = locus_expr.dtype.reference_genome
-    contig_group_expr = hl.agg.group_by(hl.locus(locus_expr.contig, 1, reference_genome=rg), hl.agg.collect(coord_expr))
+    windows = np.array(hl.eval(windows), dtype=np.int64).reshape(-1, 3)
+    return windows[:, 1].copy(), windows[:, 2].copy()
 
-    # check loci are in sorted order
-    last_pos = hl.fold(lambda a, elt: (hl.case()
-                                         .when(a <= elt, elt)
-                                         .or_error("locus_windows: 'locus_expr' global position must be in ascending order.")),
-                       -1,
-                       hl.agg.collect(hl.case()
-                                        .when(hl.is_defined(locus_expr), locus_expr.global_position())
-                                        .or_error("locus_windows: missing value for 'locus_expr'.")))
-    checked_contig_groups = (hl.case()
-                               .when(last_pos >= 0, contig_group_expr)
-                               .or_error("locus_windows: 'locus_expr' has length 0"))
 
-    contig_groups = locus_expr._aggregation_method()(checked_contig_groups, _localize=False)
+def _locus_windows_table(locus_expr, radius, coord_expr=None):
+    """Window boundaries for :func:`.locus_windows` as a table.
 
-    coords = hl.sorted(hl.array(contig_groups)).map(lambda t: t[1])
-    starts_and_stops = hl._locus_windows_per_contig(coords, radius)
+    Returns a table keyed by the row index `idx` with int64 fields `start` and
+    `stop`. The row table is never collected: ordering is checked with a scan,
+    and the boundaries come from a single distributed sort of each row's
+    coordinate together with its window's lower and upper bound, after which
+    a scan counting the rows sorted before a bound gives that bound's index.
+    """
+    src = locus_expr._indices.source
+    if coord_expr is None:
+        coord_expr = locus_expr.position
 
-    if not _localize:
-        return starts_and_stops
+    locus = Env.get_uid()
+    coord = Env.get_uid()
+    fields = {locus: locus_expr, coord: hl.float64(coord_expr)}
+    if isinstance(src, hl.MatrixTable):
+        ht = src.select_rows(**fields).rows()
+    else:
+        ht = src.select(**fields)
+    ht = ht.key_by().select(locus, coord)
+    ht = ht.add_index('idx')
 
-    starts, stops = hl.eval(starts_and_stops)
-    return np.array(starts), np.array(stops)
+    rg = locus_expr.dtype.reference_genome
+    ht = ht.annotate(
+        contig=hl.locus(ht[locus].contig, 1, reference_genome=rg).global_position(),
+        global_position=ht[locus].global_position(),
+        coord=hl.case()
+                .when(hl.is_defined(ht[locus]),
+                      hl.case()
+                        .when(hl.is_defined(ht[coord]) & ~hl.is_nan(ht[coord]), ht[coord])
+                        .or_error("locus_windows: missing value for 'coord_expr'."))
+                .or_error("locus_windows: missing value for 'locus_expr'."))
+
+    prev = hl.scan._prev_nonnull(ht.row.select('contig', 'global_position', 'coord'))
+    ordered = hl.is_missing(prev) | (prev.global_position <= ht.global_position)
+    ordered_within_contig = hl.is_missing(prev) | (prev.contig != ht.contig) | (prev.coord <= ht.coord)
+    ht = ht.annotate(
+        coord=hl.case()
+                .when(ordered,
+                      hl.case()
+                        .when(ordered_within_contig, ht.coord)
+                        .or_error("locus_windows: 'coord_expr' must be in ascending order within each contig."))
+                .or_error("locus_windows: 'locus_expr' global position must be in ascending order."))
+
+    # kind orders a lower bound before, and an upper bound after, rows with
+    # the same coordinate
+    ht = ht.select(bound=[hl.struct(contig=ht.contig, coord=ht.coord - radius, kind=0, idx=ht.idx),
+                          hl.struct(contig=ht.contig, coord=ht.coord, kind=1, idx=ht.idx),
+                          hl.struct(contig=ht.contig, coord=ht.coord + radius, kind=2, idx=ht.idx)])
+    ht = ht.explode('bound')
+    ht = ht.select(**ht.bound).key_by('contig', 'coord', 'kind')
+    ht = ht.annotate(n_before=hl.scan.count_where(ht.kind == 1))
+    ht = ht.filter(ht.kind != 1)
+
+    return ht.group_by(ht.idx).aggregate(
+        start=hl.agg.filter(ht.kind == 0, hl.agg.max(ht.n_before)),
+        stop=hl.agg.filter(ht.kind == 2, hl.agg.max(ht.n_before)))
 
 
 def _check_dims(a, name, ndim, min_size=1):
@@ -5,6 +5,7 @@ import warnings
 import hail
 import hail as hl
 from hail.expr.expressions import *
+from hail.expr.generic_summary import sampled_header, sampled_partitions
 from hail.expr.types import *
 from hail.expr.table_type import *
 from hail.expr.matrix_type import *
@@ -3964,12 +3965,19 @@ class MatrixTable(ExprContainer):
 
         return t
 
-    @typecheck_method(rows=bool, cols=bool, entries=bool)
-    def summarize(self, *, rows=True, cols=True, entries=True):
+    @typecheck_method(rows=bool, cols=bool, entries=bool,
+                      partitions=nullable(int), seed=nullable(int), progressive=bool)
+    def summarize(self, *, rows=True, cols=True, entries=True, partitions=None, seed=None, progressive=False):
         """Compute and print summary information about the fields in the matrix table.
 
         .. include:: _templates/experimental.rst
 
+        Notes
+        -----
+        If `partitions` is set, row and entry fields are summarized from that
+        many randomly chosen row partitions, as described in
+        :meth:`.Table.summarize`. Column fields are always summarized exactly.
+
         Parameters
         ----------
         rows : :obj:`bool`
@@ -3978,13 +3986,16 @@ class MatrixTable(ExprContainer):
             Compute summary for the column fields.
         entries : :obj:`bool`
             Compute summary for the entry fields.
+        partitions : :obj:`int`, optional
+            Number of randomly chosen partitions to summarize. Summarize all
+            partitions if ``None``.
+        seed : :obj:`int`, optional
+            Random seed for choosing partitions.
+        progressive : :obj:`bool`
+            Print estimates from progressively more partitions.
         """
 
-        if cols:
-            computations, printers = hl.expr.generic_summary(self.col, prefix='[col]', skip_top=True)
-            results = self.aggregate_cols(computations)
-            print('Columns')
-            print('=======')
+        def print_summary(printers, results):
             for name, fields in printers:
                 print(f'* {name}:')
 
@@ -3992,30 +4003,32 @@ class MatrixTable(ExprContainer):
                 for k, v in fields.items():
                     print(f'    {k.rjust(max_k_len)} : {v(results)}')
                 print()
-        if rows:
-            computations, printers = hl.expr.generic_summary(self.row, prefix='[row]', skip_top=True)
-            results = self.aggregate_rows(computations)
-            print('Rows')
-            print('====')
-            for name, fields in printers:
-                print(f'* {name}:')
 
-                max_k_len = max(len(f) for f in fields)
-                for k, v in fields.items():
-                    print(f'    {k.rjust(max_k_len)} : {v(results)}')
-                print()
-        if entries:
-            computations, printers = hl.expr.generic_summary(self.entry, prefix='[entry]', skip_top=True)
-            results = self.aggregate_entries(computations)
-            print('Entries')
+        if cols:
+            computations, printers = hl.expr.generic_summary(self.col, prefix='[col]', skip_top=True)
+            results = self.aggregate_cols(computations)
+            print('Columns')
             print('=======')
-            for name, fields in printers:
-                print(f'* {name}:')
-
-                max_k_len = max(len(f) for f in fields)
-                for k, v in fields.items():
-                    print(f'    {k.rjust(max_k_len)} : {v(results)}')
+            print_summary(printers, results)
+        if not (rows or entries):
+            return
+        for parts, scale in sampled_partitions(self.n_partitions(), partitions, seed, progressive):
+            mt = self if parts is None else self._filter_partitions(parts)
+            if parts is not None:
+                print(sampled_header(len(parts), self.n_partitions()))
                 print()
+            if rows:
+                computations, printers = hl.expr.generic_summary(mt.row, prefix='[row]', skip_top=True, scale=scale)
+                results = mt.aggregate_rows(computations)
+                print('Rows')
+                print('====')
+                print_summary(printers, results)
+            if entries:
+                computations, printers = hl.expr.generic_summary(mt.entry, prefix='[entry]', skip_top=True, scale=scale)
+                results = mt.aggregate_entries(computations)
+                print('Entries')
+                print('=======')
+                print_summary(printers, results)
 
     def _write_block_matrix(self, path, overwrite, entry_field, block_size):
         mt = self
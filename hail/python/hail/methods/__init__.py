@@ -9,7 +9,8 @@ from .statgen import skat, identity_by_descent, impute_sex, \
     split_multi_hts, balding_nichols_model, ld_prune, row_correlation, ld_matrix, \
     linear_mixed_model, linear_regression_rows, logistic_regression_rows, poisson_regression_rows, \
     linear_mixed_regression_rows, lambda_gc
-from .qc import sample_qc, variant_qc, vep, concordance, nirvana, summarize_variants
+from .qc import sample_qc, variant_qc, sample_qc_partials, variant_qc_partials, combine_qc_partials, \
+    sample_qc_from_partials, variant_qc_from_partials, vep, concordance, nirvana, summarize_variants
 from .misc import rename_duplicates, maximal_independent_set, filter_intervals, window_by_locus
 
 __all__ = ['trio_matrix',
@@ -24,6 +25,11 @@ __all__ = ['trio_matrix',
            'lambda_gc',
            'sample_qc',
            'variant_qc',
+           'sample_qc_partials',
+           'variant_qc_partials',
+           'combine_qc_partials',
+           'sample_qc_from_partials',
+           'variant_qc_from_partials',
            'genetic_relatedness_matrix',
            'realized_relationship_matrix',
            'pca',
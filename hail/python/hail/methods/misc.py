@@ -6,7 +6,8 @@ from hail.expr.types import *
 from hail.matrixtable import MatrixTable
 from hail.table import Table
 from hail.typecheck import *
-from hail.utils import Interval, Struct, new_temp_file
+from hail.utils import Interval, IntervalTree, Struct, new_temp_file
+from hail.utils.interval import _ordering_key
 from hail.utils.misc import plural
 from hail.utils.java import Env, joption, info
 from hail.ir import *
@@ -165,6 +166,113 @@ def maximal_independent_set(i, j, keep=True, tie_breaker=None, keyed=True) -> Ta
     return nodes
 
 
+def _local_maximal_independent_set(edges, tie_breaker=None):
+    """Greedy maximal independent set of a small graph, as an expression.
+
+    Mirrors the driver algorithm used by :func:`.maximal_independent_set`:
+    repeatedly remove the vertex with the most distinct neighbors, ordering
+    vertices of equal degree by `tie_breaker`, until no edges remain.
+
+    Parameters
+    ----------
+    edges : :class:`.ArrayExpression`
+        Array of 2-tuples of vertices.
+    tie_breaker : function, optional
+        As in :func:`.maximal_independent_set`.
+
+    Returns
+    -------
+    :class:`.ArrayExpression`
+        The removed vertices, in the order they were removed.
+    """
+    node_t = edges.dtype.element_type.types[0]
+    # sorted (vertex, neighbors) pairs, built once; the fold then only
+    # tracks each vertex's number of remaining neighbors
+    adjacency = hl.array(
+        edges.flatmap(lambda e: hl.array([e, hl.tuple([e[1], e[0]])]))
+        .group_by(lambda e: e[0])
+        .map_values(lambda es: hl.set(es.map(lambda e: e[1]))))
+
+    def solve(adjacency):
+        n = hl.len(adjacency)
+
+        def better(degrees, k, best):
+            more_neighbors = degrees[k] > degrees[best]
+            if tie_breaker is None:
+                return more_neighbors
+            return more_neighbors | ((degrees[k] == degrees[best]) &
+                                     (hl.int64(tie_breaker(adjacency[k][0], adjacency[best][0])) > 0))
+
+        def remove(acc, v):
+            return hl.struct(
+                degrees=hl.range(0, n).map(
+                    lambda k: hl.cond(k == v,
+                                      0,
+                                      hl.cond((acc.degrees[k] > 0) & adjacency[v][1].contains(adjacency[k][0]),
+                                              acc.degrees[k] - 1,
+                                              acc.degrees[k]))),
+                removed=acc.removed.append(adjacency[v][0]))
+
+        def remove_max(acc):
+            return hl.bind(
+                lambda v: hl.cond(acc.degrees[v] == 0, acc, remove(acc, v)),
+                hl.fold(lambda best, k: hl.cond(better(acc.degrees, k, best), k, best), 0, hl.range(1, n)))
+
+        zero = hl.struct(degrees=adjacency.map(lambda p: hl.len(p[1])), removed=hl.empty_array(node_t))
+        return hl.fold(lambda acc, _: remove_max(acc), zero, hl.range(0, n)).removed
+
+    return hl.bind(solve, adjacency)
+
+
+def _banded_maximal_independent_set(edges, position, tie_breaker=None, max_local_edges=2000) -> Table:
+    """Vertices removed by :func:`.maximal_independent_set` on a banded graph.
+
+    `edges` is a table with fields `i` and `j` and `position` maps a vertex
+    to an integer such that the graph is banded, as for the locus-windowed
+    edges built by :func:`.ld_prune`. Edges are sorted by position span and
+    a scan merges overlapping spans into clusters. Every connected component
+    lies in one cluster, and greedy removal on one component never affects
+    another, so each cluster is solved independently and in parallel. Only
+    clusters with more than `max_local_edges` edges, which would not fit in
+    one task, are collected and solved on the driver.
+
+    Returns
+    -------
+    :class:`.Table`
+        Unkeyed table with one row field `node`, the removed vertices.
+    """
+    edges = edges.key_by(lo=hl.min(position(edges.i), position(edges.j)),
+                         hi=hl.max(position(edges.i), position(edges.j)))
+    edges = edges.select('i', 'j')
+    edges = edges.annotate(start=hl.or_else(edges.lo > hl.scan.max(edges.hi), True))
+    edges = edges.annotate(cluster=hl.scan.count_where(edges.start) + hl.int64(edges.start))
+    edges_path = new_temp_file()
+    edges.write(edges_path)
+    edges = hl.read_table(edges_path)
+
+    clusters = edges.group_by(edges.cluster).aggregate(
+        n_edges=hl.agg.count(),
+        edges=hl.agg.take(hl.tuple([edges.i, edges.j]), max_local_edges + 1))
+    clusters_path = new_temp_file()
+    clusters.write(clusters_path)
+    clusters = hl.read_table(clusters_path)
+
+    local = clusters.filter(clusters.n_edges <= max_local_edges)
+    local = local.select(node=_local_maximal_independent_set(local.edges, tie_breaker))
+    local = local.explode('node').key_by().select('node').select_globals()
+
+    large_clusters = clusters.aggregate(
+        hl.agg.filter(clusters.n_edges > max_local_edges, hl.agg.collect_as_set(clusters.cluster)))
+    if not large_clusters:
+        return local
+
+    info(f'maximal_independent_set: resolving {len(large_clusters)} '
+         f'{plural("cluster", len(large_clusters))} with more than {max_local_edges} edges on the driver')
+    large = edges.filter(hl.literal(large_clusters).contains(edges.cluster))
+    large = maximal_independent_set(large.i, large.j, keep=False, tie_breaker=tie_breaker, keyed=False)
+    return local.union(large)
+
+
 def require_col_key_str(dataset: MatrixTable, method: str):
     if not len(dataset.col_key) == 1 or dataset[next(iter(dataset.col_key))].dtype != hl.tstr:
         raise ValueError(f"Method '{method}' requires column key to be one field of type 'str', found "
@@ -377,12 +485,24 @@ def filter_intervals(ds, intervals, keep=True) -> Union[Table, MatrixTable]:
             return Interval(Struct(**{k_name: interval.start}),
                             Struct(**{k_name: interval.end}),
                             interval.includes_start,
-                            interval.includes_end)
+                            interval.includes_end,
+                            point_type=point_type)
         else:
-            return interval
+            return Interval(interval.start, interval.end, interval.includes_start, interval.includes_end,
+                            point_type=point_type)
 
-    intervals = hl.eval(intervals)
+    if isinstance(intervals._ir, Literal):
+        intervals = intervals._ir.value
+    else:
+        intervals = hl.eval(intervals)
     intervals = [wrap_input(i) for i in intervals]
+    # sorted, disjoint intervals select the same rows with fewer comparisons
+    if _ordering_key(point_type) is not None:
+        try:
+            intervals = IntervalTree(intervals, point_type).merged()
+        except KeyError:
+            # a locus contig not in the reference genome; let the backend report it
+            pass
 
     if isinstance(ds, MatrixTable):
         return MatrixTable(MatrixFilterIntervals(ds._mir, intervals, point_type, keep))
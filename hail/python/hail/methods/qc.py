@@ -83,6 +83,52 @@ def sample_qc(mt, name='sample_qc') -> MatrixTable:
 
     require_row_key_variant(mt, 'sample_qc')
 
+    mt, partial, temp_fields = _sample_qc_partial(mt)
+    n_rows = mt.count_rows(_localize=False)
+    mt = mt.annotate_cols(**{name: hl.rbind(partial, lambda p: _finalize_sample_qc(p, n_rows))})
+    return mt.drop(*temp_fields)
+
+
+def _stats_partial(expr):
+    # the sufficient statistics of hl.agg.stats, which add across datasets
+    return hl.struct(n_def=hl.agg.count_where(hl.is_defined(expr)),
+                     sum=hl.agg.sum(expr),
+                     sumsq=hl.agg.sum(expr ** 2),
+                     min=hl.agg.min(expr),
+                     max=hl.agg.max(expr))
+
+
+def _finalize_stats(p):
+    # computed as in hl.agg.stats
+    return hl.bind(
+        lambda mean: hl.struct(
+            mean=mean,
+            stdev=hl.sqrt(hl.float64(p.sumsq - (2 * mean * p.sum) + (p.n_def * mean ** 2)) / p.n_def),
+            min=hl.float64(p.min),
+            max=hl.float64(p.max)),
+        hl.float64(p.sum) / p.n_def)
+
+
+def _gq_dp_partials(mt, method):
+    def has_field_of_type(name, dtype):
+        return name in mt.entry and mt[name].dtype == dtype
+
+    partials = {}
+    if has_field_of_type('DP', hl.tint32):
+        partials['dp'] = _stats_partial(mt.DP)
+
+    if has_field_of_type('GQ', hl.tint32):
+        partials['gq'] = _stats_partial(mt.GQ)
+
+    if not has_field_of_type('GT',  hl.tcall):
+        raise ValueError(f"'{method}': expect an entry field 'GT' of type 'call'")
+
+    return partials
+
+
+def _sample_qc_partial(mt):
+    """Returns `mt` with temporary row fields, the column-indexed partial
+    state of sample QC, and the names of the temporary fields."""
     from hail.expr.functions import _num_allele_type , _allele_types
 
     allele_types = _allele_types[:]
@@ -103,24 +149,11 @@ def sample_qc(mt, name='sample_qc') -> MatrixTable:
     mt = mt.annotate_rows(**{variant_ac: hl.agg.call_stats(mt.GT, mt.alleles).AC,
                              variant_atypes: mt.alleles[1:].map(lambda alt: allele_type(mt.alleles[0], alt))})
 
-    bound_exprs = {}
-    gq_dp_exprs = {}
-
-    def has_field_of_type(name, dtype):
-        return name in mt.entry and mt[name].dtype == dtype
-
-    if has_field_of_type('DP', hl.tint32):
-        gq_dp_exprs['dp_stats'] = hl.agg.stats(mt.DP).select('mean', 'stdev', 'min', 'max')
-
-    if has_field_of_type('GQ', hl.tint32):
-        gq_dp_exprs['gq_stats'] = hl.agg.stats(mt.GQ).select('mean', 'stdev', 'min', 'max')
-
-    if not has_field_of_type('GT',  hl.tcall):
-        raise ValueError(f"'sample_qc': expect an entry field 'GT' of type 'call'")
+    bound_exprs = _gq_dp_partials(mt, 'sample_qc')
 
+    bound_exprs['n_entries'] = hl.agg.count()
     bound_exprs['n_called'] = hl.agg.count_where(hl.is_defined(mt['GT']))
     bound_exprs['n_not_called'] = hl.agg.count_where(hl.is_missing(mt['GT']))
-    bound_exprs['n_filtered'] = mt.count_rows(_localize=False) - hl.agg.count()
     bound_exprs['n_hom_ref'] = hl.agg.count_where(mt['GT'].is_hom_ref())
     bound_exprs['n_het'] = hl.agg.count_where(mt['GT'].is_het())
     bound_exprs['n_singleton'] = hl.agg.sum(hl.sum(hl.range(0, mt['GT'].ploidy).map(lambda i: mt[variant_ac][mt['GT'][i]] == 1)))
@@ -134,37 +167,47 @@ def sample_qc(mt, name='sample_qc') -> MatrixTable:
 
     zero = hl.int64(0)
 
-    result_struct = hl.rbind(hl.struct(**bound_exprs),
-        lambda x: hl.rbind(
-            hl.struct(**{
-                **gq_dp_exprs,
-                'call_rate': hl.float64(x.n_called) / (x.n_called + x.n_not_called + x.n_filtered),
-                'n_called': x.n_called,
-                'n_not_called': x.n_not_called,
-                'n_filtered': x.n_filtered,
-                'n_hom_ref': x.n_hom_ref,
-                'n_het': x.n_het,
-                'n_hom_var': x.n_called - x.n_hom_ref - x.n_het,
-                'n_non_ref': x.n_called - x.n_hom_ref,
-                'n_singleton': x.n_singleton,
-                'n_snp': x.allele_type_counts.get(allele_ints["Transition"], zero) + \
-                         x.allele_type_counts.get(allele_ints["Transversion"], zero),
-                'n_insertion': x.allele_type_counts.get(allele_ints["Insertion"], zero),
-                'n_deletion': x.allele_type_counts.get(allele_ints["Deletion"], zero),
-                'n_transition': x.allele_type_counts.get(allele_ints["Transition"], zero),
-                'n_transversion': x.allele_type_counts.get(allele_ints["Transversion"], zero),
-                'n_star': x.allele_type_counts.get(allele_ints["Star"], zero)
-            }),
-            lambda s: s.annotate(
-                r_ti_tv=divide_null(hl.float64(s.n_transition), s.n_transversion),
-                r_het_hom_var=divide_null(hl.float64(s.n_het), s.n_hom_var),
-                r_insertion_deletion=divide_null(hl.float64(s.n_insertion), s.n_deletion)
-            )))
-
-    mt = mt.annotate_cols(**{name: result_struct})
-    mt = mt.drop(variant_ac, variant_atypes)
-
-    return mt
+    partial = hl.rbind(
+        hl.struct(**bound_exprs),
+        lambda x: x.drop('allele_type_counts').annotate(
+            **{f'n_{t.lower()}': x.allele_type_counts.get(allele_ints[t], zero)
+               for t in ['Transition', 'Transversion', 'Insertion', 'Deletion', 'Star']}))
+
+    return mt, partial, [variant_ac, variant_atypes]
+
+
+def _finalize_sample_qc(p, n_rows):
+    gq_dp_exprs = {}
+    if 'dp' in p:
+        gq_dp_exprs['dp_stats'] = _finalize_stats(p.dp)
+    if 'gq' in p:
+        gq_dp_exprs['gq_stats'] = _finalize_stats(p.gq)
+
+    n_filtered = n_rows - p.n_entries
+    return hl.rbind(
+        hl.struct(**{
+            **gq_dp_exprs,
+            'call_rate': hl.float64(p.n_called) / (p.n_called + p.n_not_called + n_filtered),
+            'n_called': p.n_called,
+            'n_not_called': p.n_not_called,
+            'n_filtered': n_filtered,
+            'n_hom_ref': p.n_hom_ref,
+            'n_het': p.n_het,
+            'n_hom_var': p.n_called - p.n_hom_ref - p.n_het,
+            'n_non_ref': p.n_called - p.n_hom_ref,
+            'n_singleton': p.n_singleton,
+            'n_snp': p.n_transition + p.n_transversion,
+            'n_insertion': p.n_insertion,
+            'n_deletion': p.n_deletion,
+            'n_transition': p.n_transition,
+            'n_transversion': p.n_transversion,
+            'n_star': p.n_star
+        }),
+        lambda s: s.annotate(
+            r_ti_tv=divide_null(hl.float64(s.n_transition), s.n_transversion),
+            r_het_hom_var=divide_null(hl.float64(s.n_het), s.n_hom_var),
+            r_insertion_deletion=divide_null(hl.float64(s.n_insertion), s.n_deletion)
+        ))
 
 
 @typecheck(mt=MatrixTable, name=str)
@@ -242,47 +285,230 @@ def variant_qc(mt, name='variant_qc') -> MatrixTable:
     """
     require_row_key_variant(mt, 'variant_qc')
 
-    bound_exprs = {}
+    n_cols = mt.count_cols(_localize=False)
+    return mt.annotate_rows(**{name: hl.rbind(_variant_qc_partial(mt),
+                                              lambda p: _finalize_variant_qc(p, mt.alleles, n_cols))})
+
+
+def _variant_qc_partial(mt):
+    bound_exprs = _gq_dp_partials(mt, 'variant_qc')
+    bound_exprs['n_entries'] = hl.agg.count()
+    bound_exprs['n_called'] = hl.agg.count_where(hl.is_defined(mt['GT']))
+    bound_exprs['n_not_called'] = hl.agg.count_where(hl.is_missing(mt['GT']))
+    bound_exprs['call_stats'] = hl.agg.call_stats(mt.GT, mt.alleles)
+    return hl.rbind(hl.struct(**bound_exprs),
+                    lambda x: x.drop('call_stats').annotate(AC=x.call_stats.AC,
+                                                            AN=x.call_stats.AN,
+                                                            homozygote_count=x.call_stats.homozygote_count))
+
+
+def _finalize_variant_qc(p, alleles, n_cols):
     gq_dp_exprs = {}
+    if 'dp' in p:
+        gq_dp_exprs['dp_stats'] = _finalize_stats(p.dp)
+    if 'gq' in p:
+        gq_dp_exprs['gq_stats'] = _finalize_stats(p.gq)
+
+    n_filtered = n_cols - p.n_entries
+    return hl.rbind(
+        hl.case().when(hl.len(alleles) == 2,
+                       hl.hardy_weinberg_test(p.homozygote_count[0],
+                                              p.AC[1] - 2 * p.homozygote_count[1],
+                                              p.homozygote_count[1])
+                       ).or_missing(),
+        lambda hwe: hl.struct(**{
+            **gq_dp_exprs,
+            'AC': p.AC,
+            'AF': hl.or_missing(p.AN != 0, p.AC.map(lambda ac: hl.float64(ac) / p.AN)),
+            'AN': p.AN,
+            'homozygote_count': p.homozygote_count,
+            'call_rate': hl.float(p.n_called) / (p.n_called + p.n_not_called + n_filtered),
+            'n_called': p.n_called,
+            'n_not_called': p.n_not_called,
+            'n_filtered': n_filtered,
+            'n_het': p.n_called - hl.sum(p.homozygote_count),
+            'n_non_ref': p.n_called - p.homozygote_count[0],
+            'het_freq_hwe': hwe.het_freq_hwe,
+            'p_value_hwe': hwe.p_value}))
+
+
+@typecheck(mt=MatrixTable)
+def sample_qc_partials(mt) -> Table:
+    """Compute mergeable partial sample QC statistics.
 
-    def has_field_of_type(name, dtype):
-        return name in mt.entry and mt[name].dtype == dtype
+    .. include:: ../_templates/req_tvariant.rst
 
-    if has_field_of_type('DP', hl.tint32):
-        gq_dp_exprs['dp_stats'] = hl.agg.stats(mt.DP).select('mean', 'stdev', 'min', 'max')
+    Examples
+    --------
 
-    if has_field_of_type('GQ', hl.tint32):
-        gq_dp_exprs['gq_stats'] = hl.agg.stats(mt.GQ).select('mean', 'stdev', 'min', 'max')
+    Persist the partial statistics of a dataset, then update them with new
+    variants without reading the old ones again:
 
-    if not has_field_of_type('GT',  hl.tcall):
-        raise ValueError(f"'variant_qc': expect an entry field 'GT' of type 'call'")
+    >>> dataset.write('output/dataset.mt')  # doctest: +SKIP
+    >>> hl.sample_qc_partials(dataset).write('output/sample_qc_partials.ht')  # doctest: +SKIP
+    >>> partials = hl.combine_qc_partials(hl.read_table('output/sample_qc_partials.ht'),
+    ...                                   hl.sample_qc_partials(new_variants))  # doctest: +SKIP
+    >>> dataset = dataset.annotate_cols(
+    ...     sample_qc=hl.sample_qc_from_partials(partials)[dataset.col_key].sample_qc)  # doctest: +SKIP
 
-    bound_exprs['n_called'] = hl.agg.count_where(hl.is_defined(mt['GT']))
-    bound_exprs['n_not_called'] = hl.agg.count_where(hl.is_missing(mt['GT']))
-    bound_exprs['n_filtered'] = mt.count_cols(_localize=False) - hl.agg.count()
-    bound_exprs['call_stats'] = hl.agg.call_stats(mt.GT, mt.alleles)
+    Notes
+    -----
+    The result is a table keyed by the column key of `mt`, with one row of
+    counts and sums per column and a global field `n_rows`. Partials of
+    datasets with disjoint rows are merged with :func:`.combine_qc_partials`,
+    and :func:`.sample_qc_from_partials` computes the fields of
+    :func:`.sample_qc` from them. The result equals :func:`.sample_qc` of the
+    union of the rows, except that `n_singleton` counts alleles that are
+    private among the columns of the dataset they were computed from.
+
+    Parameters
+    ----------
+    mt : :class:`.MatrixTable`
+        Dataset.
+
+    Returns
+    -------
+    :class:`.Table`
+    """
+    require_row_key_variant(mt, 'sample_qc_partials')
+
+    mt, partial, _ = _sample_qc_partial(mt)
+    uid = Env.get_uid()
+    ht = mt.annotate_cols(**{uid: partial}).cols()
+    return ht.select(**ht[uid]).select_globals(n_rows=mt.count_rows(_localize=False))
+
+
+@typecheck(mt=MatrixTable)
+def variant_qc_partials(mt) -> Table:
+    """Compute mergeable partial variant QC statistics.
+
+    .. include:: ../_templates/req_tvariant.rst
+
+    Examples
+    --------
+
+    Update persisted partial statistics with new samples:
+
+    >>> partials = hl.combine_qc_partials(hl.read_table('output/variant_qc_partials.ht'),
+    ...                                   hl.variant_qc_partials(new_samples))  # doctest: +SKIP
+    >>> dataset = dataset.annotate_rows(
+    ...     variant_qc=hl.variant_qc_from_partials(partials)[dataset.row_key].variant_qc)  # doctest: +SKIP
+
+    Notes
+    -----
+    The result is a table keyed by the row key of `mt`, with one row of counts
+    and sums per row and a global field `n_cols`. Partials of datasets with
+    disjoint columns are merged with :func:`.combine_qc_partials`, and
+    :func:`.variant_qc_from_partials` computes the fields of
+    :func:`.variant_qc` from them, equal to :func:`.variant_qc` of the union
+    of the columns.
+
+    Parameters
+    ----------
+    mt : :class:`.MatrixTable`
+        Dataset.
+
+    Returns
+    -------
+    :class:`.Table`
+    """
+    require_row_key_variant(mt, 'variant_qc_partials')
+
+    uid = Env.get_uid()
+    ht = mt.annotate_rows(**{uid: _variant_qc_partial(mt)}).rows()
+    return ht.select(**ht[uid]).select_globals(n_cols=mt.count_cols(_localize=False))
+
+
+def _merge_partial(l, r, name=None):
+    t = l.dtype
+    if isinstance(t, hl.tstruct):
+        return hl.struct(**{f: _merge_partial(l[f], r[f], f) for f in t})
+    if isinstance(t, hl.tarray):
+        return hl.range(0, hl.len(l)).map(lambda i: l[i] + r[i])
+    if name == 'min':
+        return hl.min(l, r)
+    if name == 'max':
+        return hl.max(l, r)
+    return l + r
+
+
+@typecheck(left=Table, right=Table)
+def combine_qc_partials(left, right) -> Table:
+    """Merge partial QC statistics of two datasets.
 
-    result = hl.rbind(hl.struct(**bound_exprs),
-                      lambda e1: hl.rbind(
-                          hl.case().when(hl.len(mt.alleles) == 2,
-                                         hl.hardy_weinberg_test(e1.call_stats.homozygote_count[0],
-                                                                e1.call_stats.AC[1] - 2 *
-                                                                e1.call_stats.homozygote_count[1],
-                                                                e1.call_stats.homozygote_count[1])
-                                         ).or_missing(),
-                          lambda hwe: hl.struct(**{
-                              **gq_dp_exprs,
-                              **e1.call_stats,
-                              'call_rate': hl.float(e1.n_called) / (e1.n_called + e1.n_not_called + e1.n_filtered),
-                              'n_called': e1.n_called,
-                              'n_not_called': e1.n_not_called,
-                              'n_filtered': e1.n_filtered,
-                              'n_het': e1.n_called - hl.sum(e1.call_stats.homozygote_count),
-                              'n_non_ref': e1.n_called - e1.call_stats.homozygote_count[0],
-                              'het_freq_hwe': hwe.het_freq_hwe,
-                              'p_value_hwe': hwe.p_value})))
-
-    return mt.annotate_rows(**{name: result})
+    Notes
+    -----
+    `left` and `right` must both be results of :func:`.sample_qc_partials`
+    computed from datasets with disjoint rows, or both of
+    :func:`.variant_qc_partials` computed from datasets with disjoint columns.
+    Keys in only one table keep its statistics, and are counted as filtered
+    in the other.
+
+    Parameters
+    ----------
+    left : :class:`.Table`
+    right : :class:`.Table`
+
+    Returns
+    -------
+    :class:`.Table`
+    """
+    if left.row.dtype != right.row.dtype or left.globals.dtype != right.globals.dtype:
+        raise ValueError(f"'combine_qc_partials': tables have different schemas:\n"
+                         f"  left: {left.row.dtype}, globals {left.globals.dtype}\n"
+                         f"  right: {right.row.dtype}, globals {right.globals.dtype}")
+    left_value = Env.get_uid()
+    right_value = Env.get_uid()
+    joined = left.select(**{left_value: left.row_value}).select_globals().join(
+        right.select(**{right_value: right.row_value}).select_globals(), how='outer')
+    l = joined[left_value]
+    r = joined[right_value]
+    joined = joined.select(**hl.case()
+                           .when(hl.is_missing(l), r)
+                           .when(hl.is_missing(r), l)
+                           .default(_merge_partial(l, r)))
+    return joined.select_globals(**{g: left.index_globals()[g] + right.index_globals()[g]
+                                    for g in left.globals})
+
+
+@typecheck(partials=Table, name=str)
+def sample_qc_from_partials(partials, name='sample_qc') -> Table:
+    """Compute sample QC metrics from :func:`.sample_qc_partials`.
+
+    Parameters
+    ----------
+    partials : :class:`.Table`
+        Partial statistics.
+    name : :obj:`str`
+        Name for resulting field.
+
+    Returns
+    -------
+    :class:`.Table`
+        Table keyed by column key with one field `name`, with the fields of
+        :func:`.sample_qc`.
+    """
+    return partials.select(**{name: _finalize_sample_qc(partials.row_value, partials.n_rows)}).select_globals()
+
+
+@typecheck(partials=Table, name=str)
+def variant_qc_from_partials(partials, name='variant_qc') -> Table:
+    """Compute variant QC metrics from :func:`.variant_qc_partials`.
+
+    Parameters
+    ----------
+    partials : :class:`.Table`
+        Partial statistics.
+    name : :obj:`str`
+        Name for resulting field.
+
+    Returns
+    -------
+    :class:`.Table`
+        Table keyed by row key with one field `name`, with the fields of
+        :func:`.variant_qc`.
+    """
+    return partials.select(**{name: _finalize_variant_qc(partials.row_value, partials.alleles, partials.n_cols)}).select_globals()
 
 
 @typecheck(left=MatrixTable,
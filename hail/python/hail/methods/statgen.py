@@ -11,11 +11,13 @@ from hail.ir import *
 from hail.genetics.reference_genome import reference_genome_type
 from hail.linalg import BlockMatrix
 from hail.matrixtable import MatrixTable
-from hail.methods.misc import require_biallelic, require_row_key_variant, require_col_key_str
+from hail.methods.misc import require_biallelic, require_row_key_variant, require_col_key_str, \
+    _banded_maximal_independent_set
 from hail.stats import LinearMixedModel
 from hail.table import Table
 from hail.typecheck import *
-from hail.utils import wrap_to_list, new_temp_file
+from hail.utils import wrap_to_list, new_temp_file, temp_files
+from hail.utils.misc import plural
 from hail.utils.java import *
 
 
@@ -281,8 +283,9 @@ def _get_regression_row_fields(mt, pass_through, method) -> Dict[str, str]:
            x=expr_float64,
            covariates=sequenceof(expr_float64),
            block_size=int,
-           pass_through=sequenceof(oneof(str, Expression)))
-def linear_regression_rows(y, x, covariates, block_size=16, pass_through=()) -> hail.Table:
+           pass_through=sequenceof(oneof(str, Expression)),
+           group_by_missingness=bool)
+def linear_regression_rows(y, x, covariates, block_size=16, pass_through=(), group_by_missingness=False) -> hail.Table:
     r"""For each row, test an input variable for association with
     response variables using linear regression.
 
@@ -309,6 +312,12 @@ def linear_regression_rows(y, x, covariates, block_size=16, pass_through=()) ->
     If `y` is a list of lists, then each inner list is treated as an
     independent group, subsetting columns for missingness separately.
 
+    If `y` is a list and `group_by_missingness` is ``True``, then each response
+    variable uses the columns for which it and all covariates are defined.
+    Response variables with the same defined columns are grouped as for a list
+    of lists, so the covariates are projected out once per group and each block
+    of rows is read once for all groups.
+
     Notes
     -----
     With the default root and `y` a single expression, the following row-indexed
@@ -338,6 +347,21 @@ def linear_regression_rows(y, x, covariates, block_size=16, pass_through=()) ->
     ``a[index_in_outer_list, index_in_inner_list]``. For example, if
     ``y=[[a], [b, c]]`` then the p-value for ``b`` is ``p_value[1][0]``.
 
+    If `y` is a list of expressions and `group_by_missingness` is ``True``,
+    then every field other than the row key and `pass_through` fields is an
+    array with one element per response variable. To get one row per row and
+    response variable, use
+
+    >>> result_ht = hl.linear_regression_rows(
+    ...     y=[dataset.pheno.height, dataset.pheno.age],
+    ...     x=dataset.GT.n_alt_alleles(),
+    ...     covariates=[1, dataset.pheno.is_female],
+    ...     group_by_missingness=True)
+    >>> fields = ['n', 'sum_x', 'y_transpose_x', 'beta', 'standard_error', 't_stat', 'p_value']
+    >>> result_ht = result_ht.annotate(result=hl.range(0, 2).map(
+    ...     lambda i: hl.struct(y_index=i, **{f: result_ht[f][i] for f in fields})))
+    >>> result_ht = result_ht.explode('result').drop(*fields)
+
 
     In the statistical genetics example above, the input variable `x` encodes
     genotype as the number of alternate alleles (0, 1, or 2). For each variant
@@ -383,6 +407,10 @@ def linear_regression_rows(y, x, covariates, block_size=16, pass_through=()) ->
         require more memory but may improve performance.
     pass_through : :obj:`list` of :obj:`str` or :class:`.Expression`
         Additional row fields to include in the resulting table.
+    group_by_missingness : :obj:`bool`
+        If ``True`` and `y` is a list, subset columns for missingness per
+        response variable, grouping response variables with the same defined
+        columns.
 
     Returns
     -------
@@ -397,6 +425,11 @@ def linear_regression_rows(y, x, covariates, block_size=16, pass_through=()) ->
     is_chained = y_is_list and isinstance(y[0], list)
     if is_chained and any(len(l) == 0 for l in y):
         raise ValueError(f"'linear_regression_rows': found empty inner list for 'y'")
+    if group_by_missingness and y_is_list:
+        if is_chained:
+            raise ValueError(f"'linear_regression_rows': 'group_by_missingness' requires 'y' to be "
+                             f"a list of expressions, found a list of lists")
+        return _linear_regression_rows_by_missingness(mt, y, x, covariates, block_size, pass_through)
 
     y = wrap_to_list(y)
 
@@ -447,6 +480,62 @@ def linear_regression_rows(y, x, covariates, block_size=16, pass_through=()) ->
     return ht_result.persist()
 
 
+def _mix64(x):
+    # the splitmix64 finalizer
+    x = hl.bit_xor(x, hl.bit_rshift(x, 30, logical=True)) * hl.int64(-4658895280553007687)
+    x = hl.bit_xor(x, hl.bit_rshift(x, 27, logical=True)) * hl.int64(-7723592293110705685)
+    return hl.bit_xor(x, hl.bit_rshift(x, 31, logical=True))
+
+
+def _missingness_groups(mt, y, covariates):
+    """Group the indices of `y` by the set of columns where that response
+    variable and all `covariates` are defined."""
+    cov_defined = hl.bool(True)
+    for c in covariates:
+        cov_defined = cov_defined & hl.is_defined(c)
+    defined = Env.get_uid()
+    idx = Env.get_uid()
+    cols = mt.select_cols(**{defined: hl.array([hl.is_defined(e) & cov_defined for e in y])}).cols()
+    cols = cols.add_index(idx)
+
+    # two independent hashes of each column index, summed over the defined
+    # columns of each response variable, with the number of defined columns
+    # fingerprint its set of columns
+    hashes = [_mix64(cols[idx] + k * (1 << 40) + 1) for k in range(2)]
+    fingerprints = cols.aggregate(hl.agg.array_agg(
+        lambda d: hl.tuple([hl.agg.count_where(d)] + [hl.agg.sum(hl.cond(d, h, hl.int64(0))) for h in hashes]),
+        cols[defined]))
+
+    groups = {}
+    for i, fingerprint in enumerate(fingerprints):
+        groups.setdefault(fingerprint, []).append(i)
+    return list(groups.values())
+
+
+def _linear_regression_rows_by_missingness(mt, y, x, covariates, block_size, pass_through):
+    groups = _missingness_groups(mt, y, covariates)
+    info(f'linear_regression_rows: found {len(groups)} missingness {plural("pattern", len(groups))} '
+         f'among {len(y)} response variables')
+
+    ht = linear_regression_rows([[y[i] for i in group] for group in groups], x, covariates,
+                                block_size=block_size, pass_through=pass_through)
+
+    group_index = [None] * len(y)
+    index_in_group = [None] * len(y)
+    for g, group in enumerate(groups):
+        for j, i in enumerate(group):
+            group_index[i] = g
+            index_in_group[i] = j
+    group_index = hl.literal(group_index, tarray(tint32))
+    index_in_group = hl.literal(index_in_group, tarray(tint32))
+
+    return ht.annotate(
+        **{f: hl.range(0, len(y)).map(lambda i: ht[f][group_index[i]])
+           for f in ['n', 'sum_x']},
+        **{f: hl.range(0, len(y)).map(lambda i: ht[f][group_index[i]][index_in_group[i]])
+           for f in ['y_transpose_x', 'beta', 'standard_error', 't_stat', 'p_value']})
+
+
 @typecheck(test=enumeration('wald', 'lrt', 'score', 'firth'),
            y=oneof(expr_float64, sequenceof(expr_float64), sequenceof(sequenceof(expr_float64))),
            x=expr_float64,
@@ -1110,8 +1199,8 @@ def linear_mixed_regression_rows(entry_expr,
         raise ValueError(f"linear_mixed_regression_rows: linear mixed model expects {model.n} samples, "
                          f"\n    but 'entry_expr' source has {n} columns.")
 
-    pa_t_path = new_temp_file() if pa_t_path is None else pa_t_path
-    a_t_path = new_temp_file() if a_t_path is None else a_t_path
+    pa_t_path = temp_files().manage(new_temp_file()) if pa_t_path is None else pa_t_path
+    a_t_path = temp_files().manage(new_temp_file()) if a_t_path is None else a_t_path
     p = BlockMatrix.read(model.p_path)
 
     BlockMatrix.write_from_entry_expr(entry_expr,
@@ -2635,7 +2724,7 @@ def ld_matrix(entry_expr, locus_expr, radius, coord_expr=None, block_size=None)
     """
     starts_and_stops = hl.linalg.utils.locus_windows(locus_expr, radius, coord_expr, _localize=False)
     ld = hl.row_correlation(entry_expr, block_size)
-    return BlockMatrix._from_java(ld._jbm.filterRowIntervalsIR(
+    return ld._derive_from_java(ld._jbm.filterRowIntervalsIR(
         Env.backend()._to_java_ir(starts_and_stops._ir),
         False))
 
@@ -3267,8 +3356,10 @@ def _local_ld_prune(mt, call_field, r2=0.2, bp_window_size=1000000, memory_per_c
            bp_window_size=int,
            memory_per_core=int,
            keep_higher_maf=bool,
-           block_size=nullable(int))
-def ld_prune(call_expr, r2=0.2, bp_window_size=1000000, memory_per_core=256, keep_higher_maf=True, block_size=None):
+           block_size=nullable(int),
+           max_local_edges=int)
+def ld_prune(call_expr, r2=0.2, bp_window_size=1000000, memory_per_core=256, keep_higher_maf=True, block_size=None,
+             max_local_edges=2000):
     """Returns a maximal subset of variants that are nearly uncorrelated within each window.
 
     .. include:: ../_templates/req_diploid_gt.rst
@@ -3310,11 +3401,15 @@ def ld_prune(call_expr, r2=0.2, bp_window_size=1000000, memory_per_core=256, kee
       correlated variants. The parallelism of writing the locally-pruned matrix
       table as a block matrix is ``n_locally_pruned_variants / block_size``.
 
-    - The third, "global pruning" stage applies :func:`.maximal_independent_set`
-      to prune variants from this graph until no edges remain. This algorithm
-      iteratively removes the variant with the highest vertex degree. If
-      `keep_higher_maf` is true, then in the case of a tie for highest degree,
-      the variant with lowest minor allele frequency is removed.
+    - The third, "global pruning" stage applies the greedy algorithm of
+      :func:`.maximal_independent_set` to prune variants from this graph until
+      no edges remain. This algorithm iteratively removes the variant with the
+      highest vertex degree. If `keep_higher_maf` is true, then in the case of
+      a tie for highest degree, the variant with lowest minor allele frequency
+      is removed. Since edges only join variants within `bp_window_size`, the
+      graph is split into clusters of overlapping windows which are pruned in
+      parallel. Only clusters with more than `max_local_edges` edges are
+      collected and pruned on the driver.
 
     Warning
     -------
@@ -3340,6 +3435,9 @@ def ld_prune(call_expr, r2=0.2, bp_window_size=1000000, memory_per_core=256, kee
     block_size: :obj:`int`, optional
         Block size for block matrices in the second stage.
         Default given by :meth:`.BlockMatrix.default_block_size`.
+    max_local_edges : :obj:`int`
+        Largest cluster of correlated pairs, in edges, pruned within a single
+        task in the third stage. Larger clusters are pruned on the driver.
 
     Returns
     -------
@@ -3413,15 +3511,21 @@ def ld_prune(call_expr, r2=0.2, bp_window_size=1000000, memory_per_core=256, kee
 
         def tie_breaker(l, r):
             return hl.sign(r.twice_maf - l.twice_maf)
+
+        def node_idx(node):
+            return node.idx
     else:
         tie_breaker = None
 
-    variants_to_remove = hl.maximal_independent_set(
-        entries.i, entries.j, keep=False, tie_breaker=tie_breaker, keyed=False)
+        def node_idx(node):
+            return node
+
+    variants_to_remove = _banded_maximal_independent_set(
+        entries, node_idx, tie_breaker=tie_breaker, max_local_edges=max_local_edges)
 
     locally_pruned_table = locally_pruned_table.annotate_globals(
         variants_to_remove = variants_to_remove.aggregate(
-            hl.agg.collect_as_set(variants_to_remove.node.idx), _localize=False))
+            hl.agg.collect_as_set(node_idx(variants_to_remove.node)), _localize=False))
     return locally_pruned_table.filter(
         locally_pruned_table.variants_to_remove.contains(hl.int32(locally_pruned_table.idx)),
         keep=False
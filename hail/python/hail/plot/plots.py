@@ -387,9 +387,9 @@ def histogram(data, range=None, bins=50, legend=None, title=None, log=False, int
                 start = range[0]
                 end = range[1]
             else:
-                finite_data = hail.bind(lambda x: hail.case().when(hail.is_finite(x), x).or_missing(), data)
-                start, end = agg_f((aggregators.min(finite_data),
-                                    aggregators.max(finite_data)))
+                finite_data = hail.case().when(hail.is_finite(data), data).or_missing()
+                start, end = _cached_aggregate(data, hail.tuple([aggregators.min(finite_data),
+                                                                 aggregators.max(finite_data)]))
                 if start is None and end is None:
                     raise ValueError(f"'data' contains no values that are defined and finite")
             data = agg_f(aggregators.hist(data, start, end, bins))
@@ -397,7 +397,7 @@ def histogram(data, range=None, bins=50, legend=None, title=None, log=False, int
             return ValueError('Invalid input')
     elif 'values' in data:
         cdf = data
-        hist, edges = np.histogram(cdf.values, bins=bins, weights=np.diff(cdf.ranks), density=True)
+        hist, edges = _cdf_histogram(cdf, bins=bins)
         data = Struct(bin_freq=hist, bin_edges=edges, n_larger=0, n_smaller=0)
 
 
@@ -441,7 +441,7 @@ def histogram(data, range=None, bins=50, legend=None, title=None, log=False, int
                     edges = np.linspace(cdf.values[0] - (1 - phase) * delta, cdf.values[-1] + phase * delta, bins)
                 else:
                     edges = np.linspace(cdf.values[0], cdf.values[-1], bins)
-                hist, edges = np.histogram(cdf.values, bins=edges, weights=np.diff(cdf.ranks), density=True)
+                hist, edges = _cdf_histogram(cdf, bins=edges)
                 new_data = {'top': hist, 'left': edges[:-1], 'right': edges[1:], 'bottom': np.full(len(hist), 0)}
                 q.data_source.data = new_data
                 bokeh.io.push_notebook(handle)
@@ -487,7 +487,7 @@ def cumulative_histogram(data, range=None, bins=50, legend=None, title=None, nor
                 start = range[0]
                 end = range[1]
             else:
-                start, end = agg_f((aggregators.min(data), aggregators.max(data)))
+                start, end = _cached_aggregate(data, hail.tuple([aggregators.min(data), aggregators.max(data)]))
             data = agg_f(aggregators.hist(data, start, end, bins))
         else:
             return ValueError('Invalid input')
@@ -621,8 +621,8 @@ def histogram2d(x: NumericExpression,
         x_range, y_range = range
     if x_range is None or y_range is None:
         warnings.warn('At least one range was not defined in histogram_2d. Doing two passes...')
-        ranges = source.aggregate(hail.struct(x_stats=hail.agg.stats(x),
-                                              y_stats=hail.agg.stats(y)))
+        ranges = _cached_aggregate(x, hail.struct(x_stats=hail.agg.stats(x),
+                                                  y_stats=hail.agg.stats(y)))
         if x_range is None:
             x_range = (ranges.x_stats.min, ranges.x_stats.max)
         if y_range is None:
@@ -642,12 +642,14 @@ def histogram2d(x: NumericExpression,
     x_levels = hail.literal(list(frange(x_range[0], x_range[1], x_spacing))[::-1])
     y_levels = hail.literal(list(frange(y_range[0], y_range[1], y_spacing))[::-1])
 
-    grouped_ht = source.group_by(
-        x=hail.str(x_levels.find(lambda w: x >= w)),
-        y=hail.str(y_levels.find(lambda w: y >= w))
-    ).aggregate(c=hail.agg.count())
-    data = grouped_ht.filter(hail.is_defined(grouped_ht.x) & (grouped_ht.x != str(x_range[1])) &
-                             hail.is_defined(grouped_ht.y) & (grouped_ht.y != str(y_range[1]))).to_pandas()
+    counts = source.aggregate(hail.agg.group_by(
+        hail.tuple([hail.str(x_levels.find(lambda w: x >= w)),
+                    hail.str(y_levels.find(lambda w: y >= w))]),
+        hail.agg.count()))
+    data = pd.DataFrame([(bin_x, bin_y, c) for (bin_x, bin_y), c in counts.items()
+                         if bin_x is not None and bin_x != str(x_range[1]) and
+                         bin_y is not None and bin_y != str(y_range[1])],
+                        columns=['x', 'y', 'c'])
 
     # Use python prettier float -> str function
     data['x'] = data['x'].apply(lambda e: str(float(e)))
@@ -686,23 +688,83 @@ def histogram2d(x: NumericExpression,
     return p
 
 
+# number of small plot aggregations (ranges, stats and marginal summaries)
+# cached per Table or MatrixTable
+_PLOT_CACHE_SIZE = 16
+
+
+def _plot_cache(source) -> collections.OrderedDict:
+    # held by the source, so it is freed with it
+    cache = getattr(source, '_plot_cache', None)
+    if cache is None:
+        cache = collections.OrderedDict()
+        source._plot_cache = cache
+    return cache
+
+
+def _cache_put(cache, key, value):
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _PLOT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _cached_aggregate(data: Expression, agg_expr: Expression):
+    """Aggregate `agg_expr` over the source of `data`, reusing the result of an
+    identical aggregation recently run over the same source object.
+
+    Only use this for aggregations with small results, such as ranges.
+    """
+    cache = _plot_cache(data._indices.source)
+    key = str(agg_expr._ir)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    result = data._aggregation_method()(agg_expr)
+    _cache_put(cache, key, result)
+    return result
+
+
+def _cdf_histogram(cdf, bins=10):
+    """Density histogram of the values summarized by an :func:`.agg.approx_cdf`
+    result, as :func:`numpy.histogram` with ``density=True``. An empty
+    summary has zero density rather than NaN."""
+    hist, edges = np.histogram(cdf.values, bins=bins, weights=np.diff(cdf.ranks))
+    hist = hist.astype(np.float64)
+    total = np.sum(hist)
+    if total > 0:
+        hist = hist / (total * np.diff(edges))
+    return hist, edges
+
+
 def _collect_scatter_plot_data(
         x: Tuple[str, NumericExpression],
         y: Tuple[str, NumericExpression],
         fields: Dict[str, Expression] = None,
         n_divisions: int = None,
-        missing_label: str =  'NA'
-) -> pd.DataFrame:
+        missing_label: str = 'NA',
+        marginal_cols: List[str] = None
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, Struct, Dict[str, Dict[Any, Struct]]]]:
+    """Collect (or downsample) the points of a scatter plot in a single
+    aggregation over the source of `x` and `y`.
+
+    If `marginal_cols` is not ``None``, the marginal distributions of `x` and
+    `y` are summarized in the same pass with :func:`.agg.approx_cdf`, both
+    over all points and grouped by the value of each field named in
+    `marginal_cols`. The result is then a tuple of the points, the overall
+    summaries and a dictionary mapping each of those fields to its per-group
+    summaries.
+
+    The marginal summaries are cached on the source, so replotting the same
+    expressions only collects the points again. The points are never cached.
+    """
 
     expressions = dict()
     if fields is not None:
         expressions.update({k: hail.or_else(v, missing_label) if isinstance(v, StringExpression) else v for k, v in fields.items()})
 
-    if n_divisions is None:
-        collect_expr = hail.struct(**dict((k,v) for k,v in (x,y)), **expressions)
-        plot_data = [point for point in collect_expr.collect() if point[x[0]] is not None and point[y[0]] is not None]
-        source_pd = pd.DataFrame(plot_data)
-    else:
+    numeric_expr = {}
+    if n_divisions is not None:
         # FIXME: remove the type conversion logic if/when downsample supports continuous values for labels
         # Save all numeric types to cast in DataFrame
         numeric_expr = {k: 'int32' for k,v in expressions.items() if isinstance(v, Int32Expression)}
@@ -713,17 +775,49 @@ def _collect_scatter_plot_data(
         # Cast non-string types to string
         expressions = {k: hail.str(v) if not isinstance(v, StringExpression) else v for k,v in expressions.items()}
 
-        agg_f = x[1]._aggregation_method()
-        res = agg_f(hail.agg.downsample(x[1], y[1], label=list(expressions.values()) if expressions else None, n_divisions=n_divisions))
+    defined = hail.is_defined(x[1]) & hail.is_defined(y[1])
+    if n_divisions is None:
+        points = hail.agg.filter(defined, hail.agg.collect(hail.struct(**dict((k,v) for k,v in (x,y)), **expressions)))
+    else:
+        points = hail.agg.downsample(x[1], y[1], label=list(expressions.values()) if expressions else None, n_divisions=n_divisions)
+    agg_f = x[1]._aggregation_method()
+
+    if marginal_cols is None:
+        res = Struct(points=agg_f(points))
+    else:
+        def marginal_cdfs():
+            return hail.struct(x=hail.agg.approx_cdf(hail.float64(x[1])),
+                               y=hail.agg.approx_cdf(hail.float64(y[1])))
+        marginals_expr = hail.agg.filter(defined, hail.struct(
+            all=marginal_cdfs(),
+            by_field=hail.tuple([hail.agg.group_by(expressions[col], marginal_cdfs()) for col in marginal_cols])))
+        cache = _plot_cache(x[1]._indices.source)
+        key = str(marginals_expr._ir)
+        if key in cache:
+            cache.move_to_end(key)
+            res = Struct(points=agg_f(points), marginals=cache[key])
+        else:
+            # one pass for both, keeping only the summaries
+            res = agg_f(hail.struct(points=points, marginals=marginals_expr))
+            _cache_put(cache, key, res.marginals)
+
+    if n_divisions is None:
+        source_pd = pd.DataFrame(res.points)
+    else:
         source_pd = pd.DataFrame([
             dict(
                 **{x[0]: point[0], y[0]: point[1]},
                 **(dict(zip(expressions, point[2])) if point[2] is not None else {})
-            ) for point in res
+            ) for point in res.points
         ])
         source_pd = source_pd.astype(numeric_expr, copy=False)
 
-    return source_pd
+    if marginal_cols is None:
+        return source_pd
+
+    factor_marginals = {col: {k: v for k, v in res.marginals.by_field[i].items() if k is not None}
+                        for i, col in enumerate(marginal_cols)}
+    return source_pd, res.marginals.all, factor_marginals
 
 
 def _get_categorical_palette(factors: List[str]) -> Dict[str, str]:
@@ -1068,19 +1162,19 @@ def joint_plot(
         y = ('y', y)
 
     label_cols = list(label.keys())
-    source_pd = _collect_scatter_plot_data(x, y, fields={**hover_fields, **label}, n_divisions=None if collect_all else None, missing_label=missing_label)
+    factor_cols = [col for col, v in label.items()
+                   if not isinstance(v, (Int32Expression, Int64Expression, Float32Expression, Float64Expression))]
+    source_pd, marginals, factor_marginals = _collect_scatter_plot_data(
+        x, y, fields={**hover_fields, **label}, n_divisions=None if collect_all else n_divisions,
+        missing_label=missing_label, marginal_cols=factor_cols)
     sp = figure(title=title, x_axis_label=xlabel, y_axis_label=ylabel, height=height, width=width)
     sp, sp_legend_items, sp_legend, sp_color_bar, sp_color_mappers, sp_scatter_renderers = _get_scatter_plot_elements(sp, source_pd, x[0], y[0], label_cols, colors, size)
 
-    continuous_cols = [col for col in label_cols if
-                       (str(source_pd.dtypes[col]).startswith('float') or
-                        str(source_pd.dtypes[col]).startswith('int'))]
-    factor_cols = [col for col in label_cols if col not in continuous_cols]
+    continuous_cols = [col for col in label_cols if col not in factor_cols]
 
-    # Density plots
+    # Density plots, computed from the marginal distributions of all points
+    # rather than from the (possibly downsampled) points being drawn
     def get_density_plot_items(
-            source_pd,
-            data_col,
             p,
             x_axis,
             colors: Dict[str, ColorMapper],
@@ -1088,10 +1182,11 @@ def joint_plot(
             factor_cols: List[str]
     ):
 
+        marginal_field = 'x' if x_axis else 'y'
         density_renderers = []
         max_densities = {}
         if not factor_cols or continuous_cols:
-            dens, edges = np.histogram(source_pd[data_col], density=True)
+            dens, edges = _cdf_histogram(marginals[marginal_field])
             edges = edges[:-1]
             xy = (edges, dens) if x_axis else (dens, edges)
             cds = ColumnDataSource({'x': xy[0], 'y': xy[1]})
@@ -1102,8 +1197,9 @@ def joint_plot(
         for factor_col in factor_cols:
             factor_colors = colors.get(factor_col, _get_categorical_palette(list(set(source_pd[factor_col]))))
             factor_colors = dict(zip(factor_colors.factors, factor_colors.palette))
-            density_data = source_pd[[factor_col, data_col]].groupby(factor_col).apply(lambda df: np.histogram(df['x' if x_axis else 'y'], density=True))
-            for factor, (dens, edges) in density_data.iteritems():
+            density_data = {factor: _cdf_histogram(cdfs[marginal_field])
+                            for factor, cdfs in factor_marginals[factor_col].items()}
+            for factor, (dens, edges) in density_data.items():
                 edges = edges[:-1]
                 xy = (edges, dens) if x_axis else (dens, edges)
                 cds = ColumnDataSource({'x': xy[0], 'y': xy[1]})
@@ -1116,10 +1212,10 @@ def joint_plot(
         return p, density_renderers, max_densities
 
     xp = figure(title=title, height=int(height / 3), width=width, x_range=sp.x_range)
-    xp, x_renderers, x_max_densities = get_density_plot_items(source_pd, x[0], xp, x_axis=True, colors=sp_color_mappers, continuous_cols=continuous_cols, factor_cols=factor_cols)
+    xp, x_renderers, x_max_densities = get_density_plot_items(xp, x_axis=True, colors=sp_color_mappers, continuous_cols=continuous_cols, factor_cols=factor_cols)
     xp.xaxis.visible = False
     yp = figure(height=height, width=int(width / 3), y_range=sp.y_range)
-    yp, y_renderers, y_max_densities = get_density_plot_items(source_pd, y[0], yp, x_axis=False, colors=sp_color_mappers, continuous_cols=continuous_cols, factor_cols=factor_cols)
+    yp, y_renderers, y_max_densities = get_density_plot_items(yp, x_axis=False, colors=sp_color_mappers, continuous_cols=continuous_cols, factor_cols=factor_cols)
     yp.yaxis.visible = False
     density_renderers = x_renderers + y_renderers
     first_row = [xp]
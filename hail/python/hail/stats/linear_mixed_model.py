@@ -7,6 +7,7 @@ from hail.linalg.utils import _check_dims
 from hail.table import Table
 from hail.typecheck import *
 from hail.utils.java import Env, jnone, jsome, info
+from hail.utils.temp_files import temp_files
 from hail.utils.misc import plural
 
 
@@ -741,7 +742,12 @@ class LinearMixedModel(object):
             maybe_ja_t = jsome(
                 Env.hail().linalg.RowMatrix.readBlockMatrix(Env.hc()._jhc, a_t_path, jsome(partition_size)))
 
-        return Table._from_java(self._scala_model.fit(jpa_t, maybe_ja_t))
+        ht = Table._from_java(self._scala_model.fit(jpa_t, maybe_ja_t))
+        # the table is computed lazily from the matrices on the JVM
+        for path in (pa_t_path, a_t_path):
+            if path is not None:
+                temp_files().attach(path, ht._tir)
+        return ht
 
     @typecheck_method(pa=np.ndarray, a=nullable(np.ndarray), return_pandas=bool)
     def fit_alternatives_numpy(self, pa, a=None, return_pandas=False):
@@ -6,6 +6,7 @@ import pyspark
 from typing import *
 
 from hail.expr.expressions import *
+from hail.expr.generic_summary import sampled_header, sampled_partitions
 from hail.expr.table_type import *
 from hail.ir import *
 from hail.typecheck import *
@@ -3196,21 +3197,58 @@ class Table(ExprContainer):
 
         return Table(TableDistinct(self._tir))
 
-    def summarize(self):
+    @typecheck_method(partitions=nullable(int), seed=nullable(int), progressive=bool)
+    def summarize(self, *, partitions=None, seed=None, progressive=False):
         """Compute and print summary information about the fields in the table.
 
         .. include:: _templates/experimental.rst
-        """
 
-        computations, printers = hl.expr.generic_summary(self.row, skip_top=True)
-        results = self.aggregate(computations)
-        for name, fields in printers:
-            print(f'* {name}:')
+        Examples
+        --------
+        Estimate summaries from 10 randomly chosen partitions:
+
+        >>> table1.summarize(partitions=10)  # doctest: +SKIP
+
+        Notes
+        -----
+        By default, every row is summarized. If `partitions` is set, only that
+        many randomly chosen partitions are read, and counts and sums are
+        estimated by scaling by the fraction of partitions read. Proportions
+        and means are reported with 95% confidence intervals that treat the
+        sampled rows as a simple random sample, labeled SRS; they understate the
+        uncertainty when partitions differ systematically, as in a table
+        sorted by locus. Minima, maxima and sample values are those of the
+        sampled rows.
+
+        With `progressive`, the summary is printed after reading 1, 2, 4, ...
+        of the sampled partitions, so estimates can be checked before the
+        full sample is read. Rows are summarized again in each round, so this
+        at most doubles the work.
 
-            max_k_len = max(len(f) for f in fields)
-            for k, v in fields.items():
-                print(f'    {k.rjust(max_k_len)} : {v(results)}')
-            print()
+        Parameters
+        ----------
+        partitions : :obj:`int`, optional
+            Number of randomly chosen partitions to summarize. Summarize all
+            partitions if ``None``.
+        seed : :obj:`int`, optional
+            Random seed for choosing partitions.
+        progressive : :obj:`bool`
+            Print estimates from progressively more partitions.
+        """
+        for parts, scale in sampled_partitions(self.n_partitions(), partitions, seed, progressive):
+            t = self if parts is None else self._filter_partitions(parts)
+            computations, printers = hl.expr.generic_summary(t.row, skip_top=True, scale=scale)
+            results = t.aggregate(computations)
+            if parts is not None:
+                print(sampled_header(len(parts), self.n_partitions()))
+                print()
+            for name, fields in printers:
+                print(f'* {name}:')
+
+                max_k_len = max(len(f) for f in fields)
+                for k, v in fields.items():
+                    print(f'    {k.rjust(max_k_len)} : {v(results)}')
+                print()
 
     @typecheck_method(parts=sequenceof(int), keep=bool)
     def _filter_partitions(self, parts, keep=True) -> 'Table':
@@ -2,7 +2,8 @@ from .misc import wrap_to_list, get_env_or_default, uri_path, local_path_uri, ne
 from .hadoop_utils import hadoop_copy, hadoop_open, hadoop_exists, hadoop_is_dir, hadoop_is_file, hadoop_ls, hadoop_stat, copy_log
 from .struct import Struct
 from .linkedlist import LinkedList
-from .interval import Interval
+from .interval import Interval, IntervalTree
+from .temp_files import TemporaryFileManager, temp_files
 from .java import error, warn, info, FatalError
 from .tutorial import get_1kg, get_movie_lens
 
@@ -18,6 +19,8 @@ __all__ = ['hadoop_open',
            'new_local_temp_dir',
            'new_local_temp_file',
            'new_temp_file',
+           'temp_files',
+           'TemporaryFileManager',
            'get_env_or_default',
            'storage_level',
            'uri_path',
@@ -25,6 +28,7 @@ __all__ = ['hadoop_open',
            'run_command',
            'Struct',
            'Interval',
+           'IntervalTree',
            'error',
            'warn',
            'info',
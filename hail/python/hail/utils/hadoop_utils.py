@@ -70,7 +70,9 @@ def hadoop_open(path: str, mode: str = 'r', buffer_size: int = 8192):
     mode : :obj:`str`
         File access mode.
     buffer_size : :obj:`int`
-        Buffer size, in bytes.
+        Buffer size, in bytes. Independently of this buffer, files are read
+        in the background, ahead of the caller, in chunks that grow to a few
+        megabytes, and written in megabyte chunks.
 
     Returns
     -------
@@ -1,3 +1,6 @@
+import bisect
+import math
+
 from hail.typecheck import *
 from hail.utils.java import *
 from hail.expr.types import hail_type
@@ -6,6 +9,57 @@ import hail as hl
 interval_type = lazy()
 
 
+def _ordering_key(t):
+    """A function mapping values of type `t` to Python values that sort in
+    the backend's order for `t`, with missing values last, or ``None`` if `t`
+    is not supported."""
+    if t in (hl.tint32, hl.tint64, hl.tbool, hl.tstr):
+        f = _identity
+    elif t in (hl.tfloat32, hl.tfloat64):
+        f = _float_key
+    elif isinstance(t, hl.tlocus):
+        contig_index = {contig: i for i, contig in enumerate(t.reference_genome.contigs)}
+
+        def f(l):
+            return contig_index[l.contig], l.position
+    elif isinstance(t, (hl.tstruct, hl.ttuple)):
+        fields = list(t) if isinstance(t, hl.tstruct) else list(range(len(t.types)))
+        keys = [_ordering_key(ft) for ft in (t.values() if isinstance(t, hl.tstruct) else t.types)]
+        if any(k is None for k in keys):
+            return None
+
+        def f(x):
+            return tuple(k(x[i]) for i, k in zip(fields, keys))
+    elif isinstance(t, hl.tarray):
+        k = _ordering_key(t.element_type)
+        if k is None:
+            return None
+
+        def f(a):
+            return tuple(k(x) for x in a)
+    else:
+        return None
+
+    def key(x):
+        return (1,) if x is None else (0, f(x))
+    return key
+
+
+def _identity(x):
+    return x
+
+
+def _float_key(x):
+    # NaN is greater than every other number
+    return (1,) if math.isnan(x) else (0, x)
+
+
+# Bounds are compared as (key, tag) pairs, with points tagged 1, so that a
+# point lies inside an interval if start bound < point < end bound.
+_INCLUSIVE_START, _POINT, _EXCLUSIVE_START = 0, 1, 2
+_EXCLUSIVE_END, _INCLUSIVE_END = 0, 2
+
+
 class Interval(object):
     """
     An object representing a range of values between `start` and `end`.
@@ -185,6 +239,17 @@ class Interval(object):
         :obj:`bool`
         """
 
+        if not isinstance(value, hl.expr.Expression):
+            key = _ordering_key(self._point_type)
+            if key is not None:
+                try:
+                    start, end = self._bounds(key)
+                    point = (key(value), _POINT)
+                except (KeyError, TypeError, AttributeError):
+                    pass
+                else:
+                    return start < point < end
+
         return hl.eval(hl.literal(self, hl.tinterval(self._point_type)).contains(value))
 
     @typecheck_method(interval=interval_type)
@@ -201,6 +266,199 @@ class Interval(object):
         :obj:`bool`
         """
 
+        if interval.point_type == self._point_type:
+            key = _ordering_key(self._point_type)
+            if key is not None:
+                try:
+                    start, end = self._bounds(key)
+                    other_start, other_end = interval._bounds(key)
+                except (KeyError, TypeError, AttributeError):
+                    pass
+                else:
+                    return _bounds_overlap(start, end, other_start, other_end)
+
         return hl.eval(hl.literal(self, hl.tinterval(self._point_type)).overlaps(interval))
 
+    def _bounds(self, key):
+        return ((key(self._start), _INCLUSIVE_START if self._includes_start else _EXCLUSIVE_START),
+                (key(self._end), _INCLUSIVE_END if self._includes_end else _EXCLUSIVE_END))
+
+
+def _bounds_overlap(start, end, other_start, other_end):
+    # bounds are tagged so that equal keys overlap only if both are inclusive
+    return _below(start, other_end) and _below(other_start, end)
+
+
+def _below(start, end):
+    return start[0] < end[0] or (start[0] == end[0] and start[1] == _INCLUSIVE_START and end[1] == _INCLUSIVE_END)
+
+
+def _adjacent_or_overlapping(start, end):
+    # true if no point lies between `end` and a later `start`
+    return start[0] < end[0] or (start[0] == end[0] and not (start[1] == _EXCLUSIVE_START and end[1] == _EXCLUSIVE_END))
+
+
 interval_type.set(Interval)
+
+
+class IntervalTree(object):
+    """An index of :class:`.Interval` objects with the same point type, for
+    answering many containment and overlap queries in Python.
+
+    Examples
+    --------
+
+    >>> tree = hl.utils.IntervalTree([hl.Interval(1, 5), hl.Interval(3, 8), hl.Interval(10, 12)])
+    >>> tree.contains(7)
+    True
+    >>> tree.contains_each([0, 4, 9, 10])
+    [False, True, False, True]
+    >>> tree.query(4)
+    [Interval(start=1, end=5, includes_start=True, includes_end=False), Interval(start=3, end=8, includes_start=True, includes_end=False)]
+    >>> tree.merged()
+    [Interval(start=1, end=8, includes_start=True, includes_end=False), Interval(start=10, end=12, includes_start=True, includes_end=False)]
+
+    Notes
+    -----
+    Points are compared as the backend orders them. Supported point types are
+    numeric, boolean and string types, :class:`.tlocus`, and structs, tuples
+    and arrays of supported types, including the struct key prefixes used by
+    :func:`.filter_intervals`.
+
+    Parameters
+    ----------
+    intervals : :obj:`list` of :class:`.Interval`
+        Intervals to index.
+    point_type : :class:`.HailType`, optional
+        Point type of the intervals. Required if `intervals` is empty.
+    """
+
+    @typecheck_method(intervals=sequenceof(interval_type), point_type=nullable(hail_type))
+    def __init__(self, intervals, point_type=None):
+        if point_type is None:
+            if not intervals:
+                raise ValueError("'IntervalTree': 'point_type' is required when there are no intervals")
+            point_type = intervals[0].point_type
+        for i in intervals:
+            if i.point_type != point_type:
+                raise TypeError(f"'IntervalTree': expected intervals with point type '{point_type}', "
+                                f"found '{i.point_type}'")
+        self._key = _ordering_key(point_type)
+        if self._key is None:
+            raise NotImplementedError(f"'IntervalTree': unsupported point type '{point_type}'")
+        self.point_type = point_type
+
+        bounds = sorted(((i._bounds(self._key), i) for i in intervals), key=lambda x: x[0][0])
+        self._intervals = [i for _, i in bounds]
+        self._starts = [start for (start, _), _ in bounds]
+        self._ends = [end for (_, end), _ in bounds]
+        # _max_ends[i] is the largest end bound among the first i + 1 intervals
+        self._max_ends = []
+        for end in self._ends:
+            self._max_ends.append(end if not self._max_ends or end > self._max_ends[-1] else self._max_ends[-1])
+
+        # the union of the intervals as sorted, disjoint bounds
+        self._merged = []
+        for (start, end), i in bounds:
+            if not _below(start, end):
+                # empty
+                continue
+            if self._merged and _adjacent_or_overlapping(start, self._merged[-1][1]):
+                if end > self._merged[-1][1]:
+                    self._merged[-1][1] = end
+                    self._merged[-1][3] = i
+            else:
+                self._merged.append([start, end, i, i])
+        self._merged_starts = [m[0] for m in self._merged]
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def contains(self, point):
+        """True if any interval contains `point`.
+
+        Returns
+        -------
+        :obj:`bool`
+        """
+        p = (self._key(point), _POINT)
+        i = bisect.bisect_right(self._merged_starts, p) - 1
+        return i >= 0 and p < self._merged[i][1]
+
+    def contains_each(self, points):
+        """For each point, whether any interval contains it.
+
+        Returns
+        -------
+        :obj:`list` of :obj:`bool`
+        """
+        return [self.contains(p) for p in points]
+
+    def query(self, point):
+        """Intervals that contain `point`, ordered by start.
+
+        Returns
+        -------
+        :obj:`list` of :class:`.Interval`
+        """
+        k = self._key(point)
+        return self._query((k, _INCLUSIVE_START), (k, _INCLUSIVE_END))
+
+    @typecheck_method(interval=interval_type)
+    def overlaps(self, interval):
+        """True if any interval overlaps `interval`.
+
+        Returns
+        -------
+        :obj:`bool`
+        """
+        start, end = interval._bounds(self._key)
+        if not _below(start, end):
+            return False
+        i = bisect.bisect_right(self._merged_starts, start)
+        # the merged interval before `start`, and the first one after it
+        return any(_bounds_overlap(m[0], m[1], start, end) for m in self._merged[max(i - 1, 0):i + 1])
+
+    def overlaps_each(self, intervals):
+        """For each interval, whether any indexed interval overlaps it.
+
+        Returns
+        -------
+        :obj:`list` of :obj:`bool`
+        """
+        return [self.overlaps(i) for i in intervals]
+
+    @typecheck_method(interval=interval_type)
+    def query_overlaps(self, interval):
+        """Intervals that overlap `interval`, ordered by start.
+
+        Returns
+        -------
+        :obj:`list` of :class:`.Interval`
+        """
+        start, end = interval._bounds(self._key)
+        return self._query(start, end)
+
+    def _query(self, start, end):
+        result = []
+        # intervals ending before `start` are a prefix of those whose running
+        # maximum end is below it
+        lo = bisect.bisect_left(self._max_ends, start)
+        hi = bisect.bisect_right(self._starts, end)
+        for i in range(lo, hi):
+            if _bounds_overlap(self._starts[i], self._ends[i], start, end):
+                result.append(self._intervals[i])
+        return result
+
+    def merged(self):
+        """The union of the intervals as sorted, disjoint intervals.
+
+        Overlapping intervals, and intervals with no point between them, are
+        merged.
+
+        Returns
+        -------
+        :obj:`list` of :class:`.Interval`
+        """
+        return [Interval(first.start, last.end, first.includes_start, last.includes_end, point_type=self.point_type)
+                for _, _, first, last in self._merged]
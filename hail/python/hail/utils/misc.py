@@ -1,7 +1,5 @@
-import atexit
 import datetime
 import difflib
-import shutil
 import tempfile
 from collections import defaultdict, Counter
 from random import Random
@@ -16,6 +14,7 @@ import hail
 import hail as hl
 from hail.typecheck import enumeration, typecheck, nullable
 from hail.utils.java import Env, joption, error
+from hail.utils.temp_files import temp_files
 
 
 
@@ -147,13 +146,13 @@ def local_path_uri(path):
 
 
 def new_temp_file(suffix=None, prefix=None, n_char=10):
-    return Env.hc()._jhc.getTemporaryFile(n_char, joption(prefix), joption(suffix))
+    path = Env.hc()._jhc.getTemporaryFile(n_char, joption(prefix), joption(suffix))
+    return temp_files().register(path)
 
 
 def new_local_temp_dir(suffix=None, prefix=None, dir=None):
     local_temp_dir = tempfile.mkdtemp(suffix, prefix, dir)
-    atexit.register(shutil.rmtree, local_temp_dir)
-    return local_temp_dir
+    return temp_files().register(local_temp_dir, local=True)
 
 
 def new_local_temp_file(filename="temp"):
@@ -0,0 +1,324 @@
+import atexit
+import os
+import shutil
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from .java import Env, warn
+
+
+def _normalize(path):
+    if path.startswith('file://'):
+        return path[len('file://'):]
+    return path
+
+
+class _TempFile(object):
+    __slots__ = ['key', 'path', 'local', 'managed', 'n_dependents', 'n_pins', 'size', 'last_used', 'released']
+
+    def __init__(self, key, path, local, managed):
+        # 'path' as registered, with any scheme; 'key' identifies it
+        self.key = key
+        self.path = path
+        self.local = local
+        # only managed files are deleted before the session stops
+        self.managed = managed
+        self.n_dependents = 0
+        self.n_pins = 0
+        self.size = None
+        self.last_used = time.time()
+        # True once nothing can read the file, so it may be deleted
+        self.released = False
+
+
+class TemporaryFileManager(object):
+    """Tracks the temporary files of a Hail session and deletes them early.
+
+    Paths returned by :func:`.new_temp_file` and :func:`.new_local_temp_dir`
+    are registered with the session's manager and deleted when the session
+    stops. Readers of a registered path (:func:`.read_table`,
+    :func:`.read_matrix_table`, :meth:`.BlockMatrix.read` and friends) become
+    its dependents, as do objects derived from them on the JVM.
+
+    Files are only deleted earlier if they are managed: created inside a
+    :meth:`scope`, or passed to :meth:`manage`. A managed file that is not
+    pinned is deleted
+
+    - when its last dependent is garbage collected, or
+    - when the :meth:`scope` it was created in exits and it never had a
+      dependent.
+
+    Other files are kept until the session stops, so a path from
+    :func:`.new_temp_file` can be written and read again at any time.
+
+    If :attr:`quota` is set (in bytes), the least recently used managed files
+    that have no dependents, are not pinned and are not in an open scope are
+    deleted whenever scratch usage exceeds it.
+
+    Examples
+    --------
+
+    >>> with hl.utils.temp_files().scope():  # doctest: +SKIP
+    ...     path = hl.utils.new_temp_file()
+    ...     mt.rows().write(path)
+    ...     n = hl.read_table(path).count()
+    """
+
+    def __init__(self, quota=None):
+        self.quota = quota
+        self._lock = threading.RLock()
+        # least recently used first
+        self._files = OrderedDict()
+        self._scopes = []
+        # paths whose last dependent was collected; deleted on the next call
+        # into the manager rather than from a finalizer
+        self._pending = []
+        # keys of the files each live dependent depends on, by id
+        self._dependencies = {}
+
+    def register(self, path, local=False):
+        """Track a newly created temporary `path`. It is managed if created in
+        a :meth:`scope`."""
+        key = _normalize(path)
+        with self._lock:
+            self._files[key] = _TempFile(key, path, local, managed=bool(self._scopes))
+            if self._scopes:
+                self._scopes[-1].append(key)
+            self._delete_pending()
+        return path
+
+    def manage(self, path):
+        """Delete `path`, or the registered temporary directory containing
+        it, when its last dependent is garbage collected. Returns `path`."""
+        with self._lock:
+            f = self._find(_normalize(path))
+            if f is not None:
+                f.managed = True
+        return path
+
+    def attach(self, path, obj):
+        """Record that `obj` reads `path`. `path`, or the registered temporary
+        directory containing it, is kept while `obj` lives. Does nothing if
+        `path` is not in a registered temporary file."""
+        with self._lock:
+            f = self._find(_normalize(path))
+            if f is None:
+                return
+            key = f.key
+            keys = self._dependencies.get(id(obj))
+            if keys is None:
+                keys = self._dependencies[id(obj)] = set()
+            elif key in keys:
+                return
+            keys.add(key)
+            f.n_dependents += 1
+            f.released = False
+            self._touch(f)
+        weakref.finalize(obj, self._detach, key, id(obj))
+        if self.quota is not None:
+            self.enforce_quota()
+
+    def inherit(self, obj, *sources):
+        """Make `obj` a dependent of every temporary file read by `sources`,
+        for objects computed on the JVM that no longer hold the reading IR.
+        `sources` are IRs or other dependents, such as Spark data frames."""
+        paths = set()
+        stack = list(sources)
+        while stack:
+            x = stack.pop()
+            reader = getattr(x, 'reader', None)
+            path = getattr(reader, 'path', None)
+            if isinstance(path, str):
+                paths.add(_normalize(path))
+            with self._lock:
+                for dependency in (x, reader):
+                    paths.update(self._dependencies.get(id(dependency), ()))
+            stack.extend(getattr(x, 'children', ()))
+        for path in paths:
+            self.attach(path, obj)
+
+    def pin(self, path):
+        """Never delete or evict `path` until it is unpinned."""
+        with self._lock:
+            f = self._files.get(_normalize(path))
+            if f is not None:
+                f.n_pins += 1
+
+    def unpin(self, path):
+        with self._lock:
+            f = self._files.get(_normalize(path))
+            if f is not None and f.n_pins > 0:
+                f.n_pins -= 1
+                if f.n_pins == 0 and f.released:
+                    self._delete(f)
+
+    @contextmanager
+    def scope(self):
+        """Delete the files created in this block that nothing depends on when
+        the block exits."""
+        with self._lock:
+            created = []
+            self._scopes.append(created)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._scopes.remove(created)
+                for key in created:
+                    f = self._files.get(key)
+                    if f is not None and f.n_dependents == 0:
+                        f.released = True
+                        if f.n_pins == 0:
+                            self._delete(f)
+                self._delete_pending()
+
+    def usage(self):
+        """Scratch usage of the tracked files.
+
+        Returns
+        -------
+        :obj:`dict`
+            ``total_bytes``, and ``files``, a list with the path, size,
+            number of dependents and pinned status of each tracked file,
+            least recently used first.
+        """
+        with self._lock:
+            self._delete_pending()
+            files = list(self._files.values())
+        for f in files:
+            self._measure(f)
+        return {'total_bytes': sum(f.size or 0 for f in files),
+                'files': [{'path': f.path,
+                           'size_bytes': f.size or 0,
+                           'n_dependents': f.n_dependents,
+                           'pinned': f.n_pins > 0}
+                          for f in files]}
+
+    def enforce_quota(self):
+        """Evict least recently used managed files that nothing depends on
+        until usage is within :attr:`quota`."""
+        if self.quota is None:
+            return
+        with self._lock:
+            self._delete_pending()
+            in_scope = {key for created in self._scopes for key in created}
+            files = list(self._files.values())
+            for f in files:
+                self._measure(f)
+            total = sum(f.size or 0 for f in files)
+            for f in files:
+                if total <= self.quota:
+                    break
+                if not f.managed or f.n_dependents > 0 or f.n_pins > 0 or f.key in in_scope:
+                    continue
+                total -= f.size or 0
+                self._delete(f)
+
+    def cleanup(self):
+        """Delete every tracked file."""
+        with self._lock:
+            for f in list(self._files.values()):
+                self._delete(f, quiet=True)
+            self._pending = []
+
+    def _touch(self, f):
+        f.last_used = time.time()
+        self._files.move_to_end(f.key)
+
+    def _find(self, key):
+        f = self._files.get(key)
+        while f is None and '/' in key:
+            key = key.rsplit('/', 1)[0]
+            f = self._files.get(key)
+        return f
+
+    def _detach(self, key, obj_id):
+        with self._lock:
+            keys = self._dependencies.get(obj_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._dependencies[obj_id]
+            f = self._files.get(key)
+            if f is None:
+                return
+            f.n_dependents -= 1
+            if f.n_dependents == 0 and f.managed:
+                f.released = True
+                self._pending.append(key)
+
+    def _delete_pending(self):
+        pending, self._pending = self._pending, []
+        for key in pending:
+            f = self._files.get(key)
+            if f is not None and f.released and f.n_pins == 0:
+                self._delete(f)
+
+    def _measure(self, f):
+        if f.size is not None:
+            return
+        try:
+            if f.local:
+                if not os.path.exists(f.key):
+                    return
+                size = 0
+                for root, _, names in os.walk(f.key):
+                    size += sum(os.path.getsize(os.path.join(root, name)) for name in names)
+                if os.path.isfile(f.key):
+                    size = os.path.getsize(f.key)
+            else:
+                fs = Env.fs()
+                if not fs.exists(f.path):
+                    return
+                size = 0
+                stack = [f.path]
+                while stack:
+                    for entry in fs.ls(stack.pop()):
+                        if entry['is_dir']:
+                            stack.append(entry['path'])
+                        else:
+                            size += entry['size_bytes']
+                if fs.is_file(f.path):
+                    size = fs.stat(f.path)['size_bytes']
+        except Exception:  # pylint: disable=broad-except
+            return
+        # files are written once, so only an existing file's size is cached
+        f.size = size
+
+    def _delete(self, f, quiet=False):
+        del self._files[f.key]
+        try:
+            if f.local:
+                if os.path.isdir(f.key):
+                    shutil.rmtree(f.key, ignore_errors=True)
+                elif os.path.exists(f.key):
+                    os.remove(f.key)
+            elif Env._hc is not None:
+                Env.fs().rmtree(f.path)
+        except Exception as e:  # pylint: disable=broad-except
+            if not quiet:
+                warn(f'could not delete temporary file {f.path}: {e}')
+
+
+_manager = None
+
+
+def temp_files() -> TemporaryFileManager:
+    """Returns the :class:`.TemporaryFileManager` of the current session."""
+    global _manager
+    if _manager is None:
+        _manager = TemporaryFileManager()
+    return _manager
+
+
+def _stop_temp_files():
+    global _manager
+    if _manager is not None:
+        _manager.cleanup()
+        _manager = None
+
+
+atexit.register(_stop_temp_files)
@@ -2,6 +2,8 @@ from .utils import run_all, run_pattern, run_list, initialize
 from . import matrix_table_benchmarks
 from . import table_benchmarks
 from . import methods_benchmarks
+from . import import_benchmarks
+from . import fs_benchmarks
 
 __all__ = [
     'run_all',
@@ -10,5 +12,7 @@ __all__ = [
     'initialize',
     'matrix_table_benchmarks',
     'table_benchmarks',
-    'methods_benchmarks'
+    'methods_benchmarks',
+    'import_benchmarks',
+    'fs_benchmarks'
 ]
@@ -0,0 +1,78 @@
+import os
+
+import hail as hl
+
+from .utils import benchmark
+
+_n_lines = 5_000_000
+_line = 'chr1\t12345\tA\tT\t0.12345\t' + 'x' * 40 + '\n'
+
+
+def _write_text(path):
+    with hl.hadoop_open(path, 'w') as f:
+        for _ in range(_n_lines):
+            f.write(_line)
+
+
+def _read_text(path):
+    n = 0
+    with hl.hadoop_open(path) as f:
+        for _ in f:
+            n += 1
+    assert n == _n_lines
+
+
+def _read_binary(path):
+    with hl.hadoop_open(path, 'rb') as f:
+        while f.read(1 << 20):
+            pass
+
+
+@benchmark
+def hadoop_open_write_text_local():
+    _write_text('file://' + os.path.abspath(hl.utils.new_local_temp_file()))
+
+
+@benchmark
+def hadoop_open_write_text():
+    _write_text(hl.utils.new_temp_file())
+
+
+@benchmark
+def hadoop_open_read_text_local():
+    path = 'file://' + os.path.abspath(hl.utils.new_local_temp_file())
+    _write_text(path)
+    _read_text(path)
+
+
+@benchmark
+def hadoop_open_read_text():
+    path = hl.utils.new_temp_file()
+    _write_text(path)
+    _read_text(path)
+
+
+@benchmark
+def hadoop_open_read_binary():
+    path = hl.utils.new_temp_file()
+    _write_text(path)
+    _read_binary(path)
+
+
+def _write_small_files(n):
+    d = hl.utils.new_local_temp_dir()
+    for i in range(n):
+        with open(os.path.join(d, f'part-{i:05}'), 'w') as f:
+            f.write(_line)
+    return [('file://' + os.path.join(d, f'part-{i:05}'), hl.utils.new_temp_file()) for i in range(n)]
+
+
+@benchmark
+def copy_10k_small_files_serially():
+    for src, dest in _write_small_files(10_000):
+        hl.hadoop_copy(src, dest)
+
+
+@benchmark
+def copy_10k_small_files_copy_many():
+    hl.utils.java.Env.fs().copy_many(_write_small_files(10_000))
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+from .utils import benchmark
+
+
+def _run_python(code):
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+@benchmark
+def import_hail():
+    _run_python('import hail')
+
+
+@benchmark
+def import_hail_and_init():
+    _run_python('import hail as hl; hl.init(quiet=True); hl.utils.range_table(1)._force_count()')
+
+
+@benchmark
+def import_hail_plot_and_experimental():
+    _run_python('import hail as hl; hl.plot; hl.experimental')
@@ -151,6 +151,28 @@ def matrix_table_many_aggs_col_wise():
     mt.cols()._force_count()
 
 
+@benchmark
+def matrix_table_many_aggs_row_wise_interned():
+    hl.ir.enable_interning()
+    try:
+        mt = hl.read_matrix_table(resource('profile.mt'))
+        mt = mt.annotate_rows(**many_aggs(mt))
+        mt.rows()._force_count()
+    finally:
+        hl.ir.disable_interning()
+
+
+@benchmark
+def matrix_table_many_aggs_col_wise_interned():
+    hl.ir.enable_interning()
+    try:
+        mt = hl.read_matrix_table(resource('profile.mt'))
+        mt = mt.annotate_cols(**many_aggs(mt))
+        mt.cols()._force_count()
+    finally:
+        hl.ir.disable_interning()
+
+
 @benchmark
 def matrix_table_aggregate_entries():
     mt = hl.read_matrix_table(resource('profile.mt'))
@@ -279,3 +301,10 @@ def export_range_matrix_table_col_p100():
     with NamedTemporaryFile() as f:
         mt = hl.utils.range_matrix_table(n_rows=1_000_000, n_cols=10, n_partitions=100)
         mt.col.export(f.name)
+
+
+@benchmark
+def matrix_table_collect_calls():
+    mt = hl.utils.range_matrix_table(10_000, 100)
+    mt = mt.annotate_entries(GT=hl.unphased_diploid_gt_index_call((mt.row_idx + mt.col_idx) % 6))
+    mt.GT.collect()
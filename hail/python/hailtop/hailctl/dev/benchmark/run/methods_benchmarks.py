@@ -23,6 +23,29 @@ def export_vcf():
     hl.export_vcf(mt, out)
 
 
+def _export_by_contig_mt():
+    mt = hl.variant_qc(hl.read_matrix_table(resource('profile.mt')))
+    return mt.filter_rows(mt.variant_qc.AF[1] > 0.01)
+
+
+@benchmark
+def export_vcf_by_contig_separately():
+    mt = _export_by_contig_mt()
+    prefix = hl.utils.new_temp_file()
+    for contig in mt.aggregate_rows(hl.agg.collect_as_set(mt.locus.contig)):
+        hl.export_vcf(mt.filter_rows(mt.locus.contig == contig), f'{prefix}/{contig}.vcf.bgz')
+
+
+@benchmark
+def export_vcf_by_contig_multiple():
+    mt = _export_by_contig_mt()
+    prefix = hl.utils.new_temp_file()
+    hl.experimental.export_multiple(
+        mt,
+        by=lambda mt: mt.locus.contig,
+        exports=[lambda mt, contig: hl.export_vcf(mt, f'{prefix}/{contig}.vcf.bgz')])
+
+
 @benchmark
 def sample_qc():
     hl.sample_qc(get_mt()).cols()._force_count()
@@ -65,3 +88,93 @@ def concordance():
     _, r, c = hl.methods.qc.concordance(mt, mt, _localize_global_statistics=False)
     r._force_count()
     c._force_count()
+
+
+def _linear_regression_rows_phenotypes(n_phenotypes):
+    mt = get_mt()
+    # ten missingness patterns, each shared by many phenotypes
+    mt = mt.annotate_cols(base=hl.range(0, 10).map(
+        lambda _: hl.or_missing(hl.rand_bool(0.9), hl.rand_norm())))
+    mt = mt.checkpoint(hl.utils.new_temp_file(suffix='mt'))
+    ht = hl.linear_regression_rows([mt.base[i % 10] + i for i in range(n_phenotypes)],
+                                   mt.GT.n_alt_alleles(),
+                                   [1],
+                                   group_by_missingness=True)
+    ht._force_count()
+
+
+@benchmark
+def linear_regression_rows_100_phenotypes():
+    _linear_regression_rows_phenotypes(100)
+
+
+@benchmark
+def linear_regression_rows_5000_phenotypes():
+    _linear_regression_rows_phenotypes(5000)
+
+
+def _ld_score_l2():
+    mt = get_mt()
+    mt = mt.filter_rows(mt.alleles.length() == 2)
+    bm = hl.linalg.BlockMatrix.from_entry_expr(mt.GT.n_alt_alleles(), mean_impute=True)
+    return (bm @ bm.T[:, :16]).checkpoint(hl.utils.new_temp_file(suffix='bm'))
+
+
+@benchmark
+def block_matrix_to_table_row_major():
+    _ld_score_l2().to_table_row_major()._force_count()
+
+
+@benchmark
+def block_matrix_export_import_table():
+    path = hl.utils.new_temp_file(suffix='bm')
+    tsv = hl.utils.new_temp_file(suffix='tsv')
+    _ld_score_l2().write(path, force_row_major=True)
+    hl.linalg.BlockMatrix.export(path, tsv)
+    hl.import_table(tsv, no_header=True, impute=True)._force_count()
+
+
+@benchmark
+def ld_score():
+    mt = get_mt()
+    mt = mt.filter_rows(mt.alleles.length() == 2)
+    mt = mt.annotate_rows(a=hl.float(mt.locus.position % 2))
+    hl.experimental.ld_score(hl.float(hl.or_else(mt.GT.n_alt_alleles(), 0)), mt.locus, radius=1_000_000,
+                             annotation_exprs=[mt.a])._force_count()
+
+
+_annotation_db_names = None
+
+
+def _local_annotation_db():
+    """Point hl.experimental.DB at synthetic local annotation tables, written
+    once: four locus-keyed, four variant-keyed and four gene-keyed datasets."""
+    global _annotation_db_names
+    if _annotation_db_names is None:
+        rows = get_mt().rows().select()
+        rg = rows.locus.dtype.reference_genome.name
+        urls, gene_key = {}, {}
+
+        def write(name, t, reference_genome):
+            path = hl.utils.new_temp_file(suffix='ht')
+            t.write(path)
+            urls[(name, reference_genome)] = path
+            gene_key[name] = reference_genome is None
+
+        genes = rows.key_by('locus').select(gene_name=hl.str(rows.locus.position // 10_000)).distinct()
+        write('gencode', genes, rg)
+        for i in range(4):
+            write(f'locus_{i}', rows.key_by('locus').select(score=hl.rand_norm(0, 1)).distinct(), rg)
+            write(f'variant_{i}', rows.select(score=hl.rand_norm(0, 1), flag=hl.rand_bool(0.5)), rg)
+            write(f'gene_{i}', genes.key_by('gene_name').select(pli=hl.rand_unif(0, 1)).distinct(), None)
+
+        hl.experimental.DB._annotation_dataset_urls = urls
+        hl.experimental.DB._geneDict_dataset_urls = gene_key
+        _annotation_db_names = [name for name, _ in urls if name != 'gencode']
+    return _annotation_db_names
+
+
+@benchmark
+def annotate_rows_db_twelve_datasets():
+    names = _local_annotation_db()
+    hl.experimental.DB().annotate_rows_db(get_mt(), *names).rows()._force_count()
@@ -1,3 +1,4 @@
+import shutil
 from os import path
 from tempfile import TemporaryDirectory
 import hail as hl
@@ -42,6 +43,18 @@ def table_python_construction():
         ht = ht.annotate(**{f'x_{i}': 0})
 
 
+@benchmark
+def table_python_construction_wide_schema():
+    n = 5_000
+    ht = hl.utils.range_table(100)
+    ht = ht.annotate(info=hl.struct(**{f'f_{i}': hl.float64(i) if i % 2 else hl.array([i]) for i in range(n)}))
+    for i in range(100):
+        ht = ht.annotate(info=ht.info.annotate(**{f'x_{i}': 0}))
+        ht = ht.annotate(info=ht.info.drop(f'f_{i}'))
+        hash(ht.info.dtype)
+        str(ht.info.dtype)
+
+
 @benchmark
 def table_big_aggregate_compilation():
     n = 1_000
@@ -310,3 +323,49 @@ def join_p100_p10():
 def group_by_collect_per_row():
     ht = hl.read_matrix_table(resource('gnomad_dp_simulation.mt')).localize_entries('e', 'c')
     ht.group_by(*ht.key).aggregate(value=hl.agg.collect(ht.row_value))._force_count()
+
+
+def _small_global_exprs(n):
+    ht = hl.utils.range_table(10).annotate_globals(x=hl.range(100))
+    return [ht.x[i % 100] + i for i in range(n)]
+
+
+@benchmark
+def eval_10_global_exprs():
+    for e in _small_global_exprs(10):
+        hl.eval(e)
+
+
+@benchmark
+def eval_many_10_global_exprs():
+    hl.eval_many(*_small_global_exprs(10))
+
+
+@benchmark
+def eval_100_global_exprs():
+    for e in _small_global_exprs(100):
+        hl.eval(e)
+
+
+@benchmark
+def eval_many_100_global_exprs():
+    hl.eval_many(*_small_global_exprs(100))
+
+
+@benchmark
+def eval_many_1000_global_exprs():
+    hl.eval_many(*_small_global_exprs(1000))
+
+
+@benchmark
+def read_500_small_tables():
+    with TemporaryDirectory() as tmpdir:
+        first = path.join(tmpdir, 'table-0.ht')
+        hl.utils.range_table(10).annotate(x=hl.str('x'), y=hl.struct(a=1.5, b=[1, 2])).write(first)
+        paths = [first]
+        for i in range(1, 500):
+            paths.append(path.join(tmpdir, f'table-{i}.ht'))
+            shutil.copytree(first, paths[-1])
+        for _ in range(2):
+            for p in paths:
+                hl.read_table(p).row.dtype
@@ -1,7 +1,8 @@
-from .utils import unzip, async_to_blocking, blocking_to_async
+from .utils import unzip, async_to_blocking, blocking_to_async, bounded_gather
 
 __all__ = [
     'unzip',
     'async_to_blocking',
-    'blocking_to_async'
+    'blocking_to_async',
+    'bounded_gather'
 ]
@@ -17,3 +17,15 @@ def async_to_blocking(coro):
 async def blocking_to_async(thread_pool, fun, *args, **kwargs):
     return await asyncio.get_event_loop().run_in_executor(
         thread_pool, lambda: fun(*args, **kwargs))
+
+
+async def bounded_gather(*pfs, parallelism=10):
+    """Await the results of calling each of `pfs`, with at most `parallelism`
+    running at once. Results are in the order of `pfs`."""
+    semaphore = asyncio.Semaphore(parallelism)
+
+    async def run(pf):
+        async with semaphore:
+            return await pf()
+
+    return await asyncio.gather(*[run(pf) for pf in pfs])
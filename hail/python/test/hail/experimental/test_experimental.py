@@ -332,3 +332,69 @@ class Tests(unittest.TestCase):
             a = arrs[i]
             a2 = np.loadtxt(f'{prefix}/files/{i}.tsv')
             self.assertTrue(np.array_equal(a, a2))
+
+    def test_export_multiple(self):
+        mt = hl.utils.range_matrix_table(30, 3, n_partitions=5)
+        mt = mt.annotate_rows(group=mt.row_idx % 3)
+        mt = mt.annotate_entries(x=mt.row_idx * mt.col_idx)
+        prefix = new_local_temp_dir()
+        hl.experimental.export_multiple(
+            mt,
+            by=lambda mt: mt.group,
+            exports=[lambda mt, g: mt.x.export(f'{prefix}/entries-{g}.tsv'),
+                     lambda mt, g: mt.rows().export(f'{prefix}/rows-{g}.tsv')],
+            parallelism=2)
+        for g in range(3):
+            rows = hl.import_table(f'{prefix}/rows-{g}.tsv', impute=True)
+            self.assertEqual(rows.aggregate(hl.agg.collect_as_set(rows.group)), {g})
+            self.assertEqual(rows.count(), 10)
+            entries = hl.import_table(f'{prefix}/entries-{g}.tsv', impute=True)
+            self.assertEqual(entries.count(), 10)
+
+        t = hl.utils.range_table(10)
+        hl.experimental.export_multiple(
+            t,
+            by=lambda t: t.idx < 4,
+            exports=[lambda t, small: t.export(f'{prefix}/{small}.tsv')],
+            values=[True],
+            checkpoint=False)
+        self.assertEqual(hl.import_table(f'{prefix}/True.tsv').count(), 4)
+        self.assertFalse(hl.hadoop_exists(f'{prefix}/False.tsv'))
+
+    def test_annotate_rows_db(self):
+        mt = hl.balding_nichols_model(1, 2, 20, reference_genome='GRCh37')
+        mt = mt.select_rows()
+        rows = mt.rows()
+        genes = rows.key_by('locus').select(gene_name=hl.str(rows.locus.position % 3))
+
+        tables = {('gencode', 'GRCh37'): genes,
+                  ('a', 'GRCh37'): rows.key_by('locus').select(x=hl.int32(rows.locus.position)),
+                  ('b', 'GRCh37'): rows.key_by('locus').select(y=hl.str(rows.locus.position)),
+                  ('c', 'GRCh37'): rows.select(z=rows.alleles[0]),
+                  ('d', None): genes.key_by('gene_name').select(w=hl.len(genes.gene_name)).distinct(),
+                  ('e', None): genes.key_by('gene_name').select(v=genes.gene_name + '!').distinct(),
+                  ('f', 'GRCh37'): rows.key_by(interval=hl.interval(rows.locus, rows.locus, includes_end=True))
+                                       .select(u=rows.locus.position + 1),
+                  ('g', 'GRCh37'): rows.key_by('locus').select(t=-rows.locus.position)}
+        urls = {}
+        for key, t in tables.items():
+            urls[key] = new_temp_file(suffix='ht')
+            t.write(urls[key])
+
+        saved = hl.experimental.DB._annotation_dataset_urls, getattr(hl.experimental.DB, '_geneDict_dataset_urls', None)
+        hl.experimental.DB._annotation_dataset_urls = urls
+        hl.experimental.DB._geneDict_dataset_urls = {name: rg is None for name, rg in urls}
+        try:
+            actual = hl.experimental.DB().annotate_rows_db(mt, 'd', 'a', 'f', 'c', 'b', 'e', 'g').rows()
+        finally:
+            hl.experimental.DB._annotation_dataset_urls, hl.experimental.DB._geneDict_dataset_urls = saved
+
+        self.assertEqual(list(actual.row_value), ['d', 'a', 'f', 'c', 'b', 'e', 'g'])
+        gene_name = hl.str(actual.locus.position % 3)
+        self.assertTrue(actual.all((actual.a.x == actual.locus.position) &
+                                   (actual.b.y == hl.str(actual.locus.position)) &
+                                   (actual.c.z == actual.alleles[0]) &
+                                   (actual.d.w == hl.len(gene_name)) &
+                                   (actual.e.v == gene_name + '!') &
+                                   (actual.f.u == actual.locus.position + 1) &
+                                   (actual.g.t == -actual.locus.position)))
@@ -1,9 +1,12 @@
+import contextlib
+import io
 import math
 import pytest
 import random
 from scipy.stats import pearsonr
 import numpy as np
 import tempfile
+from unittest import mock
 
 import hail as hl
 import hail.expr.aggregators as agg
@@ -2882,6 +2885,55 @@ class Tests(unittest.TestCase):
         self.assertEqual(hl.eval(hl.literal(hl.set(['A','B']))), {'A', 'B'})
         self.assertEqual(hl.eval(hl.literal({hl.str('A'), hl.str('B')})), {'A', 'B'})
 
+    def test_eval_many(self):
+        ht = hl.utils.range_table(10).annotate_globals(x=5, y='foo')
+        mt = hl.utils.range_matrix_table(3, 3).annotate_globals(z=hl.array([1, 2]))
+        x = hl.literal([1, 2, 3])
+        self.assertEqual(hl.eval_many(), [])
+        self.assertEqual(
+            hl.eval_many(x.map(lambda e: e * 2), ht.x + 1, 'bar', ht.y, mt.z, x.map(lambda e: e * 2), ht.x + 1),
+            [[2, 4, 6], 6, 'bar', 'foo', [1, 2], [2, 4, 6], 6])
+
+    def test_eval_batch(self):
+        ht = hl.utils.range_table(10).annotate_globals(x=5)
+        batch = hl.EvalBatch()
+        a = batch.eval(ht.x * 2)
+        b = batch.eval(hl.len('Hail'))
+        self.assertEqual((a.value, b.value), (10, 4))
+        c = batch.eval(ht.x - 1)
+        self.assertEqual((c.value, a.value), (4, 10))
+
+    def test_eval_batch_failure(self):
+        from hail.expr.expressions import expression_utils
+
+        batch = hl.EvalBatch()
+        a = batch.eval(hl.len('Hail'))
+        b = batch.eval(hl.case().when(False, 1).or_error('fail'))
+        for _ in range(2):
+            with self.assertRaisesRegex(hl.utils.FatalError, 'fail'):
+                a.value
+            with self.assertRaisesRegex(hl.utils.FatalError, 'fail'):
+                b.value
+
+        # a failed query keeps the pending expressions for a retry
+        eval_many = expression_utils.eval_many
+        calls = []
+
+        def flaky_eval_many(*exprs):
+            calls.append(exprs)
+            if len(calls) == 1:
+                raise hl.utils.FatalError('transient')
+            return eval_many(*exprs)
+
+        batch = hl.EvalBatch()
+        a = batch.eval(hl.len('Hail'))
+        b = batch.eval(hl.literal(5) + 1)
+        with mock.patch.object(expression_utils, 'eval_many', flaky_eval_many):
+            with self.assertRaisesRegex(hl.utils.FatalError, 'transient'):
+                b.value
+            self.assertEqual((b.value, a.value), (6, 4))
+        self.assertEqual(len(calls), 2)
+
     def test_format(self):
         self.assertEqual(hl.eval(hl.format("%.4f %s %.3e", 0.25, 'hello', 0.114)), '0.2500 hello 1.140e-01')
         self.assertEqual(hl.eval(hl.format("%.4f %d", hl.null(hl.tint32), hl.null(hl.tint32))), 'null null')
@@ -3062,6 +3114,68 @@ class Tests(unittest.TestCase):
         mt.entries().summarize()
         mt.x1.summarize()
 
+    def test_summarize_sampled_runs(self):
+        mt = hl.utils.range_matrix_table(20, 3, n_partitions=4).annotate_entries(
+            x1=hl.or_missing(hl.rand_bool(0.5), 'a'),
+            x2=1,
+            x3=hl.call(0, 1))
+        mt.summarize(partitions=2, seed=0)
+        mt.summarize(partitions=3, seed=0, progressive=True, cols=False)
+        mt.entries().summarize(partitions=2)
+        mt.rows().summarize(partitions=10)
+
+    def test_sampled_partitions(self):
+        from hail.expr.generic_summary import sampled_partitions
+
+        # the exact summary, unless fewer partitions than exist are sampled
+        self.assertEqual(sampled_partitions(10), [(None, None)])
+        self.assertEqual(sampled_partitions(10, 10, seed=0), [(None, None)])
+        self.assertEqual(sampled_partitions(10, 11, seed=0, progressive=True), [(None, None)])
+        with self.assertRaises(ValueError):
+            sampled_partitions(10, 0)
+
+        rounds = sampled_partitions(100, 7, seed=1)
+        self.assertEqual(rounds, [(sorted(random.Random(1).sample(range(100), 7)), 100 / 7)])
+        self.assertEqual(rounds, sampled_partitions(100, 7, seed=1))
+        parts, _ = rounds[0]
+        self.assertEqual(len(set(parts)), 7)
+        self.assertTrue(all(0 <= p < 100 for p in parts))
+
+        rounds = sampled_partitions(100, 7, seed=1, progressive=True)
+        self.assertEqual([len(parts) for parts, _ in rounds], [1, 3, 7])
+        self.assertEqual([scale for _, scale in rounds], [100, 100 / 3, 100 / 7])
+        self.assertEqual(rounds[-1][0], parts)
+        for (smaller, _), (larger, _) in zip(rounds, rounds[1:]):
+            self.assertTrue(set(smaller) < set(larger))
+
+        self.assertEqual([len(parts) for parts, _ in sampled_partitions(20, 8, seed=0, progressive=True)],
+                         [1, 2, 4, 8])
+
+    def test_summarize_sampled_within_bound(self):
+        from hail.expr.generic_summary import sampled_partitions, _proportion_ci, _mean_ci
+
+        # every partition has the same rows, up to the index
+        n_rows, n_partitions = 4000, 40
+        ht = hl.utils.range_table(n_rows, n_partitions=n_partitions)
+        ht = ht.annotate(x=hl.or_missing(ht.idx % 4 != 0, ht.idx % 10))
+        parts, scale = sampled_partitions(n_partitions, 5, seed=3)[0]
+        sample = ht._filter_partitions(parts)
+        n, n_missing, stats = sample.aggregate((hl.agg.count(),
+                                                hl.agg.count_where(hl.is_missing(sample.x)),
+                                                hl.agg.stats(sample.x)))
+        self.assertEqual(n * scale, n_rows)
+        self.assertLessEqual(abs(n_missing * scale - n_rows / 4),
+                             _proportion_ci(n_missing, n) * n_rows + 1e-6)
+        self.assertLessEqual(abs(stats['mean'] - ht.aggregate(hl.agg.mean(ht.x))), _mean_ci(stats))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            ht.summarize(partitions=5, seed=3)
+        output = output.getvalue()
+        self.assertIn('Estimated from 5 of 40 partitions', output)
+        self.assertIn('simple random sample (SRS)', output)
+        self.assertIn('~1000 values (25.00% ± ', output)
+
     def test_variant_str(self):
         assert hl.eval(
             hl.variant_str(hl.struct(locus=hl.locus('1', 10000), alleles=['A', 'T', 'CCC']))) == '1:10000:A:T,CCC'
@@ -64,6 +64,30 @@ class Tests(unittest.TestCase):
                 else:
                     self.assertNotEqual(ts[i], ts2[j])
 
+    def test_hash_consing(self):
+        import copy
+        import pickle
+
+        ts = self.types_to_test()
+        ts2 = self.types_to_test()
+        for t, t2 in zip(ts, ts2):
+            self.assertIs(t, t2)
+            self.assertIs(t, dtype(str(t)))
+            self.assertIs(t, pickle.loads(pickle.dumps(t)))
+            self.assertIs(t, copy.deepcopy(t))
+
+        s = tstruct(a=tint32, b=tarray(tstr))
+        self.assertIs(s._insert_fields(c=tbool), tstruct(a=tint32, b=tarray(tstr), c=tbool))
+        self.assertIs(s._insert_fields(a=tint32), s)
+        self.assertIs(s._drop_fields({'b'}), tstruct(a=tint32))
+        self.assertIs(s._drop_fields({'c'}), s)
+        self.assertIs(s._select_fields(['a', 'b']), s)
+        self.assertIsNot(tndarray(tfloat64, 1), tndarray(tfloat64, 2))
+        self.assertNotEqual(tndarray(tfloat64, 1), tndarray(tfloat64, 2))
+
+        # types with variables are not hash-consed
+        self.assertIsNot(tarray(tvariable('T', None)), tarray(tvariable('T', None)))
+
     def test_type_jvm_roundtrip(self):
         ts = self.types_to_test()
         for t in ts:
@@ -1,5 +1,6 @@
 import unittest
 
+import hail as hl
 from hail.genetics import *
 from ..helpers import *
 
@@ -94,3 +95,46 @@ class Tests(unittest.TestCase):
                                "Calls with greater than 2 alleles are not supported.",
                                Call,
                                [1, 1, 1, 1])
+
+    def test_str_round_trip(self):
+        calls = [Call([]), Call([], phased=True), Call([0]), Call([3], phased=True),
+                 Call([2, 1]), Call([2, 1], phased=True), Call([1000, 7], phased=True)]
+        for c in calls:
+            self.assertEqual(Call._from_str(str(c)), c)
+            self.assertEqual(hl.eval(hl.literal(c)), c)
+            self.assertEqual(hl.eval(hl.parse_call(str(c))), c)
+
+    def test_unpack_calls(self):
+        import numpy as np
+        from hail.genetics.call import pack_calls, unpack_calls
+
+        calls = [Call([0, 0]), Call([1, 2]), Call([2, 1], phased=True), None,
+                 Call([5]), Call([], phased=True), Call([700, 3000])]
+        ploidy, phased, alleles = unpack_calls(pack_calls(calls))
+        self.assertEqual(ploidy.tolist(), [2, 2, 2, -1, 1, 0, 2])
+        self.assertEqual(phased.tolist(), [False, False, True, False, False, True, False])
+        self.assertEqual(alleles.tolist(), [[0, 0], [1, 2], [2, 1], [-1, -1], [5, -1], [-1, -1], [700, 3000]])
+
+        # allele representations >= 2^28 use the sign bit of the int32
+        calls = [Call([23170, 23171]), Call([30000, 1], phased=True), Call([16383, 32767]),
+                 Call([2 ** 29 - 1]), Call([2 ** 29 - 1], phased=True), None]
+        packed = pack_calls(calls)
+        self.assertEqual(packed.dtype, np.int32)
+        self.assertEqual(packed.tolist()[-1], -1)
+        self.assertTrue(all(p != -1 for p in packed.tolist()[:-1]))
+        ploidy, phased, alleles = unpack_calls(packed)
+        self.assertEqual(ploidy.tolist(), [2, 2, 2, 1, 1, -1])
+        self.assertEqual(phased.tolist(), [False, True, False, False, True, False])
+        self.assertEqual(alleles.tolist(), [[23170, 23171], [30000, 1], [16383, 32767],
+                                            [2 ** 29 - 1, -1], [2 ** 29 - 1, -1], [-1, -1]])
+
+        rng = np.random.RandomState(0)
+        calls = []
+        for _ in range(2000):
+            calls.append(Call([int(x) for x in rng.randint(20000, 32000, size=2)]))
+            # phased calls encode the allele sum, which must stay below 2^15
+            calls.append(Call([int(rng.randint(2000)), int(rng.randint(20000, 30000))], phased=True))
+        ploidy, phased, alleles = unpack_calls(pack_calls(calls))
+        self.assertEqual(ploidy.tolist(), [2] * len(calls))
+        self.assertEqual(phased.tolist(), [c.phased for c in calls])
+        self.assertEqual(alleles.tolist(), [c.alleles for c in calls])
@@ -896,6 +896,72 @@ class Tests(unittest.TestCase):
             hl.linalg.utils.locus_windows(ht.locus, 1.0, coord_expr=ht.cm)
         self.assertTrue("missing value for 'coord_expr'" in str(cm.exception))
 
+    def test_locus_windows_distributed(self):
+        def baseline(locus_expr, radius, coord_expr=None):
+            # the collect-based computation locus_windows replaced
+            if coord_expr is None:
+                coord_expr = locus_expr.position
+            ht = locus_expr._indices.source
+            rows = ht.select(contig=locus_expr.contig, coord=hl.float64(coord_expr)).collect()
+            coords = []
+            for i, row in enumerate(rows):
+                if i == 0 or row.contig != rows[i - 1].contig:
+                    coords.append([])
+                coords[-1].append(row.coord)
+            starts, stops = hl.eval(hl._locus_windows_per_contig(
+                hl.literal(coords, hl.tarray(hl.tarray(hl.tfloat64))), radius))
+            return np.array(starts), np.array(stops)
+
+        def assert_same(locus_expr, radius, coord_expr=None):
+            starts, stops = hl.linalg.utils.locus_windows(locus_expr, radius, coord_expr)
+            expected_starts, expected_stops = baseline(locus_expr, radius, coord_expr)
+            self._assert_eq(starts, expected_starts)
+            self._assert_eq(stops, expected_stops)
+
+        # contigs 2 and 5-21 have no rows; rows are spread over many
+        # partitions, with windows and runs of equal coordinates crossing
+        # partition boundaries
+        contigs = hl.literal(['1', '3', '4', '22'])
+        ht = hl.utils.range_table(1000, n_partitions=13)
+        ht = ht.annotate(locus=hl.locus(contigs[ht.idx // 250], 1 + (ht.idx % 250) * 7 // 3),
+                         cm=hl.float64((ht.idx % 250) // 4) / 10)
+        ht = ht.key_by('locus')
+        # cm restarts at each contig, so it is ascending only within contigs
+        for radius in [0, 1, 10, 1000]:
+            assert_same(ht.locus, radius)
+        for radius in [0.0, 0.25, 3.05]:
+            assert_same(ht.locus, radius, coord_expr=ht.cm)
+
+        # a matrix table's rows, and a single row per contig
+        mt = hl.utils.range_matrix_table(20, 3, n_partitions=7)
+        mt = mt.key_rows_by(locus=hl.locus(hl.str(1 + mt.row_idx), 1 + mt.row_idx))
+        starts, stops = hl.linalg.utils.locus_windows(mt.locus, 100)
+        self._assert_eq(starts, np.arange(20))
+        self._assert_eq(stops, np.arange(1, 21))
+
+        # an unsorted coordinate within a contig fails, also when the check
+        # spans partitions
+        ht = hl.Table.parallelize([{'locus': hl.Locus('1', 1), 'cm': 1.0},
+                                   {'locus': hl.Locus('1', 2), 'cm': 3.0},
+                                   {'locus': hl.Locus('1', 4), 'cm': 2.0},
+                                   {'locus': hl.Locus('2', 1), 'cm': 0.0}],
+                                  hl.tstruct(locus=hl.tlocus('GRCh37'), cm=hl.tfloat64),
+                                  key=['locus'],
+                                  n_partitions=4)
+        with self.assertRaises(FatalError) as cm:
+            hl.linalg.utils.locus_windows(ht.locus, 1.0, coord_expr=ht.cm)
+        self.assertTrue("'coord_expr' must be in ascending order within each contig" in str(cm.exception))
+
+        # a decrease from one contig to the next is allowed
+        ht = ht.filter(ht.locus.position != 4)
+        assert_same(ht.locus, 1.0, coord_expr=ht.cm)
+
+        ht = hl.utils.range_table(0)
+        ht = ht.key_by(locus=hl.locus('1', 1 + ht.idx))
+        with self.assertRaises(FatalError) as cm:
+            hl.linalg.utils.locus_windows(ht.locus, 1)
+        self.assertTrue("has length 0" in str(cm.exception))
+
     def test_write_overwrite(self):
         path = new_temp_file()
 
@@ -381,6 +381,44 @@ class VCFTests(unittest.TestCase):
         self.assertEqual(len(parts), comb.n_partitions())
         comb._force_count_rows()
 
+    @skip_unless_spark_backend()
+    def test_run_combiner(self):
+        from hail.experimental.vcf_combiner import run_combiner, combine_gvcfs, _import_gvcfs
+        paths = [resource(p) for p in ['gvcfs/HG00096.g.vcf.gz', 'gvcfs/HG00268.g.vcf.gz']]
+        paths = paths * 2 + paths[:1]
+        parts = [
+            hl.Interval(start=hl.Struct(locus=hl.Locus('chr20', 17821257, reference_genome='GRCh38')),
+                        end=hl.Struct(locus=hl.Locus('chr20', 19776611, reference_genome='GRCh38')),
+                        includes_end=True),
+            hl.Interval(start=hl.Struct(locus=hl.Locus('chr20', 19776612, reference_genome='GRCh38')),
+                        end=hl.Struct(locus=hl.Locus('chr20', 21144633, reference_genome='GRCh38')),
+                        includes_end=True)
+        ]
+        expected = combine_gvcfs(_import_gvcfs(paths, parts, 'GRCh38'))
+
+        tmp = new_temp_file()
+        out = new_temp_file(suffix='mt')
+        run_combiner(paths, out, tmp, parts, branch_factor=2)
+        self.assertTrue(hl.read_matrix_table(out)._same(expected))
+
+        # a rerun only redoes merges missing from the manifest
+        manifest_path = tmp + '/combiner_manifest.json'
+        with hl.hadoop_open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest['completed'].remove(out)
+        with hl.hadoop_open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+        run_combiner(paths, out, tmp, parts, branch_factor=2)
+        self.assertTrue(hl.read_matrix_table(out)._same(expected))
+        with self.assertRaises(ValueError):
+            run_combiner(paths[:2], out, tmp, parts, branch_factor=2)
+
+        first = new_temp_file(suffix='mt')
+        run_combiner(paths[:3], first, new_temp_file(), parts, branch_factor=2)
+        out = new_temp_file(suffix='mt')
+        run_combiner(paths[3:], out, new_temp_file(), parts, branch_factor=2, existing=first)
+        self.assertTrue(hl.read_matrix_table(out)._same(expected))
+
 
 class PLINKTests(unittest.TestCase):
     def test_import_fam(self):
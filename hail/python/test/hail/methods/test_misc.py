@@ -124,6 +124,25 @@ class Tests(unittest.TestCase):
                          jj=hl.struct(id=ht.j, rank=hl.rand_norm(0, 1)))
         hl.maximal_independent_set(ht.ii, ht.jj).count()
 
+    @skip_unless_spark_backend()
+    def test_banded_maximal_independent_set(self):
+        from hail.methods.misc import _banded_maximal_independent_set
+        edges = [(0, 1), (0, 2), (1, 2), (1, 3), (2, 4), (3, 4), (3, 5),
+                 (7, 8), (8, 9), (8, 10),
+                 (12, 13), (13, 15), (14, 15), (14, 16)]
+        t = hl.Table.parallelize([{'i': i, 'j': j} for i, j in edges],
+                                 hl.tstruct(i=hl.tint64, j=hl.tint64),
+                                 n_partitions=3)
+
+        def tie_breaker(l, r):
+            return l - r
+
+        mis = hl.maximal_independent_set(t.i, t.j, keep=False, tie_breaker=tie_breaker)
+        expected = set(mis.node.collect())
+        for max_local_edges in [1, 4, 100]:
+            removed = _banded_maximal_independent_set(t, lambda node: node, tie_breaker, max_local_edges)
+            self.assertEqual(set(removed.node.collect()), expected)
+
     def test_matrix_filter_intervals(self):
         ds = hl.import_vcf(resource('sample.vcf'), min_partitions=20)
 
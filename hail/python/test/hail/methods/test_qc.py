@@ -108,6 +108,31 @@ class Tests(unittest.TestCase):
         self.assertEqual(r[1].vqc.gq_stats.mean, 10)
         self.assertEqual(r[1].vqc.gq_stats.stdev, 0)
 
+    def test_qc_partials(self):
+        mt = get_dataset()
+        mt = mt.annotate_rows(row_idx=hl.scan.count())
+        mt = mt.annotate_cols(col_idx=hl.scan.count())
+
+        # new variants, for sample QC
+        partials = hl.combine_qc_partials(hl.sample_qc_partials(mt.filter_rows(mt.row_idx % 3 != 0)),
+                                          hl.sample_qc_partials(mt.filter_rows(mt.row_idx % 3 == 0)))
+        expected = hl.sample_qc(mt).cols().select('sample_qc').select_globals()
+        self.assertTrue(hl.sample_qc_from_partials(partials)._same(expected))
+
+        # new samples, for variant QC
+        old = mt.filter_cols(mt.col_idx < 50)
+        new = mt.filter_cols(mt.col_idx >= 50)
+        partials = hl.combine_qc_partials(hl.variant_qc_partials(old), hl.variant_qc_partials(new))
+        expected = hl.variant_qc(mt).rows().select('variant_qc').select_globals()
+        self.assertTrue(hl.variant_qc_from_partials(partials)._same(expected))
+
+        # rows missing from one dataset are filtered there
+        partials = hl.combine_qc_partials(hl.variant_qc_partials(old),
+                                          hl.variant_qc_partials(new.filter_rows(new.row_idx % 2 == 0)))
+        expected = mt.filter_entries((mt.col_idx >= 50) & (mt.row_idx % 2 != 0), keep=False)
+        expected = hl.variant_qc(expected).rows().select('variant_qc').select_globals()
+        self.assertTrue(hl.variant_qc_from_partials(partials)._same(expected))
+
     def test_concordance(self):
         dataset = get_dataset()
         glob_conc, cols_conc, rows_conc = hl.concordance(dataset, dataset)
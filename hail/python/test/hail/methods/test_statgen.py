@@ -257,6 +257,34 @@ class Tests(unittest.TestCase):
         assert t4._same(t5)
 
 
+    def test_linreg_group_by_missingness(self):
+        phenos = hl.import_table(resource('regressionLinear.pheno'),
+                                 types={'Pheno': hl.tfloat64},
+                                 key='Sample')
+        covs = hl.import_table(resource('regressionLinear.cov'),
+                               types={'Cov1': hl.tfloat64, 'Cov2': hl.tfloat64},
+                               key='Sample')
+
+        mt = hl.import_vcf(resource('regressionLinear.vcf'))
+        mt = mt.annotate_cols(pheno=phenos[mt.s].Pheno, cov=covs[mt.s])
+        mt = mt.annotate_entries(x=mt.GT.n_alt_alleles()).cache()
+
+        ys = [mt.pheno,
+              hl.case().when(mt.cov.Cov2 >= 0, mt.pheno).or_missing(),
+              2 * mt.pheno,
+              hl.case().when(mt.cov.Cov2 >= 0, mt.cov.Cov1).or_missing()]
+        covariates = [1, mt.cov.Cov1]
+        fields = ['n', 'sum_x', 'y_transpose_x', 'beta', 'standard_error', 't_stat', 'p_value']
+
+        grouped = hl.linear_regression_rows(ys, mt.x, covariates, group_by_missingness=True)
+        for i, y in enumerate(ys):
+            single = hl.linear_regression_rows(y, mt.x, covariates)
+            result = grouped.select(**{f: grouped[f][i] for f in fields})
+            self.assertTrue(result._same(single.select(*fields)))
+
+        with self.assertRaises(ValueError):
+            hl.linear_regression_rows([ys], mt.x, covariates, group_by_missingness=True)
+
     def test_linear_regression_without_intercept(self):
         pheno = hl.import_table(resource('regressionLinear.pheno'),
                                 key='Sample',
@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+
+import hail as hl
+from hail.plot.plots import _cdf_histogram, _cached_aggregate, _PLOT_CACHE_SIZE
+from hail.utils import Struct
+from ..helpers import *
+
+setUpModule = startTestHailContext
+tearDownModule = stopTestHailContext
+
+
+def count_aggregations(ht):
+    calls = []
+    aggregate = ht.aggregate
+
+    def counting_aggregate(expr, *args, **kwargs):
+        calls.append(expr)
+        return aggregate(expr, *args, **kwargs)
+
+    ht.aggregate = counting_aggregate
+    return calls
+
+
+class Tests(unittest.TestCase):
+    def test_cdf_histogram(self):
+        cdf = Struct(values=[1.0, 2.0, 3.0, 4.0], ranks=[0, 1, 3, 6, 10])
+        dens, edges = _cdf_histogram(cdf, bins=3)
+        expected_dens, expected_edges = np.histogram(cdf['values'], bins=3, weights=[1, 2, 3, 4], density=True)
+        self.assertTrue(np.allclose(dens, expected_dens))
+        self.assertTrue(np.allclose(edges, expected_edges))
+        self.assertAlmostEqual(np.sum(dens * np.diff(edges)), 1.0)
+
+        # a group with no values has zero density, not NaN
+        dens, edges = _cdf_histogram(Struct(values=[], ranks=[0]), bins=3)
+        self.assertEqual(list(dens), [0.0, 0.0, 0.0])
+        self.assertEqual(len(edges), 4)
+
+    def test_histogram_from_cdf(self):
+        cdf = Struct(values=[1.0, 2.0, 3.0, 4.0], ranks=[0, 1, 3, 6, 10])
+        p = hl.plot.histogram(cdf, bins=3)
+        dens, edges = _cdf_histogram(cdf, bins=3)
+        data = p.renderers[0].data_source.data
+        self.assertTrue(np.allclose(data['top'], dens))
+        self.assertTrue(np.allclose(data['left'], edges[:-1]))
+        self.assertTrue(np.allclose(data['right'], edges[1:]))
+
+        ht = hl.utils.range_table(100)
+        p = hl.plot.histogram(ht.aggregate(hl.agg.approx_cdf(hl.float64(ht.idx))), bins=10)
+        data = p.renderers[0].data_source.data
+        self.assertAlmostEqual(np.sum(np.array(data['top']) * (np.array(data['right']) - np.array(data['left']))), 1.0)
+
+    def test_cumulative_histogram(self):
+        hist = Struct(bin_freq=[1, 2, 3, 4], bin_edges=[0.0, 1.0, 2.0, 3.0, 4.0], n_smaller=0, n_larger=0)
+        p = hl.plot.cumulative_histogram(hist)
+        data = p.renderers[0].data_source.data
+        self.assertTrue(np.allclose(data['y'], [0.1, 0.3, 0.6, 1.0]))
+        self.assertTrue(np.allclose(data['x'], [0.0, 1.0, 2.0, 3.0]))
+
+        ht = hl.utils.range_table(10)
+        calls = count_aggregations(ht)
+        p = hl.plot.cumulative_histogram(hl.float64(ht.idx), bins=10, normalize=False)
+        self.assertEqual(list(p.renderers[0].data_source.data['y']), list(range(1, 11)))
+        hl.plot.cumulative_histogram(hl.float64(ht.idx), bins=5)
+        # the range is computed once; each histogram runs its own pass
+        self.assertEqual(len(calls), 3)
+
+    def test_histogram2d_reuses_range(self):
+        ht = hl.utils.range_table(100)
+        ht = ht.annotate(x=hl.float64(ht.idx), y=hl.float64(ht.idx % 10))
+        calls = count_aggregations(ht)
+        hl.plot.histogram2d(ht.x, ht.y, bins=10)
+        self.assertEqual(len(calls), 2)
+        hl.plot.histogram2d(ht.x, ht.y, bins=5)
+        self.assertEqual(len(calls), 3)
+
+    def test_joint_plot_reuses_marginals(self):
+        ht = hl.utils.range_table(100)
+        ht = ht.annotate(x=hl.float64(ht.idx), y=hl.float64(ht.idx % 10),
+                         label=hl.cond(ht.idx % 2 == 0, 'even', 'odd'))
+        calls = count_aggregations(ht)
+        hl.plot.joint_plot(ht.x, ht.y, label=ht.label, collect_all=True)
+        hl.plot.joint_plot(ht.x, ht.y, label=ht.label, collect_all=True)
+        # the second plot only collects the points
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(ht._plot_cache), 1)
+        for cached in ht._plot_cache.values():
+            self.assertNotIn('points', cached)
+            self.assertEqual(set(cached), {'all', 'by_field'})
+
+        hl.plot.scatter(ht.x, ht.y, collect_all=True)
+        self.assertEqual(len(ht._plot_cache), 1)
+
+    def test_plot_cache_bounded(self):
+        ht = hl.utils.range_table(10)
+        for i in range(_PLOT_CACHE_SIZE + 5):
+            self.assertEqual(_cached_aggregate(ht.idx, hl.agg.sum(ht.idx) + i), 45 + i)
+        self.assertEqual(len(ht._plot_cache), _PLOT_CACHE_SIZE)
@@ -1,3 +1,4 @@
+import os
 import unittest
 
 import hail as hl
@@ -17,3 +18,106 @@ class Tests(unittest.TestCase):
     def test_top_level_functions_are_do_not_error(self):
         hl.current_backend()
         hl.debug_info()
+
+    def test_profile(self):
+        slow_query_dir = hl.utils.new_local_temp_dir()
+        t = hl.utils.range_table(10)
+        with hl.profile() as outer:
+            with hl.profile(slow_query_seconds=0, slow_query_dir=slow_query_dir) as p:
+                self.assertEqual(t.count(), 10)
+                self.assertEqual(t.aggregate(hl.agg.sum(t.idx)), 45)
+            t.collect()
+
+        df = p.to_pandas()
+        self.assertEqual(list(df['action']), ['count', 'aggregate'])
+        self.assertTrue((df['ir_chars'] > 0).all())
+        self.assertTrue((df['result_bytes'] > 0).all())
+        self.assertTrue((df['total_seconds'] >= df['decode_seconds']).all())
+        for path in df['ir_path']:
+            with open(path) as f:
+                self.assertTrue(f.read())
+
+        self.assertEqual(len(outer), 3)
+        self.assertIsNone(outer.queries[0]['ir_path'])
+
+    def test_result_cache(self):
+        path = hl.utils.new_temp_file(suffix='ht')
+        hl.utils.range_table(10).write(path)
+        directory = hl.utils.new_temp_file()
+        cache = hl.backend.enable_result_cache(directory=directory)
+        try:
+            t = hl.read_table(path)
+            self.assertEqual(t.aggregate(hl.agg.sum(t.idx)), 45)
+            t = hl.read_table(path)
+            self.assertEqual(t.aggregate(hl.agg.sum(t.idx)), 45)
+            self.assertEqual(cache.stats()['memory_hits'], 1)
+
+            # random functions are not cached
+            t.aggregate(hl.agg.sum(hl.rand_unif(0, 1)))
+            self.assertEqual(cache.stats()['uncacheable'], 1)
+
+            # a new session reads the on-disk tier
+            cache = hl.backend.enable_result_cache(directory=directory)
+            self.assertEqual(t.aggregate(hl.agg.sum(t.idx)), 45)
+            self.assertEqual(cache.stats()['disk_hits'], 1)
+
+            # rewriting the input invalidates its results
+            hl.utils.range_table(5).write(path, overwrite=True)
+            t = hl.read_table(path)
+            self.assertEqual(t.aggregate(hl.agg.sum(t.idx)), 10)
+            self.assertEqual(cache.stats()['misses'], 1)
+            self.assertEqual(cache.stats()['hit_rate'], 0.5)
+        finally:
+            hl.backend.disable_result_cache()
+
+    def test_result_cache_imported_text(self):
+        directory = hl.utils.new_local_temp_dir()
+        tsv = os.path.join(directory, 'pheno.tsv')
+        with open(tsv, 'w') as f:
+            f.write('x\n1\n2\n')
+        cache = hl.backend.enable_result_cache()
+        try:
+            t = hl.import_table(tsv, types={'x': hl.tint32})
+            self.assertEqual(t.aggregate(hl.agg.sum(t.x)), 3)
+            self.assertEqual(cache.stats()['misses'], 1)
+
+            # editing the file invalidates its results
+            with open(tsv, 'w') as f:
+                f.write('x\n1\n2\n30\n')
+            t = hl.import_table(tsv, types={'x': hl.tint32})
+            self.assertEqual(t.aggregate(hl.agg.sum(t.x)), 33)
+            self.assertEqual(cache.stats()['misses'], 2)
+        finally:
+            hl.backend.disable_result_cache()
+
+    def test_result_cache_inputs(self):
+        from hail.backend.cache import _input_paths, _Uncacheable
+        from hail.ir import TableCount, TableRead, TextTableReader, TableReader
+
+        reader = TextTableReader(['/data/pheno.tsv'], None, {}, None, '\t', 'NA', False, False,
+                                 None, False, False, None, None, False)
+        self.assertEqual(_input_paths(TableCount(TableRead(reader))), ['/data/pheno.tsv'])
+
+        class UnknownReader(TableReader):
+            def render(self):
+                return ''
+
+            def __eq__(self, other):
+                return self is other
+
+        with self.assertRaises(_Uncacheable):
+            _input_paths(TableCount(TableRead(UnknownReader())))
+
+    def test_result_cache_clear(self):
+        directory = hl.utils.new_local_temp_dir()
+        other = os.path.join(directory, 'notes.json')
+        with open(other, 'w') as f:
+            f.write('{}')
+        cache = hl.backend.enable_result_cache(directory=directory)
+        try:
+            cache.put('0' * 64, '1')
+            self.assertEqual(len(os.listdir(directory)), 2)
+            cache.clear()
+            self.assertEqual(os.listdir(directory), ['notes.json'])
+        finally:
+            hl.backend.disable_result_cache()
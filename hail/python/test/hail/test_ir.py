@@ -1,3 +1,4 @@
+import os
 import unittest
 import hail as hl
 import hail.ir as ir
@@ -209,6 +210,28 @@ class TableIRTests(unittest.TestCase):
             Env.hail().expr.ir.IRParser.parse_table_ir(str(x))
 
 
+    def test_native_type_matches_backend(self):
+        from hail.ir.native_schema import native_type, clear_native_types
+        clear_native_types()
+        for version in ['1.0.0', '1.1.0']:
+            tables = resource(f'backward_compatability/{version}/table')
+            for name in os.listdir(tables):
+                path = os.path.join(tables, name)
+                tir = ir.TableRead(ir.TableNativeReader(path, None, False), False)
+                self.assertEqual(native_type(path, 'table', lambda: None), Env.backend().table_type(tir))
+            matrix_tables = resource(f'backward_compatability/{version}/matrix_table')
+            for name in os.listdir(matrix_tables):
+                path = os.path.join(matrix_tables, name)
+                mir = ir.MatrixRead(ir.MatrixNativeReader(path, None, False), False, False)
+                self.assertEqual(native_type(path, 'matrix', lambda: None), Env.backend().matrix_type(mir))
+
+        path = new_temp_file(suffix='ht')
+        hl.utils.range_table(10).write(path)
+        self.assertEqual(hl.read_table(path).row.dtype, hl.tstruct(idx=hl.tint32))
+        hl.utils.range_table(10).annotate(x=5).write(path, overwrite=True)
+        self.assertEqual(hl.read_table(path).row.dtype, hl.tstruct(idx=hl.tint32, x=hl.tint32))
+
+
 class MatrixIRTests(unittest.TestCase):
     def matrix_irs(self):
         hl.index_bgen(resource('example.8bits.bgen'),
@@ -360,6 +383,89 @@ class ValueTests(unittest.TestCase):
             new_globals = hl.eval(hl.Table(map_globals_ir).index_globals())
             self.assertEqual(new_globals, hl.Struct(foo=v))
 
+    def test_large_literal_rendered_by_handle(self):
+        s = set(range(ir.Literal.broadcast_threshold))
+        lit = ir.Literal(hl.tset(hl.tint32), s)
+        contains = ir.Apply('contains', hl.tbool, lit, ir.I32(5))
+        r = CSERenderer(stop_at_jir=True)
+        assert r(contains) == '(Apply contains Boolean (JavaIR m0) (I32 5))'
+        assert len(r.jirs) == 1
+        jir = lit._jir
+        r(contains)
+        assert lit._jir is jir
+
+        s_expr = hl.literal(s)
+        for i in [5, -1]:
+            self.assertEqual(hl.eval(s_expr.contains(i)), i in s)
+
+
+class InterpretTests(unittest.TestCase):
+    def exprs(self):
+        a = hl.literal([1, 2, None, -4], hl.tarray(hl.tint32))
+        s = hl.literal(hl.Struct(x=5, y='foo', z=[0.5, None]),
+                       hl.tstruct(x=hl.tint32, y=hl.tstr, z=hl.tarray(hl.tfloat64)))
+        return [
+            hl.int32(5) + 7,
+            hl.int32(2147483647) + 1,
+            hl.int64(-9223372036854775808) - 1,
+            -hl.int32(-2147483648),
+            hl.int32(-7) // 2,
+            hl.float64(-7.5) // 2,
+            hl.float64(1) // 0.1,
+            hl.float64(7) / 2,
+            hl.float64(1e308) * 10,
+            hl.null(hl.tint32) * 3,
+            hl.int64(3) * hl.int32(2),
+            hl.float64(3) + hl.int32(2),
+            hl.int32(3) < 4,
+            hl.null(hl.tint32) == 4,
+            hl.literal('abc') < 'abd',
+            hl.literal('é') < 'e',
+            ~hl.literal(True),
+            hl.is_missing(hl.null(hl.tstr)),
+            hl.cond(hl.literal(True), 1, 2),
+            hl.cond(hl.null(hl.tbool), 1, 2),
+            hl.coalesce(hl.null(hl.tint32), 3),
+            hl.range(0, 10, 3),
+            hl.range(10, 0, -3),
+            hl.range(0, 10).map(lambda x: x * 2).filter(lambda x: x > 5),
+            a.map(lambda x: hl.or_else(x, 0) * 2),
+            a.filter(lambda x: x > 0),
+            a.length(),
+            a[1],
+            hl.bind(lambda x: x + x, hl.int32(21)),
+            hl.struct(a=1, b=hl.struct(c='x'), d=hl.null(hl.tarray(hl.tint32))),
+            s.annotate(w=s.x + 1, x='replaced'),
+            s.select('z', 'x'),
+            s.z[0],
+            hl.tuple([1, 'a', hl.null(hl.tfloat64)])[1],
+            hl.literal({'a': 1, 'b': 2}),
+            hl.literal({1, 2, 3}),
+        ]
+
+    def test_interpret_matches_backend(self):
+        from hail.ir.interpret import interpret, CannotInterpret
+        n_interpreted = 0
+        for e in self.exprs():
+            expected = Env.backend().execute(e._ir)
+            try:
+                actual = interpret(e._ir)
+                n_interpreted += 1
+            except CannotInterpret:
+                continue
+            self.assertEqual(actual, expected, str(e._ir))
+        assert n_interpreted > 25
+
+    def test_interpret_unsupported(self):
+        from hail.ir.interpret import interpret, CannotInterpret
+        for e in [hl.str(5),
+                  hl.int32(5) / 2,
+                  hl.range(0, 100_000),
+                  hl.int32(1) // 0,
+                  hl.utils.range_table(10).index_globals()]:
+            with self.assertRaises(CannotInterpret):
+                interpret(e._ir)
+
 
 class CSETests(unittest.TestCase):
     def test_cse(self):
@@ -435,3 +541,33 @@ class CSETests(unittest.TestCase):
                         ' (ApplyBinaryPrimOp `+` (Ref __cse_3) (Ref __cse_3))))'
                     ' ((ApplyBinaryPrimOp `+` (Ref __cse_4) (Ref __cse_4)))))))')
         assert expected == CSERenderer()(top)
+
+    def test_interned_cse(self):
+        row = ir.Ref('row')
+
+        def build():
+            x = ir.GetField(row, 'idx')
+            seeded = ir.ApplySeeded('rand_unif', 0, hl.tfloat64, ir.F64(0), ir.F64(1))
+            return ir.MakeTuple([ir.ApplyBinaryPrimOp('+', x, ir.I32(1)), seeded])
+
+        ir.enable_interning()
+        try:
+            assert ir.interning_enabled()
+            first = build()
+            second = build()
+            # references to other bindings, of possibly other types, are not shared
+            other = ir.GetField(ir.Ref('row'), 'idx')
+        finally:
+            ir.disable_interning()
+        assert not ir.interning_enabled()
+        assert first.elements[0] is second.elements[0]
+        assert first.elements[1] is not second.elements[1]
+        assert first is not second
+        assert other is not first.elements[0].l
+        assert ir.ArrayLen(ir.Ref('a')) is not ir.ArrayLen(ir.Ref('a'))
+
+        top = ir.MakeTuple([first.elements[0], second.elements[0]])
+        expected = (
+            '(Let __cse_1 (ApplyBinaryPrimOp `+` (GetField idx (Ref row)) (I32 1))'
+            ' (MakeTuple (0 1) (Ref __cse_1) (Ref __cse_1)))')
+        assert expected == CSERenderer()(top, {'row'})
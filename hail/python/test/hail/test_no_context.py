@@ -6,3 +6,13 @@ from .helpers import *
 class Tests(unittest.TestCase):
     def test_get_reference_before_init(self):
         hl.get_reference('GRCh37') # Should be no error
+
+    def test_import_defers_heavy_submodules(self):
+        import subprocess
+        import sys
+        subprocess.run([sys.executable, '-c',
+                        'import sys; import hail as hl; '
+                        'assert "bokeh" not in sys.modules, "bokeh"; '
+                        'assert "hail.experimental" not in sys.modules, "hail.experimental"; '
+                        'hl.plot.histogram; hl.experimental.ld_score'],
+                       check=True)
@@ -1,9 +1,15 @@
+import gc
+import os
+import types
 import unittest
+from unittest import mock
 
 import hail as hl
 from hail.utils import *
 from hail.utils.misc import escape_str, escape_id
 from hail.utils.java import Env
+from hail.fs import hadoop_fs
+from hail.fs.hadoop_fs import HadoopFS, HadoopReader, HadoopWriter
 from hail.utils.linkedlist import LinkedList
 from ..helpers import *
 
@@ -56,6 +62,24 @@ class Tests(unittest.TestCase):
         with self.assertRaises(Exception):
             hadoop_open('/tmp/randomBytesOut', 'xb')
 
+    def test_hadoop_open_large(self):
+        # long enough for HadoopReader's chunks to grow to MAX_CHUNK_SIZE
+        data = os.urandom(3 * hadoop_fs.MAX_CHUNK_SIZE + 12345)
+        path = new_local_temp_file('large')
+        with hadoop_open(path, 'wb') as f:
+            f.write(data)
+        for buffer_size in [100, 8192, hadoop_fs.MIN_CHUNK_SIZE + 1, hadoop_fs.MAX_CHUNK_SIZE + 1]:
+            with hadoop_open(path, 'rb', buffer_size=buffer_size) as f:
+                self.assertEqual(f.read(), data)
+        with hadoop_open(path, 'rb') as f:
+            pieces = []
+            while True:
+                piece = f.read(100003)
+                if not piece:
+                    break
+                pieces.append(piece)
+        self.assertEqual(b''.join(pieces), data)
+
     def test_hadoop_exists(self):
         self.assertTrue(hl.hadoop_exists(resource('ls_test')))
         self.assertFalse(hl.hadoop_exists(resource('doesnt.exist')))
@@ -130,6 +154,28 @@ class Tests(unittest.TestCase):
         self.assertTrue('owner' in ls2_dict['f_50'])
         self.assertTrue('modification_time' in ls2_dict['f_50'])
 
+    def test_fs_bulk_operations(self):
+        fs = Env.fs()
+        src = new_local_temp_dir()
+        dest = new_local_temp_dir()
+        os.makedirs(os.path.join(src, 'a', 'b'))
+        names = [f'f{i}.txt' for i in range(20)] + [os.path.join('a', 'g.txt'), os.path.join('a', 'b', 'h.bin')]
+        for name in names:
+            with open(os.path.join(src, name), 'w') as f:
+                f.write(name)
+
+        files = fs.ls_recursive(local_path_uri(src))
+        self.assertEqual(len(files), len(names))
+        self.assertEqual(len(fs.ls_recursive(local_path_uri(src), pattern='*.txt')), len(names) - 1)
+
+        fs.copy_many([(local_path_uri(os.path.join(src, name)), local_path_uri(os.path.join(dest, f'copy-{i}')))
+                      for i, name in enumerate(names)], parallelism=4)
+        dest_paths = [local_path_uri(os.path.join(dest, f'copy-{i}')) for i in range(len(names))]
+        self.assertEqual([s['size_bytes'] for s in fs.stat_many(dest_paths)], [len(name) for name in names])
+
+        fs.rm_many(dest_paths)
+        self.assertEqual(os.listdir(dest), [])
+
     def test_linked_list(self):
         ll = LinkedList(int)
         self.assertEqual(list(ll), [])
@@ -189,6 +235,36 @@ class Tests(unittest.TestCase):
         self.assertFalse(interval1.contains(22))
         self.assertTrue(interval1.overlaps(interval2))
 
+    def test_interval_tree(self):
+        intervals = [Interval(10, 12), Interval(1, 5), Interval(3, 8),
+                     Interval(8, 9, includes_start=False, includes_end=True)]
+        tree = hl.utils.IntervalTree(intervals)
+
+        self.assertEqual(len(tree), 4)
+        self.assertEqual(tree.contains_each([0, 1, 5, 8, 9, 10, 12]),
+                         [False, True, True, False, True, True, False])
+        self.assertEqual(tree.query(4), [Interval(1, 5), Interval(3, 8)])
+        self.assertEqual(tree.query(0), [])
+        self.assertTrue(tree.overlaps(Interval(9, 10, includes_end=True)))
+        self.assertFalse(tree.overlaps(Interval(9, 10, includes_start=False)))
+        self.assertEqual(tree.query_overlaps(Interval(4, 11)),
+                         [Interval(1, 5), Interval(3, 8), Interval(8, 9, False, True), Interval(10, 12)])
+        self.assertEqual(tree.merged(),
+                         [Interval(1, 8), Interval(8, 9, False, True), Interval(10, 12)])
+
+        locus_tree = hl.utils.IntervalTree([hl.Interval(hl.Locus('20', 10), hl.Locus('20', 20)),
+                                            hl.Interval(hl.Locus('1', 10), hl.Locus('2', 20))])
+        self.assertTrue(locus_tree.contains(hl.Locus('1', 1000)))
+        self.assertFalse(locus_tree.contains(hl.Locus('3', 15)))
+        self.assertTrue(locus_tree.contains(hl.Locus('20', 10)))
+
+        # local comparisons agree with the backend
+        for i in intervals:
+            for p in range(14):
+                self.assertEqual(i.contains(p), hl.eval(hl.literal(i).contains(p)))
+            for j in intervals:
+                self.assertEqual(i.overlaps(j), hl.eval(hl.literal(i).overlaps(j)))
+
     def test_range_matrix_table_n_lt_partitions(self):
         hl.utils.range_matrix_table(1, 1)._force_count_rows()
 
@@ -214,3 +290,239 @@ class Tests(unittest.TestCase):
         self.assertEqual(escape_id("cat"), "cat")
         self.assertEqual(escape_id("abc123"), "abc123")
         self.assertEqual(escape_id("123abc"), "`123abc`")
+
+    def test_temporary_file_manager(self):
+        class Dependent:
+            pass
+
+        manager = TemporaryFileManager()
+
+        with manager.scope():
+            unused = manager.register(new_local_temp_dir(), local=True)
+            used = manager.register(new_local_temp_dir(), local=True)
+            with open(os.path.join(used, 'data'), 'w') as f:
+                f.write('x' * 10)
+            dependent = Dependent()
+            manager.attach(used, dependent)
+        self.assertFalse(os.path.exists(unused))
+        self.assertTrue(os.path.exists(used))
+
+        usage = manager.usage()
+        self.assertEqual(usage['total_bytes'], 10)
+        self.assertEqual([f['n_dependents'] for f in usage['files']], [1])
+
+        manager.pin(used)
+        del dependent
+        gc.collect()
+        self.assertEqual(manager.usage()['files'][0]['n_dependents'], 0)
+        self.assertTrue(os.path.exists(used))
+        manager.unpin(used)
+        self.assertFalse(os.path.exists(used))
+        self.assertEqual(manager.usage()['files'], [])
+
+        # only managed files that nothing depends on are evicted
+        manager.quota = 5
+        unmanaged = manager.register(new_local_temp_dir(), local=True)
+        pinned = manager.manage(manager.register(new_local_temp_dir(), local=True))
+        in_use = manager.manage(manager.register(new_local_temp_dir(), local=True))
+        evicted = manager.manage(manager.register(new_local_temp_dir(), local=True))
+        for path in (unmanaged, pinned, in_use, evicted):
+            with open(os.path.join(path, 'data'), 'w') as f:
+                f.write('x' * 10)
+        manager.pin(pinned)
+        dependent = Dependent()
+        manager.attach(in_use, dependent)
+        manager.enforce_quota()
+        self.assertTrue(os.path.exists(unmanaged))
+        self.assertTrue(os.path.exists(pinned))
+        self.assertTrue(os.path.exists(in_use))
+        self.assertFalse(os.path.exists(evicted))
+        manager.quota = None
+        manager.cleanup()
+        for path in (unmanaged, pinned, in_use):
+            self.assertFalse(os.path.exists(path))
+
+        # files outside a scope are kept after their dependents are
+        # collected, unless managed
+        path = manager.register(new_local_temp_dir(), local=True)
+        dependent = Dependent()
+        manager.attach(path, dependent)
+        del dependent
+        gc.collect()
+        self.assertEqual(manager.usage()['files'][0]['n_dependents'], 0)
+        self.assertTrue(os.path.exists(path))
+        dependent = Dependent()
+        manager.attach(path, dependent)
+        self.assertEqual(manager.manage(path), path)
+        del dependent
+        gc.collect()
+        manager.usage()
+        self.assertFalse(os.path.exists(path))
+
+        # paths keep their scheme, but are tracked with or without it
+        uri = local_path_uri(new_local_temp_dir())
+        self.assertEqual(manager.register(uri, local=True), uri)
+        dependent = Dependent()
+        manager.attach(uri[len('file://'):], dependent)
+        self.assertEqual(manager.usage()['files'][0]['path'], uri)
+        self.assertEqual(manager.usage()['files'][0]['n_dependents'], 1)
+        manager.cleanup()
+        self.assertFalse(os.path.exists(uri[len('file://'):]))
+
+        # a file in a temporary directory keeps the directory
+        directory = manager.manage(manager.register(new_local_temp_dir(), local=True))
+        dependent = Dependent()
+        manager.attach(local_path_uri(os.path.join(directory, 'data')), dependent)
+        self.assertEqual(manager.usage()['files'][0]['n_dependents'], 1)
+
+        # objects derived from a dependent inherit its files
+        class Node:
+            children = ()
+        node = Node()
+        manager.attach(directory, node)
+        derived = Dependent()
+        manager.inherit(derived, node)
+        # as do objects derived from other dependents, such as data frames
+        derived_again = Dependent()
+        manager.inherit(derived_again, derived)
+        del dependent, node
+        gc.collect()
+        self.assertTrue(os.path.exists(directory))
+        del derived
+        gc.collect()
+        manager.usage()
+        self.assertTrue(os.path.exists(directory))
+        del derived_again
+        gc.collect()
+        manager.usage()
+        self.assertFalse(os.path.exists(directory))
+
+
+class FakeJavaError(Exception):
+    pass
+
+
+class FakeJavaFile:
+    """Stands in for the JVM file handles HadoopReader and HadoopWriter
+    wrap, failing on the call numbered `fail_at` (counting from 0)."""
+
+    def __init__(self, data=b'', fail_at=None):
+        self.data = data
+        self.fail_at = fail_at
+        self.pos = 0
+        self.read_sizes = []
+        self.written = []
+        self.closed = False
+
+    def _maybe_fail(self, n_calls):
+        if self.fail_at is not None and n_calls > self.fail_at:
+            raise FakeJavaError(f'failed on call {self.fail_at}')
+
+    def read(self, n):
+        self.read_sizes.append(n)
+        self._maybe_fail(len(self.read_sizes))
+        chunk = self.data[self.pos:self.pos + n]
+        self.pos += len(chunk)
+        return chunk
+
+    def write(self, b):
+        self.written.append(bytes(b))
+        self._maybe_fail(len(self.written))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class HadoopReaderWriterTests(unittest.TestCase):
+    def fake_jvm(self, jfile):
+        jutils = types.SimpleNamespace(readFile=lambda path, jhc, buffer_size: jfile,
+                                       writeFile=lambda path, jhc, exclusive: jfile)
+        hc = types.SimpleNamespace(_jhc=None)
+        return mock.patch.multiple(Env, jutils=lambda: jutils, hc=lambda: hc)
+
+    def test_read_chunk_growth(self):
+        min_size, max_size = hadoop_fs.MIN_CHUNK_SIZE, hadoop_fs.MAX_CHUNK_SIZE
+        growth = []
+        size = min_size
+        while size < max_size:
+            growth.append(size)
+            size *= 2
+        data = bytes(range(256)) * ((sum(growth) + 2 * max_size) // 256) + b'tail'
+        jfile = FakeJavaFile(data)
+        with self.fake_jvm(jfile):
+            with HadoopFS().open('/fake', 'rb') as f:
+                pieces = []
+                while True:
+                    piece = f.read(100003)
+                    if not piece:
+                        break
+                    pieces.append(piece)
+        self.assertEqual(b''.join(pieces), data)
+        # 64 KiB, doubling to 4 MiB, then 4 MiB until an empty read
+        self.assertEqual(jfile.read_sizes, growth + [max_size] * 4)
+        self.assertTrue(jfile.closed)
+
+        # a buffer size larger than the smallest chunk is the first chunk size
+        jfile = FakeJavaFile(data)
+        with self.fake_jvm(jfile):
+            with HadoopFS().open('/fake', 'rb', buffer_size=3 * min_size) as f:
+                self.assertEqual(f.read(), data)
+        self.assertEqual(jfile.read_sizes[:3], [3 * min_size, 6 * min_size, 12 * min_size])
+
+    def test_read_error(self):
+        jfile = FakeJavaFile(bytes(1024 * 1024), fail_at=2)
+        with self.fake_jvm(jfile):
+            reader = HadoopReader('/fake', 8192)
+            b = bytearray(hadoop_fs.MIN_CHUNK_SIZE)
+            self.assertEqual(reader.readinto(b), len(b))
+            self.assertEqual(reader.readinto(bytearray(2 * len(b))), 2 * len(b))
+            # raised from the read-ahead thread, and again on later reads
+            with self.assertRaises(FakeJavaError):
+                reader.readinto(b)
+            with self.assertRaises(FakeJavaError):
+                reader.readinto(b)
+            reader.close()
+        self.assertTrue(jfile.closed)
+
+    def test_write_error(self):
+        chunk = bytes(hadoop_fs.WRITE_CHUNK_SIZE)
+
+        jfile = FakeJavaFile(fail_at=0)
+        with self.fake_jvm(jfile):
+            writer = HadoopWriter('/fake')
+            writer.write(chunk)
+            # raised from the write-behind thread, and by every later call
+            with self.assertRaises(FakeJavaError):
+                writer.flush()
+            with self.assertRaises(FakeJavaError):
+                writer.write(chunk)
+            with self.assertRaises(FakeJavaError):
+                writer.flush()
+            with self.assertRaises(FakeJavaError):
+                writer.close()
+        self.assertTrue(writer.closed)
+        self.assertTrue(jfile.closed)
+        self.assertEqual(len(jfile.written), 1)
+
+        # chunks queued behind a failed one are dropped, and close raises
+        jfile = FakeJavaFile(fail_at=0)
+        with self.fake_jvm(jfile):
+            writer = HadoopWriter('/fake')
+            writer.write(chunk)
+            writer.write(chunk)
+            with self.assertRaises(FakeJavaError):
+                writer.close()
+        self.assertEqual(len(jfile.written), 1)
+
+        # through hadoop_open's buffered writer
+        jfile = FakeJavaFile(fail_at=1)
+        with self.fake_jvm(jfile):
+            with self.assertRaises(FakeJavaError):
+                with HadoopFS().open('/fake', 'wb') as f:
+                    for _ in range(3):
+                        f.write(chunk)
+        self.assertEqual(len(jfile.written), 2)
+        self.assertTrue(jfile.closed)